@@ -1,40 +1,44 @@
 import pandas as pd
-import json
 import date_cmp as dc
+import serialize as sz
 
 
 
-def csv_to_json ( filep = '../data/apttest.csv')#일 위치 수정 필요
+def csv_to_json(filep='../data/apttest.csv', compact=False):  # 파일 위치 수정 필요
+    """
+    compact=True이면 공백 없는 JSON과 .gz / .br 압축본을 함께 저장합니다.
+    (기본은 이전과 같은 4칸 들여쓰기)
+    (날짜, NumPy 값은 serialize가 직접 변환하므로 default=str 불필요)
+    """
 
+    # 액샐 읽기
+    df = pd.read_csv(filep)
 
-# 액샐 읽기         
-df = pd.read_csv(filep)
+    # 날짜 형식 정렬
+    df = dc.clean_date_column(df, '거래일')
 
-# 날짜 형식 정렬
+    # 계산된 df
+    day_result = dc.day_stat(df , '거래일', '거래금액')
+    week_result = dc.week_stat(df , '거래일', '거래금액')
+    month_result = dc.month_stat(df , '거래일', '거래금액')
+    year_result = dc.year_stat(df , '거래일', '거래금액')
 
 
-# 계산된 df
-day_result = dc.day_stat(df , '거래일', '거래금액')
-week_result = dc.week_stat(df , '거래일', '거래금액')
-month_result = dc.month_stat(df , '거래일', '거래금액')
-year_result = dc.year_stat(df , '거래일', '거래금액')
+    output = {
+        "일간": day_result,
+        "주간": week_result,
+        "월간": month_result,
+        "년간": year_result
+    }
 
 
-output = {
-    "일간": day_result.to_dict(orient='records'),
-    "주간": week_result.to_dict(orient='records'),
-    "월간": month_result.to_dict(orient='records'),
-    "년간": year_result.to_dict(orient='records')
-}
 
+    sz.dump(output, 'result.json', indent=0 if compact else 4, compress=compact)
 
 
-with open('result.json', 'w', encoding='utf-8') as f:
-    json.dump(output, f, ensure_ascii=False, indent=4)
-
-
-
-print(" result.json 생성 완료")
 
+    print(" result.json 생성 완료")
 
 
+if __name__ == '__main__':
+    csv_to_json()
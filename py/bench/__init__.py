@@ -0,0 +1,10 @@
+"""
+성능 측정(벤치마크) 패키지
+
+사용 예시:
+    python -m py.bench --sizes 100k,1m --out bench.json
+"""
+
+from .generator import generate_regional, generate_transactions
+
+__all__ = ['generate_regional', 'generate_transactions']
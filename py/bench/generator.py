@@ -0,0 +1,169 @@
+"""벤치마크용 합성 거래 데이터 생성기"""
+from pathlib import Path
+from typing import List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+SIDOS = [
+    '서울특별시', '부산광역시', '대구광역시', '인천광역시', '광주광역시',
+    '대전광역시', '울산광역시', '세종특별자치시', '경기도', '강원도',
+    '충청북도', '충청남도', '전라북도', '전라남도', '경상북도',
+    '경상남도', '제주특별자치도'
+]
+
+# 시도별 거래 비중 (수도권 편중)
+_SIDO_WEIGHTS = np.array(
+    [14, 6, 5, 6, 3, 3, 2, 1, 27, 3, 4, 5, 4, 4, 5, 6, 2], dtype='float64'
+)
+_SIDO_WEIGHTS /= _SIDO_WEIGHTS.sum()
+
+# 거래일 문자열 형식과 비중 (대부분 YYYY-MM-DD, 일부 다른 형식과 잡음)
+_DATE_FORMATS = [
+    ('%Y-%m-%d', 0.85),
+    ('%Y.%m.%d', 0.05),
+    ('%Y%m%d', 0.04),
+    ('%Y-%m-%d 0:00', 0.05),
+    ('%Y년 %m월 %d일', 0.01),
+]
+
+
+def parse_size(size: Union[int, str]) -> int:
+    """'100k', '1m', '10M' 같은 행 수 표기를 정수로 바꿉니다."""
+    if isinstance(size, int):
+        return size
+    text = str(size).strip().lower().replace('_', '')
+    units = {'k': 1_000, 'm': 1_000_000}
+    if text and text[-1] in units:
+        return int(float(text[:-1]) * units[text[-1]])
+    return int(text)
+
+
+def _transaction_chunk(rng, rows, start, n_days):
+    """거래 데이터 한 청크를 만듭니다."""
+    days = rng.integers(0, n_days, rows)
+    dates = start + days.astype('timedelta64[D]')
+
+    # 형식별로 고유 날짜만 문자열로 만든 뒤 인덱싱
+    probs = np.array([p for _, p in _DATE_FORMATS])
+    fmt_idx = rng.choice(len(_DATE_FORMATS), rows, p=probs / probs.sum())
+    all_days = pd.DatetimeIndex(start + np.arange(n_days).astype('timedelta64[D]'))
+    date_text = np.empty(rows, dtype=object)
+    for i, (fmt, _) in enumerate(_DATE_FORMATS):
+        sel = fmt_idx == i
+        if sel.any():
+            date_text[sel] = np.asarray(all_days.strftime(fmt), dtype=object)[days[sel]]
+
+    sido_idx = rng.choice(len(SIDOS), rows, p=_SIDO_WEIGHTS)
+    area = np.round(rng.gamma(9.0, 9.0, rows) + 15.0, 2)
+    # 거래금액(만원): 면적과 지역에 비례하는 로그정규 분포
+    price = np.round(
+        area * rng.lognormal(5.7, 0.45, rows) * (1.6 - sido_idx / 20.0)
+    ).clip(500, 900_000).astype('int64')
+
+    return pd.DataFrame({
+        '거래일': date_text,
+        '거래금액': [f"{p:,}" for p in price.tolist()],
+        '층': rng.integers(-1, 50, rows),
+        '전용면적': area,
+        '법정동': np.array(SIDOS, dtype=object)[sido_idx],
+    })
+
+
+def generate_transactions(
+    path: Union[str, Path],
+    rows: Union[int, str] = 100_000,
+    start: str = '2005-01-01',
+    end: str = '2024-12-31',
+    seed: int = 0,
+    chunk_rows: int = 1_000_000
+) -> Path:
+    """
+    실거래가 형태의 합성 거래 CSV를 만듭니다.
+    (거래일, 천 단위 쉼표가 포함된 거래금액, 층, 전용면적, 법정동)
+
+    Args:
+        path: 저장할 CSV 경로
+        rows: 행 수 (정수 또는 '100k', '1m', '10m' 표기)
+        start, end: 거래일 범위 (YYYY-MM-DD)
+        seed: 난수 시드
+        chunk_rows: 한 번에 만들어 기록할 행 수 (메모리 사용량 제한)
+
+    Returns:
+        Path: 생성된 CSV 경로
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    rows = parse_size(rows)
+    rng = np.random.default_rng(seed)
+    start_day = np.datetime64(start, 'D')
+    n_days = int((np.datetime64(end, 'D') - start_day).astype(int)) + 1
+
+    written = 0
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        while True:
+            n = min(chunk_rows, rows - written)
+            chunk = _transaction_chunk(rng, n, start_day, n_days)
+            chunk.to_csv(f, index=False, header=(written == 0))
+            written += n
+            if written >= rows:
+                break
+    return path
+
+
+def generate_regional(
+    data_dir: Union[str, Path],
+    years: Optional[List[int]] = None,
+    seed: int = 0
+) -> List[Path]:
+    """
+    KOSIS 형식의 연도별 시도 거래량 CSV와 거래 호수·면적 CSV(2행 헤더)를 만듭니다.
+    파일명은 원본과 같은 'YYYY년 광역 지자체별 아파트 거래량.csv',
+    'YYYY년 지자체 거래 호수 및 면적 통계자료.csv' 형식입니다.
+
+    Args:
+        data_dir: 저장할 디렉토리
+        years: 생성할 연도 목록 (기본: 2005~2024)
+        seed: 난수 시드
+
+    Returns:
+        list[Path]: 생성된 파일 경로 목록
+    """
+    data_dir = Path(data_dir)
+    data_dir.mkdir(parents=True, exist_ok=True)
+    if years is None:
+        years = list(range(2005, 2025))
+    rng = np.random.default_rng(seed)
+    months = [f"{m}월" for m in range(1, 13)]
+    paths = []
+
+    for year in years:
+        volume = rng.integers(300, 30_000, (len(SIDOS), 12))
+        area = np.round(volume * rng.uniform(0.06, 0.09, volume.shape)).astype(int)
+
+        df_v = pd.DataFrame(volume, columns=months)
+        df_v.insert(0, '광역지방자치단체', SIDOS)
+        total = pd.DataFrame([['전국'] + volume.sum(axis=0).tolist()],
+                             columns=df_v.columns)
+        df_v = pd.concat([total, df_v], ignore_index=True)
+        v_path = data_dir / f"{year}년 광역 지자체별 아파트 거래량.csv"
+        df_v.to_csv(v_path, index=False, encoding='utf-8-sig')
+
+        header1 = ['행정구역별(1)', '행정구역별(2)']
+        header2 = ['행정구역별(1)', '행정구역별(2)']
+        for m in months:
+            header1 += [m, m]
+            header2 += ['호수', '면적(천㎡)']
+        body = [['전국', '소계'] + np.column_stack(
+            [volume.sum(axis=0), area.sum(axis=0)]).ravel().tolist()]
+        for i, sido in enumerate(SIDOS):
+            pairs = np.column_stack([volume[i], area[i]]).ravel().tolist()
+            body.append([sido, '소계'] + pairs)
+            body.append([sido, '기타'] + [0] * len(pairs))
+        a_path = data_dir / f"{year}년 지자체 거래 호수 및 면적 통계자료.csv"
+        pd.DataFrame([header2] + body, columns=header1).to_csv(
+            a_path, index=False, encoding='utf-8-sig'
+        )
+        paths += [v_path, a_path]
+
+    return paths
@@ -0,0 +1,310 @@
+"""
+벤치마크 실행기
+
+각 시나리오는 별도 프로세스에서 실행되며(최대 메모리 사용량을 시나리오별로 측정),
+결과는 벽시계 시간, 최대 RSS, 초당 처리 행 수를 담은 JSON으로 저장됩니다.
+"""
+import argparse
+import json
+import multiprocessing
+import platform
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from .generator import SIDOS, generate_regional, generate_transactions, parse_size
+
+DEFAULT_SIZES = ['100k', '1m', '10m']
+REGIONAL_YEARS = list(range(2005, 2025))
+QUERY_COUNT = 1_000
+
+
+# --- 측정 보조 함수 ---
+
+def _peak_rss_mb() -> Optional[float]:
+    """현재 프로세스의 최대 RSS(MB), 측정 불가 환경이면 None"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 바이트 단위
+    divisor = 2**20 if sys.platform == 'darwin' else 2**10
+    return round(peak / divisor, 1)
+
+
+# --- 시나리오 정의 ---
+# setup(ctx) -> state 는 측정에서 제외, run(state) -> 처리한 행(또는 조회) 수
+
+def _read_transactions(ctx):
+    return pd.read_csv(ctx['transactions'])
+
+
+def _cleaned_transactions(ctx):
+    from .. import date_cmp as dc
+    df = dc.clean_date_column(_read_transactions(ctx), '거래일')
+    return dc.safe_numeric(df, '거래금액')
+
+
+def _stat_scenario(name):
+    def run(df):
+        from .. import date_cmp as dc
+        getattr(dc, name)(df, '거래일', '거래금액')
+        return len(df)
+    return _cleaned_transactions, run
+
+
+def _run_clean_dates(df):
+    from .. import date_cmp as dc
+    dc.clean_date_column(df, '거래일')
+    return len(df)
+
+
+def _run_rollup(df):
+    from .. import date_cmp as dc
+    dc.rollup_stats(df, '거래일', '거래금액')
+    return len(df)
+
+
+def _run_stream(ctx):
+    from .. import date_cmp as dc
+    dc.stream_stats(ctx['transactions'], '거래일', '거래금액')
+    return ctx['rows']
+
+
+def _setup_floor(ctx):
+    return pd.read_csv(ctx['transactions'], usecols=['층'])['층']
+
+
+def _run_floor(floors):
+    from .. import floor
+    floor.floor_home(floors)
+    return len(floors)
+
+
+def _regional_config(ctx, **kwargs):
+    from ..config.settings import AnalysisConfig
+    return AnalysisConfig(
+        data_dir=ctx['regional_dir'],
+        volume_filename='*년 광역 지자체별 아파트 거래량.csv',
+        area_filename='*년 지자체 거래 호수 및 면적 통계자료.csv',
+        use_disk_cache=False,
+        **kwargs
+    )
+
+
+def _setup_analyzer_cold(ctx):
+    return ctx
+
+
+def _run_analyzer_cold(ctx):
+    from ..core.analyzer import RealEstateAnalyzer
+    from ..core.loader import DataLoader
+    analyzer = RealEstateAnalyzer(DataLoader(_regional_config(ctx)))
+    analyzer.get_monthly_volume_and_area()
+    return len(REGIONAL_YEARS)
+
+
+def _random_queries(seed=0) -> List[Dict[str, Any]]:
+    rnd = random.Random(seed)
+    months = [f"{m}월" for m in range(1, 13)]
+    queries = []
+    for _ in range(QUERY_COUNT):
+        start_y = rnd.choice(REGIONAL_YEARS)
+        queries.append({
+            'sidos': rnd.sample(SIDOS, rnd.randint(1, 4)),
+            'start_y': start_y,
+            'end_y': start_y + rnd.randint(0, 5),
+            'start_m': rnd.choice([None] + months),
+        })
+    return queries
+
+
+def _analyzer_scenario(method, cache_size=0, distinct=QUERY_COUNT):
+    """같은 분석기로 QUERY_COUNT번 조회 (distinct개 조합을 반복)"""
+    def setup(ctx):
+        from ..core.analyzer import RealEstateAnalyzer
+        from ..core.loader import DataLoader
+        analyzer = RealEstateAnalyzer(
+            DataLoader(_regional_config(ctx)), cache_size=cache_size
+        )
+        analyzer.get_monthly_volume_and_area()  # 로딩/큐브 생성은 측정 제외
+        queries = _random_queries()[:distinct]
+        return analyzer, [queries[i % distinct] for i in range(QUERY_COUNT)]
+
+    def run(state):
+        analyzer, queries = state
+        fn = getattr(analyzer, method)
+        for q in queries:
+            if method == 'get_monthly_volume_and_area':
+                fn(**q)
+            else:
+                fn(q['sidos'], q['start_y'], q['end_y'])
+        return len(queries)
+
+    return setup, run
+
+
+SCENARIOS: Dict[str, Tuple[str, Callable, Callable]] = {
+    # 이름: (입력 종류, setup, run)
+    'clean_date_column': ('transactions', _read_transactions, _run_clean_dates),
+    'day_stat': ('transactions',) + _stat_scenario('day_stat'),
+    'week_stat': ('transactions',) + _stat_scenario('week_stat'),
+    'month_stat': ('transactions',) + _stat_scenario('month_stat'),
+    'year_stat': ('transactions',) + _stat_scenario('year_stat'),
+    'rollup_stats': ('transactions', _cleaned_transactions, _run_rollup),
+    'stream_stats': ('transactions', lambda ctx: ctx, _run_stream),
+    'floor_home': ('transactions', _setup_floor, _run_floor),
+    'analyzer_cold_load': ('regional', _setup_analyzer_cold, _run_analyzer_cold),
+    'analyzer_volume_and_area': ('regional',)
+        + _analyzer_scenario('get_monthly_volume_and_area'),
+    'analyzer_sido_volume': ('regional',)
+        + _analyzer_scenario('get_sido_monthly_volume'),
+    'analyzer_sido_area': ('regional',)
+        + _analyzer_scenario('get_sido_monthly_area'),
+    'analyzer_volume_and_area_memo': ('regional',)
+        + _analyzer_scenario('get_monthly_volume_and_area',
+                             cache_size=128, distinct=50),
+}
+
+
+def _run_in_child(name: str, ctx: Dict[str, Any]) -> Dict[str, Any]:
+    """(자식 프로세스) 시나리오 하나를 실행하고 측정값을 반환합니다."""
+    _, setup, run = SCENARIOS[name]
+    state = setup(ctx)
+    setup_rss = _peak_rss_mb()
+
+    start = time.perf_counter()
+    processed = run(state)
+    wall = time.perf_counter() - start
+
+    return {
+        'wall_s': round(wall, 6),
+        'processed': processed,
+        'rows_per_s': round(processed / wall, 1) if wall > 0 else None,
+        'setup_peak_rss_mb': setup_rss,
+        'peak_rss_mb': _peak_rss_mb(),
+    }
+
+
+def run_scenario(name: str, ctx: Dict[str, Any]) -> Dict[str, Any]:
+    """시나리오를 새 프로세스에서 실행합니다. (spawn: 측정 간 메모리 간섭 방지)"""
+    mp_context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=1, mp_context=mp_context) as pool:
+        return pool.submit(_run_in_child, name, ctx).result()
+
+
+# --- 실행 진입점 ---
+
+def run_benchmarks(
+    sizes: List[str],
+    scenarios: List[str],
+    workdir: Path,
+    repeat: int = 1,
+    seed: int = 0
+) -> Dict[str, Any]:
+    """
+    크기별 합성 데이터를 준비하고 시나리오를 실행하여 결과 딕셔너리를 반환합니다.
+    같은 크기/시드의 합성 CSV는 workdir에 있으면 재사용합니다.
+    """
+    workdir = Path(workdir)
+    regional_dir = workdir / 'regional'
+    if not any(regional_dir.glob('*.csv')):
+        generate_regional(regional_dir, REGIONAL_YEARS, seed=seed)
+
+    results = []
+    regional_done = False
+    for size in sizes:
+        rows = parse_size(size)
+        path = workdir / f"transactions_{size}_seed{seed}.csv"
+        ctx = {
+            'transactions': str(path),
+            'rows': rows,
+            'regional_dir': str(regional_dir),
+        }
+
+        for name in scenarios:
+            kind = SCENARIOS[name][0]
+            if kind == 'regional' and regional_done:
+                continue  # 지역 데이터는 크기와 무관하므로 한 번만
+            if kind == 'transactions' and not path.exists():
+                print(f"[bench] 합성 데이터 생성: {path.name}", file=sys.stderr)
+                generate_transactions(path, rows, seed=seed)
+
+            for i in range(repeat):
+                entry = {
+                    'scenario': name,
+                    'input': kind,
+                    'rows': rows if kind == 'transactions' else len(REGIONAL_YEARS),
+                    'repeat': i,
+                }
+                try:
+                    entry.update(run_scenario(name, ctx))
+                except Exception as e:
+                    entry['error'] = repr(e)
+                print(f"[bench] {name} ({size if kind == 'transactions' else 'regional'}): "
+                      f"{entry.get('wall_s', 'error')}s", file=sys.stderr)
+                results.append(entry)
+        regional_done = True
+
+    return {
+        'meta': {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'pandas': pd.__version__,
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'cpu_count': multiprocessing.cpu_count(),
+            'seed': seed,
+        },
+        'results': results,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='python -m py.bench',
+        description='date_cmp / floor / RealEstateAnalyzer 성능 측정'
+    )
+    parser.add_argument('--sizes', default=','.join(DEFAULT_SIZES),
+                        help='거래 데이터 행 수 목록 (예: 100k,1m,10m)')
+    parser.add_argument('--scenarios', default='all',
+                        help=f"실행할 시나리오 (쉼표 구분): {', '.join(SCENARIOS)}")
+    parser.add_argument('--workdir', default='bench_data',
+                        help='합성 데이터 저장 디렉토리')
+    parser.add_argument('--out', default='-', help='결과 JSON 경로 (- 이면 표준 출력)')
+    parser.add_argument('--repeat', type=int, default=1, help='시나리오 반복 횟수')
+    parser.add_argument('--seed', type=int, default=0, help='합성 데이터 난수 시드')
+    args = parser.parse_args(argv)
+
+    scenarios = list(SCENARIOS) if args.scenarios == 'all' else [
+        s.strip() for s in args.scenarios.split(',') if s.strip()
+    ]
+    unknown = [s for s in scenarios if s not in SCENARIOS]
+    if unknown:
+        parser.error(f"알 수 없는 시나리오: {', '.join(unknown)}")
+
+    report = run_benchmarks(
+        [s.strip() for s in args.sizes.split(',') if s.strip()],
+        scenarios,
+        Path(args.workdir),
+        repeat=args.repeat,
+        seed=args.seed,
+    )
+
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.out == '-':
+        print(text)
+    else:
+        Path(args.out).write_text(text + '\n', encoding='utf-8')
+    return 0
@@ -0,0 +1,111 @@
+import numpy as np
+import pandas as pd
+
+# 거래 데이터 기본 프로파일
+TRANSACTION_CATEGORIES = ('법정동', '시도', '시군구', '아파트', '도로명')
+TRANSACTION_NUMERICS = ('층', '거래금액', '전용면적', '건축년도')
+TRANSACTION_DATES = ('거래일',)
+
+# 날짜를 정수 일 인덱스로 저장할 때의 기준일
+DAY_INDEX_EPOCH = np.datetime64('1970-01-01', 'D')
+DAY_INDEX_NAT = np.iinfo('int32').min  # 결측 날짜 표시값
+
+
+# 공통 보조 함수
+
+def _downcast_numeric(s):
+    """
+    숫자 열을 값 손실 없이 표현 가능한 가장 작은 타입으로 줄입니다.
+    정수 값만 있는 실수 열은 정수로, 소수 4자리까지 그대로 보존되면 float32로 바꿉니다.
+    """
+    if not pd.api.types.is_numeric_dtype(s):
+        s = pd.to_numeric(
+            s.astype(str).str.replace(',', '', regex=False),
+            errors='coerce'
+        )
+
+    if pd.api.types.is_integer_dtype(s):
+        return pd.to_numeric(s, downcast='integer')
+
+    values = s.to_numpy(dtype='float64')
+    if not np.isnan(values).any() and np.array_equal(values, np.round(values)):
+        return pd.to_numeric(s, downcast='integer')
+
+    f32 = values.astype('float32')
+    if np.array_equal(
+        np.round(f32.astype('float64'), 4),
+        np.round(values, 4),
+        equal_nan=True
+    ):
+        return pd.Series(f32, index=s.index, name=s.name)
+    return s
+
+
+def memory_bytes(df):
+    """DataFrame이 실제로 차지하는 메모리(문자열 객체 포함, 바이트)"""
+    return int(df.memory_usage(deep=True).sum())
+
+
+# 압축 프로파일 적용 함수
+
+def compact_dtypes(df, categories=TRANSACTION_CATEGORIES,
+                   numerics=TRANSACTION_NUMERICS, dates=TRANSACTION_DATES,
+                   day_index=False, verbose=False):
+    """
+    DataFrame의 열 타입을 메모리를 적게 쓰는 타입으로 바꿉니다.
+    지정한 열 중 DataFrame에 없는 열은 무시합니다.
+
+    - 지역/동 이름 등 반복되는 문자열 → category
+    - 층, 거래금액, 전용면적 등 숫자 → 손실 없는 가장 작은 정수/실수 타입
+    - 날짜 → datetime64 (day_index=True이면 1970-01-01 기준 int32 일 인덱스,
+      결측은 DAY_INDEX_NAT)
+
+    변환 전후 메모리 사용량은 df.attrs['memory_report']에 기록됩니다.
+
+    매개변수:
+        df (pd.DataFrame): 원본 데이터프레임 (열 단위로 교체되며 반환값을 사용)
+        categories (list[str]): category로 바꿀 열 이름
+        numerics (list[str]): 숫자 타입을 줄일 열 이름
+        dates (list[str]): 날짜로 변환할 열 이름
+        day_index (bool): True이면 날짜를 int32 일 인덱스로 저장합니다.
+        verbose (bool): True이면 변환 전후 메모리 사용량을 출력합니다.
+
+    반환값:
+        pd.DataFrame: 타입이 줄어든 DataFrame
+    """
+    before = memory_bytes(df)
+    df = df.copy(deep=False)
+
+    for col in categories:
+        if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype('category')
+
+    for col in numerics:
+        if col in df.columns:
+            df[col] = _downcast_numeric(df[col])
+
+    for col in dates:
+        if col not in df.columns:
+            continue
+        if not pd.api.types.is_datetime64_any_dtype(df[col]):
+            df[col] = pd.to_datetime(df[col], errors='coerce')
+        if day_index:
+            values = df[col].to_numpy().astype('datetime64[D]')
+            days = (values - DAY_INDEX_EPOCH).astype('int64')
+            days[np.isnat(values)] = DAY_INDEX_NAT
+            df[col] = days.astype('int32')
+
+    after = memory_bytes(df)
+    df.attrs['memory_report'] = {
+        'before': before,
+        'after': after,
+        'ratio': round(before / after, 2) if after else None
+    }
+
+    if verbose:
+        print(
+            f"[compact_dtypes] 메모리 {before / 2**20:.1f}MB → "
+            f"{after / 2**20:.1f}MB ({df.attrs['memory_report']['ratio']}배 감소)"
+        )
+
+    return df
@@ -1,15 +1,44 @@
+import re
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Sequence, Union
+
+_GLOB_CHARS = re.compile(r'[*?\[]')
+_YEAR_PATTERN = re.compile(r'((?:19|20)\d{2})')
+
+
+def _resolve_files(data_dir: Path, spec: Union[str, Sequence[str]]) -> List[Path]:
+    """파일명, 글롭 패턴 또는 파일명 목록을 정렬된 경로 목록으로 바꿉니다."""
+    specs = [spec] if isinstance(spec, str) else list(spec)
+    paths: List[Path] = []
+    for item in specs:
+        if _GLOB_CHARS.search(str(item)):
+            paths.extend(sorted(data_dir.glob(str(item))))
+        else:
+            paths.append(data_dir / item)
+    return paths
+
+
+def file_year(path: Path) -> Optional[int]:
+    """파일명에 포함된 연도(예: '2020년 ...csv' → 2020), 없으면 None"""
+    match = _YEAR_PATTERN.search(Path(path).name)
+    return int(match.group(1)) if match else None
+
 
 @dataclass
 class AnalysisConfig:
     """분석 설정을 관리하는 객체"""
     
     data_dir: Path
-    volume_filename: str = '2020년 광역 지자체별 아파트 거래량.csv'
-    area_filename: str = '2020년 지자체 거래 호수 및 면적 통계자료.csv'
+    # 파일명, 글롭 패턴(예: '*년 광역 지자체별 아파트 거래량.csv') 또는 연도별 파일명 목록
+    volume_filename: Union[str, Sequence[str]] = '2020년 광역 지자체별 아파트 거래량.csv'
+    area_filename: Union[str, Sequence[str]] = '2020년 지자체 거래 호수 및 면적 통계자료.csv'
     encoding: str = 'utf-8-sig'
+    use_disk_cache: bool = True
+    cache_dir: Optional[Path] = None
+    compact: bool = False
+    reload_check_interval: Optional[float] = 5.0  # 원본 변경 확인 주기(초), None이면 끔
+    max_workers: Optional[int] = None  # 여러 파일 병렬 파싱 프로세스 수 (1이면 순차)
     
     def __post_init__(self):
         """경로 검증"""
@@ -17,13 +46,34 @@ class AnalysisConfig:
         if not self.data_dir.exists():
             raise ValueError(f"데이터 디렉토리가 존재하지 않음: {self.data_dir}")
     
+    @property
+    def volume_paths(self) -> List[Path]:
+        """거래량 파일 목록 (글롭 패턴은 호출 시점에 다시 검색)"""
+        return _resolve_files(self.data_dir, self.volume_filename)
+    
+    @property
+    def area_paths(self) -> List[Path]:
+        """거래 호수 및 면적 파일 목록 (글롭 패턴은 호출 시점에 다시 검색)"""
+        return _resolve_files(self.data_dir, self.area_filename)
+    
     @property
     def volume_path(self) -> Path:
-        return self.data_dir / self.volume_filename
+        """첫 번째 거래량 파일 (단일 파일 설정과의 하위 호환)"""
+        paths = self.volume_paths
+        return paths[0] if paths else self.data_dir / str(self.volume_filename)
     
     @property
     def area_path(self) -> Path:
-        return self.data_dir / self.area_filename
+        """첫 번째 면적 파일 (단일 파일 설정과의 하위 호환)"""
+        paths = self.area_paths
+        return paths[0] if paths else self.data_dir / str(self.area_filename)
+    
+    @property
+    def cache_path(self) -> Path:
+        """정제된 DataFrame 디스크 캐시 위치 (기본: data_dir/.cache)"""
+        if self.cache_dir is not None:
+            return Path(self.cache_dir)
+        return self.data_dir / '.cache'
     
     @classmethod
     def from_base_dir(cls, base_dir: Optional[Path] = None) -> 'AnalysisConfig':
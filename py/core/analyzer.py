@@ -1,6 +1,86 @@
-from typing import List, Dict, Union, Optional
+import functools
+import inspect
+import threading
+from typing import Any, List, Dict, Union, Optional
 import pandas as pd
-from .loader import DataLoader 
+from .loader import FILE_YEAR_ATTR, DataLoader
+from .cube import METRICS, RegionMonthCube
+from .memo import ResultCache
+from ..serialize import arrow_bytes, dump_arrow, to_records
+
+
+def _filter_frame(
+    df: pd.DataFrame,
+    sidos: Optional[List[str]] = None,
+    start_y: Optional[int] = None,
+    end_y: Optional[int] = None
+) -> pd.DataFrame:
+    """시도 목록과 연도 범위(start_y ~ end_y, 양끝 포함)로 행을 거릅니다."""
+    mask = pd.Series(True, index=df.index)
+    if sidos:
+        mask &= df['시도'].isin(sidos)
+    # '연도' 열이 없으면(단일 파일 설정) 모든 행을 파일명의 연도로 취급
+    if '연도' in df.columns:
+        years = df['연도']
+    else:
+        year = df.attrs.get(FILE_YEAR_ATTR)
+        years = pd.Series(float('nan') if year is None else year, index=df.index)
+    if start_y is not None:
+        mask &= years >= start_y
+    if end_y is not None:
+        mask &= years <= end_y
+    if mask.all():
+        return df
+    return df[mask].reset_index(drop=True)
+
+
+def _normalize_arg(name: str, value: Any) -> Any:
+    """캐시 키용 인자 정규화: 시도 목록은 순서/중복과 무관하게 취급"""
+    if name == 'sidos':
+        return tuple(sorted(set(value))) if value else None
+    return value
+
+
+def _records_frame(
+    records: List[Dict[str, Union[str, int]]],
+    has_year: bool = True
+) -> pd.DataFrame:
+    """get_monthly_volume_and_area 레코드 → 열 dtype이 고정된 DataFrame"""
+    dtypes = {
+        '시도': object, '연도': 'Int64', '월': object,
+        METRICS[0]: 'int64', METRICS[1]: 'int64'
+    }
+    if not has_year:
+        del dtypes['연도']
+    df = pd.DataFrame.from_records(records, columns=list(dtypes))
+    return df.astype(dtypes)
+
+
+def _memoized(method):
+    """
+    분석 메소드 결과를 RealEstateAnalyzer의 LRU 캐시에 보관하는 데코레이터.
+    반환 레코드는 호출자가 수정해도 캐시에 영향이 없도록 얕은 복사본입니다.
+    """
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        key = (method.__name__,) + tuple(
+            _normalize_arg(name, value)
+            for name, value in bound.arguments.items()
+            if name != 'self'
+        )
+        records = self._results.get_or_compute(
+            key,
+            self.loader.refresh(),
+            lambda: method(self, *args, **kwargs),
+            lambda: self.loader.generation
+        )
+        return [dict(record) for record in records]
+
+    return wrapper
 
 
 class RealEstateAnalyzer:
@@ -8,18 +88,49 @@ class RealEstateAnalyzer:
     부동산 데이터 로더를 사용하여 데이터를 분석하는 클래스
     """
     
-    def __init__(self, loader: DataLoader):
+    def __init__(self, loader: DataLoader, cache_size: int = 128):
         """
         RealEstateAnalyzer 인스턴스를 초기화합니다.
 
         Args:
             loader (DataLoader): 데이터를 로드할 DataLoader 인스턴스
+            cache_size (int): 조회 결과 LRU 캐시 크기 (0이면 캐시하지 않음)
         """
         self.loader = loader
+        self._results = ResultCache(cache_size)
+        self._cube: Optional[RegionMonthCube] = None
+        self._cube_lock = threading.Lock()
+
+    def _get_cube(self) -> RegionMonthCube:
+        """
+        (시도, 월, metric) 큐브를 반환합니다.
+        로더가 데이터를 다시 읽었을 때(generation 변경)만 새로 만듭니다.
+        """
+        # 두 DataFrame이 같은 generation에서 읽힌 것이 확인될 때까지 반복
+        while True:
+            generation = self.loader.generation
+            df_v = self.loader.load_volume_data()
+            df_a = self.loader.load_area_data()
+            if generation == self.loader.generation:
+                break
+
+        cube = self._cube
+        if cube is not None and cube.generation == generation:
+            return cube
+
+        with self._cube_lock:
+            cube = self._cube
+            if cube is None or cube.generation != generation:
+                cube = RegionMonthCube.build(df_v, df_a, generation)
+                self._cube = cube
+            return cube
     
+    @_memoized
     def get_sido_monthly_volume(
         self, 
-        sidos: Optional[List[str]] = None
+        sidos: Optional[List[str]] = None,
+        start_y: Optional[int] = None,
+        end_y: Optional[int] = None
     ) -> List[Dict[str, Union[str, int]]]:
         """
         시도별 월간 거래량(호수) 원본 데이터를 반환합니다. (Wide 포맷)
@@ -27,17 +138,17 @@ class RealEstateAnalyzer:
         Args:
             sidos (Optional[List[str]]): 
                 필터링할 '시도' 이름의 리스트. None이면 전체 반환.
+            start_y (Optional[int]): 조회 시작 연도. None이면 처음부터.
+            end_y (Optional[int]): 조회 종료 연도. None이면 끝까지.
         """
-        df = self.loader.load_volume_data()
-        
-        if sidos: 
-            df = df[df['시도'].isin(sidos)].reset_index(drop=True)
-            
-        return df.to_dict(orient='records')
+        return to_records(self._volume_frame(sidos, start_y, end_y))
     
+    @_memoized
     def get_sido_monthly_area(
         self,
-        sidos: Optional[List[str]] = None 
+        sidos: Optional[List[str]] = None,
+        start_y: Optional[int] = None,
+        end_y: Optional[int] = None
     ) -> List[Dict[str, Union[str, int]]]:
         """
         시도별 월간 거래 면적(천㎡) 원본 데이터를 반환합니다. (Wide 포맷)
@@ -45,26 +156,22 @@ class RealEstateAnalyzer:
         Args:
             sidos (Optional[List[str]]): 
                 필터링할 '시도' 이름의 리스트. None이면 전체 반환.
+            start_y (Optional[int]): 조회 시작 연도. None이면 처음부터.
+            end_y (Optional[int]): 조회 종료 연도. None이면 끝까지.
         """
-        df = self.loader.load_area_data()
-        
-        if sidos: # [축약]
-            df = df[df['시도'].isin(sidos)].reset_index(drop=True)
-
-        # [축약] area_cols -> a_cols
-        a_cols = ['시도'] + [col for col in df.columns if '_면적' in col]
-        
-        valid_cols = [col for col in a_cols if col in df.columns]
-        return df[valid_cols].to_dict(orient='records')
+        return to_records(self._area_frame(sidos, start_y, end_y))
     
+    @_memoized
     def get_monthly_volume_and_area(
         self,
         sidos: Optional[List[str]] = None,
         start_m: Optional[str] = None,
-        end_m: Optional[str] = None
+        end_m: Optional[str] = None,
+        start_y: Optional[int] = None,
+        end_y: Optional[int] = None
     ) -> List[Dict[str, Union[str, int]]]:
         """
-        시도별/월별 거래 호수와 거래 면적을 결합하여 'Long' 포맷으로 반환합니다.
+        시도별/연도별/월별 거래 호수와 거래 면적을 결합하여 'Long' 포맷으로 반환합니다.
 
         Args:
             sidos (Optional[List[str]]): 
@@ -73,55 +180,94 @@ class RealEstateAnalyzer:
                 조회 시작 월 (YYYY-MM). None이면 처음부터.
             end_m (Optional[str]): 
                 조회 종료 월 (YYYY-MM). None이면 끝까지.
+            start_y (Optional[int]): 조회 시작 연도. None이면 처음부터.
+            end_y (Optional[int]): 조회 종료 연도. None이면 끝까지.
         """
-        # [축약] df_volume -> df_v, df_area -> df_a
-        df_v = self.loader.load_volume_data()
-        df_a = self.loader.load_area_data()
-        
-        if sidos:
-            df_v = df_v[df_v['시도'].isin(sidos)].reset_index(drop=True)
-            df_a = df_a[df_a['시도'].isin(sidos)].reset_index(drop=True)
-
-        if df_v.empty or df_a.empty:
-            return []
-            
-        vol_long = df_v.melt(
-            id_vars=['시도'],
-            var_name='월',
-            value_name='거래호수'
-        )
-        
-        a_cols = [col for col in df_a.columns if '_면적' in col]
-        area_long = df_a.melt(
-            id_vars=['시도'],
-            value_vars=a_cols,
-            var_name='월_col', 
-            value_name='거래면적(천㎡)'
-        )
-        
-        area_long['월'] = area_long['월_col'].str.replace('_면적', '')
-        area_long = area_long.drop(columns=['월_col'])
-        
-        merged_df = pd.merge(
-            vol_long, 
-            area_long, 
-            on=['시도', '월'], 
-            how='outer'
-        )
-        
-        if start_m:
-            merged_df = merged_df[merged_df['월'] >= start_m]
-                
-        if end_m:
-            merged_df = merged_df[merged_df['월'] <= end_m]
+        cube = self._get_cube()
+        return cube.query(sidos, start_m, end_m, start_y, end_y)
+
+    # --- DataFrame / Arrow 출력 ---
+
+    def _volume_frame(
+        self,
+        sidos: Optional[List[str]] = None,
+        start_y: Optional[int] = None,
+        end_y: Optional[int] = None
+    ) -> pd.DataFrame:
+        df = self.loader.load_volume_data()
+        return _filter_frame(df, sidos, start_y, end_y)
 
-        merged_df = merged_df.fillna(0)
+    def _area_frame(
+        self,
+        sidos: Optional[List[str]] = None,
+        start_y: Optional[int] = None,
+        end_y: Optional[int] = None
+    ) -> pd.DataFrame:
+        df = self.loader.load_area_data()
+        df = _filter_frame(df, sidos, start_y, end_y)
+
+        # [축약] area_cols -> a_cols
+        a_cols = ['시도', '연도'] + [col for col in df.columns if '_면적' in col]
         
-        merged_df['거래면적(천㎡)'] = (
-            merged_df['거래면적(천㎡)'].round(0).astype(int)
+        valid_cols = [col for col in a_cols if col in df.columns]
+        return df[valid_cols]
+
+    def _volume_and_area_frame(self, **filters) -> pd.DataFrame:
+        return _records_frame(
+            self.get_monthly_volume_and_area(**filters),
+            self._get_cube().has_year
         )
-        merged_df['거래호수'] = merged_df['거래호수'].astype(int)
-        
-        merged_df = merged_df.sort_values(by=['시도', '월']).reset_index(drop=True)
-        
-        return merged_df.to_dict(orient='records')
\ No newline at end of file
+
+    _FRAMES = {
+        'get_sido_monthly_volume': '_volume_frame',
+        'get_sido_monthly_area': '_area_frame',
+        'get_monthly_volume_and_area': '_volume_and_area_frame',
+    }
+
+    def _frame(self, name: str, filters: Dict[str, Any]) -> pd.DataFrame:
+        try:
+            builder = getattr(self, self._FRAMES[name])
+        except KeyError:
+            raise ValueError(
+                f"지원하지 않는 메소드: {name} ({', '.join(self._FRAMES)} 중 하나)"
+            ) from None
+        return builder(**filters)
+
+    def get_frame(self, name: str, **filters) -> pd.DataFrame:
+        """
+        분석 메소드의 결과를 레코드 목록 대신 dtype이 유지된 DataFrame으로 반환합니다.
+
+        Args:
+            name (str): 분석 메소드 이름 (예: 'get_sido_monthly_volume')
+            **filters: 해당 메소드의 조회 조건 (sidos, start_y 등)
+        """
+        return self._frame(name, filters).copy()
+
+    def to_arrow(
+        self,
+        name: str,
+        path: Optional[str] = None,
+        kind: str = 'stream',
+        **filters
+    ) -> bytes:
+        """
+        분석 메소드의 결과를 Arrow IPC로 직렬화합니다. (pyarrow 필요)
+        pandas / Polars에서 JSON 파싱 없이 dtype 그대로 읽을 수 있습니다.
+
+        Args:
+            name (str): 분석 메소드 이름 (예: 'get_monthly_volume_and_area')
+            path (Optional[str]): 지정하면 해당 경로에 파일로도 저장
+            kind (str): 'stream' (스트림 형식) 또는 'file' (파일 형식, memory-map용)
+            **filters: 해당 메소드의 조회 조건 (sidos, start_y 등)
+
+        Returns:
+            bytes: Arrow IPC 본문
+        """
+        df = self._frame(name, filters)
+        if path is not None:
+            return dump_arrow(df, path, kind)
+        return arrow_bytes(df, kind)
+
+    def cache_info(self) -> Dict[str, Any]:
+        """조회 결과 캐시의 적중/미스 횟수와 적중률"""
+        return self._results.info()
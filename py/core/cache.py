@@ -0,0 +1,119 @@
+import hashlib
+import os
+from pathlib import Path
+from typing import Callable, Optional
+
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401  (Feather 직렬화에 필요)
+    HAS_ARROW = True
+except ImportError:
+    HAS_ARROW = False
+
+
+class FrameCache:
+    """
+    정제된 DataFrame을 Feather(Arrow 컬럼 포맷) 파일로 디스크에 보관하는 캐시
+
+    캐시 키는 원본 파일의 경로, 크기, 수정 시각(mtime)과 로더 버전으로 구성되므로
+    CSV가 바뀌거나 정제 로직(버전)이 바뀌면 자동으로 무효화됩니다.
+    pyarrow가 설치되어 있지 않으면 캐시는 비활성화되고 항상 원본을 파싱합니다.
+    """
+
+    SUFFIX = '.feather'
+
+    def __init__(self, cache_dir: Path, version: str):
+        """
+        Args:
+            cache_dir (Path): 캐시 파일을 저장할 디렉토리
+            version (str): 로더 버전 (정제 로직 변경 시 올려서 기존 캐시 무효화)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.version = str(version)
+
+    @property
+    def enabled(self) -> bool:
+        return HAS_ARROW
+
+    def _key(self, source: Path) -> str:
+        """원본 파일 메타데이터로 캐시 키(16자리 해시)를 생성합니다."""
+        st = os.stat(source)
+        raw = f"{Path(source).resolve()}|{st.st_size}|{st.st_mtime_ns}|{self.version}"
+        return hashlib.sha1(raw.encode('utf-8')).hexdigest()[:16]
+
+    def _prefix(self, source: Path) -> str:
+        """
+        원본 파일별 캐시 파일명 접두사: 파일명(stem)과 절대 경로 해시(8자리)
+        (다른 폴더 / 다른 확장자의 같은 이름 원본과 캐시 파일이 섞이지 않도록)
+        """
+        resolved = str(Path(source).resolve())
+        path_hash = hashlib.sha1(resolved.encode('utf-8')).hexdigest()[:8]
+        return f"{Path(source).stem}.{path_hash}."
+
+    def path_for(self, source: Path) -> Path:
+        """원본 파일에 대응하는 캐시 파일 경로"""
+        return self.cache_dir / f"{self._prefix(source)}{self._key(source)}{self.SUFFIX}"
+
+    def get(self, source: Path) -> Optional[pd.DataFrame]:
+        """유효한 캐시가 있으면 DataFrame을, 없거나 손상되었으면 None을 반환합니다."""
+        if not self.enabled:
+            return None
+
+        path = self.path_for(source)
+        if not path.exists():
+            return None
+
+        try:
+            return pd.read_feather(path)
+        except Exception:
+            # 손상된 캐시 파일은 무시하고 원본에서 다시 생성
+            return None
+
+    def put(self, source: Path, df: pd.DataFrame) -> None:
+        """DataFrame을 캐시에 기록하고, 같은 원본의 이전 캐시 파일을 정리합니다."""
+        if not self.enabled:
+            return
+
+        path = self.path_for(source)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            df.to_feather(tmp_path)
+            # 동시에 쓰는 프로세스가 있어도 완성된 파일만 보이도록 교체
+            os.replace(tmp_path, path)
+        except Exception:
+            # 캐시는 최선 노력(best-effort) 방식: 기록 실패가 로딩을 막지 않음
+            if tmp_path.exists():
+                tmp_path.unlink()
+            return
+
+        self._remove_stale(source, keep=path)
+
+    def get_or_build(
+        self,
+        source: Path,
+        build: Callable[[], pd.DataFrame]
+    ) -> pd.DataFrame:
+        """캐시를 조회하고, 없으면 build()로 생성한 결과를 캐시에 기록합니다."""
+        df = self.get(source)
+        if df is not None:
+            return df
+
+        df = build()
+        self.put(source, df)
+        return df
+
+    def _remove_stale(self, source: Path, keep: Path) -> None:
+        """같은 원본(같은 절대 경로)의 이전 키 캐시 파일을 지웁니다."""
+        prefix = self._prefix(source)
+        for entry in self.cache_dir.iterdir():
+            if (entry != keep
+                    and entry.name.startswith(prefix)
+                    and entry.name.endswith(self.SUFFIX)
+                    and len(entry.name) == len(keep.name)):
+                try:
+                    entry.unlink()
+                except OSError:
+                    pass
@@ -0,0 +1,185 @@
+from typing import Dict, List, Optional, Tuple, Union
+import numpy as np
+import pandas as pd
+
+from .loader import FILE_YEAR_ATTR
+
+# 큐브의 마지막 축(metric) 순서
+METRICS = ('거래호수', '거래면적(천㎡)')
+
+
+def _period_sort_key(period: Tuple[Optional[int], str]):
+    """(연도, 월) 정렬 키 — 연도가 없는 기간은 뒤로 (pandas 정렬과 동일)"""
+    year, month = period
+    return (year is None, year or 0, month)
+
+
+class RegionMonthCube:
+    """
+    (시도, 기간(연도, 월), metric) 3차원 NumPy 배열
+
+    거래량/면적 DataFrame으로부터 로드마다 한 번 만들어 두고,
+    시도 목록·월 범위·연도 범위 필터를 배열 슬라이싱으로 처리합니다.
+    """
+
+    def __init__(
+        self,
+        sidos: List[str],
+        periods: List[Tuple[Optional[int], str]],
+        values: np.ndarray,
+        vol_mask: np.ndarray,
+        area_mask: np.ndarray,
+        generation: int = 0,
+        has_year: bool = True,
+        file_year: Optional[int] = None
+    ):
+        self.sidos = sidos
+        self.periods = periods
+        self.values = values
+        self.vol_mask = vol_mask
+        self.area_mask = area_mask
+        self.generation = generation
+        self.has_year = has_year  # False이면 레코드에 '연도' 키를 넣지 않음 (단일 파일 설정)
+        self.file_year = file_year  # 단일 파일 설정에서 연도 범위 필터에 쓰는 파일명의 연도
+
+        self.sido_index: Dict[str, int] = {s: i for i, s in enumerate(sidos)}
+        years = [file_year if y is None else y for y, _ in periods]
+        self._years = np.array(
+            [np.nan if y is None else y for y in years], dtype='float64'
+        )
+        self._months = np.array([m for _, m in periods], dtype=object)
+
+    @classmethod
+    def build(
+        cls,
+        df_v: pd.DataFrame,
+        df_a: pd.DataFrame,
+        generation: int = 0
+    ) -> 'RegionMonthCube':
+        """
+        시도별 월간 거래량(Wide)과 면적(Wide, '*_면적' 열) DataFrame으로 큐브를 만듭니다.
+        """
+        id_cols = ('시도', '연도')
+        v_cols = [col for col in df_v.columns if col not in id_cols]
+        a_cols = [col for col in df_a.columns if '_면적' in col]
+        a_months = [col.replace('_면적', '') for col in a_cols]
+
+        def _year(value) -> Optional[int]:
+            return None if pd.isna(value) else int(value)
+
+        def _years(df) -> List[Optional[int]]:
+            if '연도' not in df.columns:  # 단일 파일 설정: 연도 없음
+                return [None] * len(df)
+            return [_year(y) for y in df['연도']]
+
+        v_years = _years(df_v)
+        a_years = _years(df_a)
+        has_year = '연도' in df_v.columns or '연도' in df_a.columns
+        # 단일 파일 설정: 두 파일명의 연도가 같으면 그 연도로 연도 범위를 거름
+        file_year = None
+        if not has_year:
+            v_year = df_v.attrs.get(FILE_YEAR_ATTR)
+            if v_year == df_a.attrs.get(FILE_YEAR_ATTR):
+                file_year = v_year
+
+        sidos = sorted(set(df_v['시도']) | set(df_a['시도']))
+        periods = sorted(
+            {(y, m) for y in set(v_years) for m in v_cols}
+            | {(y, m) for y in set(a_years) for m in a_months},
+            key=_period_sort_key
+        )
+        sido_index = {s: i for i, s in enumerate(sidos)}
+        period_index = {p: i for i, p in enumerate(periods)}
+
+        shape = (len(sidos), len(periods))
+        values = np.full(shape + (len(METRICS),), np.nan)
+        vol_mask = np.zeros(shape, dtype=bool)
+        area_mask = np.zeros(shape, dtype=bool)
+
+        sources = (
+            (df_v, v_years, v_cols, v_cols, 0, vol_mask),
+            (df_a, a_years, a_cols, a_months, 1, area_mask),
+        )
+        for df, years, cols, months, metric, mask in sources:
+            if df.empty or not cols:
+                continue
+            rows = np.array([sido_index[s] for s in df['시도']])
+            data = df[cols].to_numpy(dtype='float64')
+            for year in set(years):
+                sel = np.array([y == year for y in years])
+                cols_idx = np.array([period_index[(year, m)] for m in months])
+                r = rows[sel][:, None]
+                values[r, cols_idx[None, :], metric] = data[sel]
+                mask[r, cols_idx[None, :]] = True
+
+        return cls(sidos, periods, values, vol_mask, area_mask, generation,
+                   has_year, file_year)
+
+    def _period_selection(
+        self,
+        start_m: Optional[str],
+        end_m: Optional[str],
+        start_y: Optional[int],
+        end_y: Optional[int]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """(연도 범위만 적용한 기간 마스크, 월 범위까지 적용한 기간 마스크)"""
+        in_years = np.ones(len(self.periods), dtype=bool)
+        if start_y is not None:
+            in_years &= self._years >= start_y
+        if end_y is not None:
+            in_years &= self._years <= end_y
+
+        selected = in_years.copy()
+        if start_m:
+            selected &= self._months >= start_m
+        if end_m:
+            selected &= self._months <= end_m
+        return in_years, selected
+
+    def query(
+        self,
+        sidos: Optional[List[str]] = None,
+        start_m: Optional[str] = None,
+        end_m: Optional[str] = None,
+        start_y: Optional[int] = None,
+        end_y: Optional[int] = None
+    ) -> List[Dict[str, Union[str, int]]]:
+        """
+        RealEstateAnalyzer.get_monthly_volume_and_area와 같은 'Long' 포맷 레코드를
+        큐브 슬라이스로부터 만듭니다. (시도, 연도, 월 순 정렬)
+        """
+        if sidos:
+            s_idx = np.array(sorted(
+                self.sido_index[s] for s in set(sidos) if s in self.sido_index
+            ), dtype=int)
+        else:
+            s_idx = np.arange(len(self.sidos))
+
+        in_years, selected = self._period_selection(start_m, end_m, start_y, end_y)
+
+        # 원본 구현과 동일하게, 시도/연도 필터 후 한쪽 데이터가 비면 빈 결과
+        if (not self.vol_mask[s_idx][:, in_years].any()
+                or not self.area_mask[s_idx][:, in_years].any()):
+            return []
+
+        p_idx = np.flatnonzero(selected)
+        present = (self.vol_mask | self.area_mask)[np.ix_(s_idx, p_idx)]
+        rows, cols = np.nonzero(present)
+        if rows.size == 0:
+            return []
+
+        sub = np.nan_to_num(self.values[s_idx[rows], p_idx[cols]], nan=0.0)
+        volume = sub[:, 0].astype('int64').tolist()
+        area = np.round(sub[:, 1], 0).astype('int64').tolist()
+
+        records = []
+        for k, (i, j) in enumerate(zip(s_idx[rows].tolist(), p_idx[cols].tolist())):
+            year, month = self.periods[j]
+            record = {'시도': self.sidos[i]}
+            if self.has_year:
+                record['연도'] = year
+            record['월'] = month
+            record[METRICS[0]] = volume[k]
+            record[METRICS[1]] = area[k]
+            records.append(record)
+        return records
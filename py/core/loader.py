@@ -1,62 +1,251 @@
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
-from typing import Optional
-from ..config.settings import AnalysisConfig 
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+from ..config.settings import AnalysisConfig, file_year
+from .cache import FrameCache
+from ..compact import compact_dtypes
+
+# 정제 로직(아래 _read_* 함수)이 바뀌면 올려서 디스크 캐시를 무효화
+LOADER_VERSION = '1'
+
+# 단일 파일 설정에서 파일명의 연도를 기록하는 DataFrame.attrs 키 ('연도' 열 대신)
+FILE_YEAR_ATTR = 'file_year'
+
+
+def _read_volume_csv(path: Path, encoding: str) -> pd.DataFrame:
+    """광역 지자체별 거래량 CSV를 읽어 정제합니다."""
+    df = pd.read_csv(path, encoding=encoding)
+    df = df.rename(columns={'광역지방자치단체': '시도'})
+    return df[df['시도'] != '전국'].reset_index(drop=True)
+
+
+def _read_area_csv(path: Path, encoding: str) -> pd.DataFrame:
+    """거래 호수 및 면적 CSV(2행 멀티인덱스 헤더)를 읽어 정제합니다."""
+    df = pd.read_csv(path, encoding=encoding, header=[0, 1])
+
+    # 멀티인덱스 정리
+    new_cols = []
+    for col in df.columns:
+        if col[0] == col[1]:
+            new_cols.append(col[0])
+        else:
+            metric = '면적' if '면적' in col[1] else col[1]
+            new_cols.append(f"{col[0]}_{metric}")
+
+    df.columns = new_cols
+    df = df.rename(columns={
+        '행정구역별(1)': '시도',
+        '행정구역별(2)': '시군구'
+    })
+
+    df_clean = df[
+        df['시군구'].str.contains('소계', na=False)
+    ].reset_index(drop=True)
+    return df_clean[df_clean['시도'] != '전국'].reset_index(drop=True)
+
 
 class DataLoader:
     def __init__(self, config: AnalysisConfig):
         self.config = config
         self._volume_cache: Optional[pd.DataFrame] = None
         self._area_cache: Optional[pd.DataFrame] = None
-    
-    def load_volume_data(self, force_reload: bool = False) -> pd.DataFrame:
-        if self._volume_cache is not None and not force_reload:
-            return self._volume_cache
-        
-        try:
-            df = pd.read_csv(self.config.volume_path, encoding=self.config.encoding)
-            df = df.rename(columns={'광역지방자치단체': '시도'})
-            df_clean = df[df['시도'] != '전국'].reset_index(drop=True)
-            self._volume_cache = df_clean
-            return df_clean
-        except FileNotFoundError:
-            raise FileNotFoundError(f"파일 없음: {self.config.volume_path}")
-    
-    def load_area_data(self, force_reload: bool = False) -> pd.DataFrame:
-        if self._area_cache is not None and not force_reload:
-            return self._area_cache
-        
+        self._disk_cache: Optional[FrameCache] = None
+        if config.use_disk_cache:
+            self._disk_cache = FrameCache(config.cache_path, LOADER_VERSION)
+
+        # 데이터셋별 단일 로딩(single-flight) 잠금과 원본 파일 상태
+        self._locks = {'volume': threading.Lock(), 'area': threading.Lock()}
+        self._signatures: Dict[str, Optional[Tuple]] = {
+            'volume': None, 'area': None
+        }
+        self._checked_at = {'volume': 0.0, 'area': 0.0}
+
+        self._stats_lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'reloads': 0}
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        """메모리 캐시가 (재)로드되거나 비워질 때마다 증가하는 번호"""
+        return self._generation
+
+    def cache_stats(self) -> Dict[str, int]:
+        """메모리 캐시 적중/미스/재로드 횟수"""
+        with self._stats_lock:
+            return dict(self._stats, generation=self._generation)
+
+    def _count(self, key: str) -> None:
+        with self._stats_lock:
+            self._stats[key] += 1
+
+    @staticmethod
+    def _signature(paths: List[Path]) -> Optional[Tuple]:
+        """원본 파일들의 (경로, 크기, mtime) 목록 — 없는 파일이 있으면 None"""
         try:
-            df = pd.read_csv(
-                self.config.area_path,
-                encoding=self.config.encoding,
-                header=[0, 1]
+            return tuple(
+                (str(path), st.st_size, st.st_mtime_ns)
+                for path, st in ((path, os.stat(path)) for path in paths)
             )
-            
-            # 멀티인덱스 정리
-            new_cols = []
-            for col in df.columns:
-                if col[0] == col[1]:
-                    new_cols.append(col[0])
-                else:
-                    metric = '면적' if '면적' in col[1] else col[1]
-                    new_cols.append(f"{col[0]}_{metric}")
-            
-            df.columns = new_cols
-            df = df.rename(columns={
-                '행정구역별(1)': '시도',
-                '행정구역별(2)': '시군구'
-            })
-            
-            df_clean = df[
-                df['시군구'].str.contains('소계', na=False)
-            ].reset_index(drop=True)
-            df_clean = df_clean[df_clean['시도'] != '전국'].reset_index(drop=True)
-            
-            self._area_cache = df_clean
-            return df_clean
-        except FileNotFoundError:
-            raise FileNotFoundError(f"파일 없음: {self.config.area_path}")
-    
+        except OSError:
+            return None
+
+    def _is_stale(self, kind: str, resolve: Callable[[], List[Path]]) -> bool:
+        """
+        원본 파일(글롭 패턴이면 파일 목록 포함)이 캐시 이후 바뀌었는지 확인합니다.
+        stat 호출은 config.reload_check_interval 초에 한 번만 수행합니다.
+        """
+        interval = self.config.reload_check_interval
+        if interval is None:
+            return False
+
+        now = time.monotonic()
+        if now - self._checked_at[kind] < interval:
+            return False
+        self._checked_at[kind] = now
+
+        current = self._signature(resolve())
+        # 파일이 잠시 사라진 경우에는 기존 캐시를 계속 사용
+        return current is not None and current != self._signatures[kind]
+
+    def _load(
+        self,
+        kind: str,
+        resolve: Callable[[], List[Path]],
+        reader: Callable[[Path, str], pd.DataFrame],
+        force_reload: bool
+    ) -> pd.DataFrame:
+        """
+        메모리 캐시를 반환하거나, 잠금 아래에서 한 스레드만 원본을 다시 읽습니다.
+        """
+        attr = f"_{kind}_cache"
+        cached = getattr(self, attr)
+        if (cached is not None and not force_reload
+                and not self._is_stale(kind, resolve)):
+            self._count('hits')
+            return cached
+
+        with self._locks[kind]:
+            # 잠금을 기다리는 동안 다른 스레드가 이미 읽었을 수 있음
+            cached = getattr(self, attr)
+            paths = resolve()
+            signature = self._signature(paths)
+            if (cached is not None and not force_reload
+                    and signature == self._signatures[kind]):
+                self._count('hits')
+                return cached
+
+            df = self._read(paths, reader)
+            setattr(self, attr, df)
+            self._signatures[kind] = signature
+            self._checked_at[kind] = time.monotonic()
+            self._generation += 1
+            self._count('misses' if cached is None else 'reloads')
+            return df
+
+    def _read(
+        self,
+        paths: List[Path],
+        reader: Callable[[Path, str], pd.DataFrame]
+    ) -> pd.DataFrame:
+        """
+        파일들을 읽어 하나의 DataFrame으로 합칩니다.
+        글롭/목록이 여러 파일로 펼쳐진 경우에만 파일명의 연도로 '연도' 열을 붙입니다.
+        (단일 파일 설정은 기존 열 구성 그대로 두고 파일명의 연도를
+        df.attrs[FILE_YEAR_ATTR]에 기록, 연도가 없는 파일명의 행은 '연도'가 비어 있음)
+        디스크 캐시에 없는 파일이 여러 개면 프로세스 풀에서 병렬로 파싱합니다.
+        """
+        if not paths:
+            raise FileNotFoundError(f"파일 없음: {self.config.data_dir}")
+        for path in paths:
+            if not path.exists():
+                raise FileNotFoundError(f"파일 없음: {path}")
+
+        frames: Dict[Path, pd.DataFrame] = {}
+        if self._disk_cache is not None:
+            for path in paths:
+                df = self._disk_cache.get(path)
+                if df is not None:
+                    frames[path] = df
+
+        missing = [path for path in paths if path not in frames]
+        workers = self.config.max_workers
+        if len(missing) > 1 and workers != 1:
+            workers = min(len(missing), workers or os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                parsed = pool.map(
+                    reader, missing, [self.config.encoding] * len(missing)
+                )
+                frames.update(zip(missing, parsed))
+        else:
+            for path in missing:
+                frames[path] = reader(path, self.config.encoding)
+
+        if self._disk_cache is not None:
+            for path in missing:
+                self._disk_cache.put(path, frames[path])
+
+        parts = []
+        for path in paths:
+            df = frames[path]
+            year = file_year(path) if len(paths) > 1 else None
+            if year is not None:
+                df.insert(1, '연도', year)
+            parts.append(df)
+        df = pd.concat(parts, ignore_index=True) if len(parts) > 1 else parts[0]
+        if '연도' in df.columns and df.columns.get_loc('연도') != 1:
+            columns = [col for col in df.columns if col != '연도']
+            df = df[columns[:1] + ['연도'] + columns[1:]]
+
+        if self.config.compact:
+            df = self._compact(df)
+        if len(paths) == 1:
+            df.attrs[FILE_YEAR_ATTR] = file_year(paths[0])
+        return df
+
+    @staticmethod
+    def _compact(df: pd.DataFrame) -> pd.DataFrame:
+        """지역명은 category로, 월별 수치는 가장 작은 숫자 타입으로 줄입니다."""
+        numerics = [
+            col for col in df.columns
+            if pd.api.types.is_numeric_dtype(df[col])
+        ]
+        return compact_dtypes(
+            df,
+            categories=('시도', '시군구'),
+            numerics=numerics,
+            dates=()
+        )
+
+    def load_volume_data(self, force_reload: bool = False) -> pd.DataFrame:
+        return self._load(
+            'volume', lambda: self.config.volume_paths, _read_volume_csv,
+            force_reload
+        )
+
+    def load_area_data(self, force_reload: bool = False) -> pd.DataFrame:
+        return self._load(
+            'area', lambda: self.config.area_paths, _read_area_csv,
+            force_reload
+        )
+
+    def refresh(self) -> int:
+        """
+        이미 로드된 데이터셋의 원본 변경 여부를 확인하고(필요하면 재로드)
+        현재 generation을 반환합니다. 원본 확인은 reload_check_interval을 따릅니다.
+        """
+        if self._volume_cache is not None:
+            self.load_volume_data()
+        if self._area_cache is not None:
+            self.load_area_data()
+        return self._generation
+
     def clear_cache(self):
-        self._volume_cache = None
-        self._area_cache = None
\ No newline at end of file
+        with self._locks['volume'], self._locks['area']:
+            self._volume_cache = None
+            self._area_cache = None
+            self._signatures = {'volume': None, 'area': None}
+            self._generation += 1
@@ -0,0 +1,85 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable
+
+
+class ResultCache:
+    """
+    분석 결과를 보관하는 크기 제한 LRU 캐시
+
+    데이터 generation이 바뀌면(로더 재로드) 보관된 결과를 모두 버립니다.
+    """
+
+    def __init__(self, maxsize: int = 128):
+        """
+        Args:
+            maxsize (int): 보관할 최대 결과 수 (0이면 캐시하지 않음)
+        """
+        self.maxsize = maxsize
+        self._entries: 'OrderedDict[Hashable, Any]' = OrderedDict()
+        self._generation = None
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def _sync(self, generation: int) -> None:
+        """generation이 바뀌었으면 비웁니다. (잠금 안에서 호출)"""
+        if generation != self._generation:
+            self._entries.clear()
+            self._generation = generation
+
+    def get_or_compute(
+        self,
+        key: Hashable,
+        generation: int,
+        compute: Callable[[], Any],
+        current_generation: Callable[[], int]
+    ) -> Any:
+        """
+        캐시된 결과를 반환하거나, compute()로 계산해 저장합니다.
+
+        Args:
+            key: 정규화된 호출 인자
+            generation: 조회 시점의 데이터 generation
+            compute: 결과 계산 함수
+            current_generation: 계산 직후의 generation을 알려주는 함수
+                (generation과 다르면 결과를 캐시하지 않고 그대로 반환)
+        """
+        with self._lock:
+            self._sync(generation)
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return self._entries[key]
+            self._misses += 1
+
+        # 계산은 잠금 밖에서 (다른 키 조회를 막지 않도록)
+        result = compute()
+
+        # 계산 중에 재로드되었으면 이전 데이터로 만든 결과이므로 저장하지 않음
+        if self.maxsize > 0:
+            with self._lock:
+                if current_generation() != generation:
+                    return result
+                self._sync(generation)
+                self._entries[key] = result
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+        return result
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def info(self) -> Dict[str, Any]:
+        """적중/미스 횟수, 적중률, 현재 크기"""
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                'hits': self._hits,
+                'misses': self._misses,
+                'hit_rate': round(self._hits / total, 4) if total else 0.0,
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+            }
@@ -1,3 +1,6 @@
+import os
+
+import numpy as np
 import pandas as pd
 from dateutil import parser
 
@@ -27,45 +30,110 @@ def safe_numeric(df, col):
 
 # 날짜열 정리 함수
 
-def clean_date_column(df, date_name):
+# 일괄 변환할 날짜 형식 (실제 데이터에 나타나는 형식 위주)
+_BULK_DATE_FORMATS = [
+    f"{date}{time}"
+    for date in ('%Y-%m-%d', '%Y.%m.%d', '%Y%m%d')
+    for time in ('', ' %H:%M', ' %H:%M:%S')
+]
+
+_EMPTY_DATE_TEXT = ['', 'nan', 'none', 'nat']
+
+
+def _parse_date_safe(x):
+    """dateutil 기반의 느린 범용 파서 (일괄 변환에 실패한 값에만 사용)"""
+    if not x or x.lower() in _EMPTY_DATE_TEXT:
+        return pd.NaT
+    try:
+        # yearfirst=True : YYYY-MM-DD 우선
+        # fuzzy=True : "0:00" 같은 잔여 텍스트 무시
+        return parser.parse(x, yearfirst=True, fuzzy=True)
+    except Exception:
+        return pd.NaT
+
+
+def clean_date_column(df, date_name, verbose=False):
     """
     주어진 날짜 열(date_col)에 존재하는 다양한 날짜 형식을 datetime 형식으로 통일합니다.
-    원본 DataFrame은 수정하지 않으며, 복사본을 반환합니다.
+
+    자주 쓰이는 형식(YYYY-MM-DD, YYYY.MM.DD, YYYYMMDD, 시간 포함 여부)은
+    형식별로 한 번에 pd.to_datetime(format=...)으로 변환하고,
+    어느 형식에도 맞지 않는 나머지 값만 dateutil(fuzzy) 파서로 처리합니다.
+    경로별 처리 행 수는 df.attrs['date_parse_report']에 기록됩니다.
 
     매개변수:
         df (pd.DataFrame): 원본 데이터프레임
         date_col (str): 날짜가 포함된 열 이름
+        verbose (bool): True이면 경로별 처리 행 수를 출력합니다.
 
     반환값:
-        pd.DataFrame: 날짜가 datetime 형식으로 변환된 DataFrame 복사본
+        pd.DataFrame: 날짜가 datetime 형식으로 변환된 DataFrame
     """
+    if pd.api.types.is_datetime64_any_dtype(df[date_name]):
+        return df
 
-    # 1. 문자열 변환 + 특수 공백 제거
-    df[date_name] = (
-        df[date_name]
+    # 1. 고유값 단위로 처리 (같은 날짜 문자열이 수없이 반복되므로)
+    codes, uniques = pd.factorize(df[date_name], use_na_sentinel=False)
+    weights = pd.Series(np.bincount(codes, minlength=len(uniques)))
+
+    # 2. 문자열 변환 + 특수 공백 제거
+    text = (
+        pd.Series(uniques, dtype=object)
         .astype(str)
         .str.strip()
-        .str.replace(r'[\u00A0\u202F\u3000]', '', regex=True)  # 비정상 공백 제거
+        .str.replace('[\u00A0\u202F\u3000]', '', regex=True)  # 비정상 공백 제거
         .str.replace(r'[^\x00-\x7F]', '', regex=True)  # 비ASCII 문자 제거 (숨은 BOM 등)
+        .str.strip()
     )
 
-    # 2. 안전한 파서 정의
-    def parse_date_safe(x):
-        if not x or x.lower() in ["nan", "none", "nat"]:
-            return pd.NaT
-        try:
-            # yearfirst=True : YYYY-MM-DD 우선
-            # fuzzy=True : "0:00" 같은 잔여 텍스트 무시
-            return parser.parse(x, yearfirst=True, fuzzy=True)
-        except Exception:
-            return pd.NaT
+    parsed_uniques = pd.Series(pd.NaT, index=text.index, dtype='datetime64[ns]')
+    report = {'bulk': {}, 'fuzzy': 0, 'failed': 0, 'empty': 0}
+
+    # 3. 빈 값 제외
+    empty = text.str.lower().isin(_EMPTY_DATE_TEXT)
+    report['empty'] = int(weights[empty].sum())
+    remaining = text[~empty]
+
+    # 4. 형식별 일괄 변환
+    for fmt in _BULK_DATE_FORMATS:
+        if remaining.empty:
+            break
+        parsed = pd.to_datetime(remaining, format=fmt, errors='coerce')
+        hit = parsed.notna()
+        if not hit.any():
+            continue
+        parsed_uniques[hit[hit].index] = parsed[hit]
+        report['bulk'][fmt] = int(weights[hit[hit].index].sum())
+        remaining = remaining[~hit]
+
+    # 5. 남은 값만 느린 범용 파서로 변환
+    if not remaining.empty:
+        fuzzy = pd.to_datetime(
+            pd.Series([_parse_date_safe(x) for x in remaining],
+                      index=remaining.index, dtype=object),
+            errors='coerce'
+        )
+        ok = fuzzy.notna()
+        parsed_uniques[ok[ok].index] = fuzzy[ok]
+        report['fuzzy'] = int(weights[ok[ok].index].sum())
+        report['failed'] = int(weights[ok[~ok].index].sum())
+
+    result = pd.Series(
+        parsed_uniques.to_numpy()[codes],
+        index=df.index,
+        name=date_name
+    )
 
-    # 3. 변환 수행
-    df[date_name] = df[date_name].apply(parse_date_safe)
+    df[date_name] = result
+    df.attrs['date_parse_report'] = report
 
-    # 4. 결과 타입 확인
-    if not pd.api.types.is_datetime64_any_dtype(df[date_name]):
-        df[date_name] = pd.to_datetime(df[date_name], errors='coerce')
+    if verbose:
+        bulk = ', '.join(f"{k}={v}" for k, v in report['bulk'].items()) or '-'
+        print(
+            f"[clean_date_column] 일괄 변환: {bulk} / "
+            f"범용 파서: {report['fuzzy']} / 실패: {report['failed']} / "
+            f"빈 값: {report['empty']}"
+        )
 
     return df
 
@@ -267,3 +335,340 @@ def week_stat(df, date_col, value_col, stats=None):
     )
 
     return result
+
+
+
+# 통합 집계 / 스트리밍 통계 함수
+
+
+# 부분 집계 항목: 평균은 합계/건수로 복원하므로 따로 보관하지 않음
+_PARTIAL_AGG = {'sum': 'sum', 'count': 'sum', 'min': 'min', 'max': 'max'}
+
+_STAT_COLUMNS = {
+    '합계': 'sum',
+    '평균': 'mean',
+    '최대': 'max',
+    '최소': 'min',
+    '거래건수': 'count'
+}
+
+PERIODS = ('일간', '주간', '월간', '년간')
+
+
+def _period_key(dates, period):
+    """
+    기간별 그룹 키를 만듭니다. 청크 간 병합이 가능하도록 문자열이 아닌
+    날짜(일/주시작일/월초) 또는 정수(년도) 값을 사용합니다.
+    """
+    if period == '일간':
+        return dates.dt.normalize()
+    if period == '주간':
+        day = dates.dt.normalize()
+        return day - pd.to_timedelta(day.dt.weekday, unit='D')
+    if period == '월간':
+        return dates.dt.to_period('M').dt.to_timestamp()
+    if period == '년간':
+        return dates.dt.year
+    raise ValueError(f"지원하지 않는 기간: {period}")
+
+
+def _partial_agg(values, keys):
+    """한 청크의 기간 키별 합계/건수/최소/최대 부분 집계를 계산합니다."""
+    return values.groupby(keys).agg(['sum', 'count', 'min', 'max'])
+
+
+def _merge_partials(partials):
+    """여러 부분 집계를 기간 키 기준으로 합칩니다."""
+    partials = [p for p in partials if p is not None and not p.empty]
+    if not partials:
+        return None
+    if len(partials) == 1:
+        return partials[0]
+    return pd.concat(partials).groupby(level=0).agg(_PARTIAL_AGG)
+
+
+def _finalize_partial(partial, period, stats=None):
+    """
+    부분 집계를 *_stat 함수와 같은 형태의 결과 DataFrame으로 변환합니다.
+    """
+    if stats is None:
+        stats = list(_STAT_COLUMNS.keys())
+    stats = [k for k in stats if k in _STAT_COLUMNS]
+
+    if partial is None:
+        index = (pd.Index([], dtype='int64') if period == '년간'
+                 else pd.DatetimeIndex([]))
+        partial = pd.DataFrame(
+            {'sum': [], 'count': [], 'min': [], 'max': []},
+            index=index
+        )
+
+    partial = partial.sort_index()
+    partial = partial.assign(mean=partial['sum'] / partial['count'])
+    body = pd.DataFrame(
+        {k: partial[_STAT_COLUMNS[k]].to_numpy() for k in stats},
+        columns=stats
+    )
+    key = pd.Series(partial.index)
+
+    if period == '일간':
+        head = pd.DataFrame({'거래일': key.dt.strftime('%Y-%m-%d')})
+    elif period == '주간':
+        head = pd.DataFrame({
+            '년월': key.dt.strftime('%Y.%m'),
+            '주차': key.dt.isocalendar()['week'],
+            '주시작일': key
+        })
+    elif period == '월간':
+        head = pd.DataFrame({'년월': key.dt.strftime('%Y.%m')})
+    else:
+        head = pd.DataFrame({'년도': key.astype(int)})
+
+    result = pd.concat([head, body], axis=1)
+    if period == '주간':
+        result = result.sort_values(['년월', '주차']).reset_index(drop=True)
+    return result
+
+
+def _daily_partial(dates, values):
+    """거래 단위 데이터를 일 단위 부분 집계(합계, 건수, 최소, 최대)로 줄입니다."""
+    return _partial_agg(values, _period_key(dates, '일간'))
+
+
+def _rollup_partial(daily, period):
+    """일 단위 부분 집계로부터 주/월/년 단위 부분 집계를 만듭니다."""
+    if daily is None or period == '일간':
+        return daily
+    keys = _period_key(daily.index.to_series(), period).to_numpy()
+    return daily.groupby(keys).agg(_PARTIAL_AGG)
+
+
+def rollup_stats(df, date_col, value_col, periods=None, stats=None):
+    """
+    일별/주간/월별/년도별 거래 통계를 한 번에 계산합니다.
+    원본은 복사하지 않고 한 번만 훑어 일 단위 부분 집계를 만든 뒤,
+    작은 일별 테이블로부터 주/월/년 통계를 파생합니다.
+
+    매개변수:
+        df (pd.DataFrame): 원본 데이터프레임 (수정하지 않음)
+        date_col (str): 날짜가 포함된 열 이름
+        value_col (str): 거래금액이 포함된 열 이름
+        periods (list[str], 선택): 계산할 기간. 지정하지 않으면 모든 기간을 계산합니다.
+        stats (list[str], 선택): 계산할 통계 항목. 지정하지 않으면 모두 계산합니다.
+
+    반환값:
+        dict[str, pd.DataFrame]: 기간 이름('일간', '주간', '월간', '년간') → 통계 결과
+            각 결과는 day_stat, week_stat, month_stat, year_stat과 같은 형태입니다.
+    """
+    if periods is None:
+        periods = list(PERIODS)
+
+    dates = df[date_col]
+    if not pd.api.types.is_datetime64_any_dtype(dates):
+        dates = pd.to_datetime(dates, errors='coerce')
+
+    values = df[value_col]
+    if not pd.api.types.is_numeric_dtype(values):
+        values = values.astype(str).str.replace(',', '', regex=False).astype(float)
+
+    daily = _merge_partials([_daily_partial(dates, values)])
+    return {
+        p: _finalize_partial(_rollup_partial(daily, p), p, stats)
+        for p in periods
+    }
+
+
+def stream_stats(file_path, date_col, value_col, periods=None, stats=None,
+                 chunksize=500_000, clean_dates=True, **read_csv_kwargs):
+    """
+    대용량 거래 CSV를 청크 단위로 읽으며 기간별 거래 통계를 계산합니다.
+    청크마다 일 단위 부분 집계(합계, 건수, 최소, 최대)를 만들어 누적 병합하고
+    마지막에 주/월/년 통계를 파생하므로, 최대 메모리 사용량은 파일 크기가 아닌
+    청크 크기에 비례합니다.
+
+    매개변수:
+        file_path (str): 거래 데이터 CSV 경로
+        date_col (str): 날짜가 포함된 열 이름
+        value_col (str): 거래금액이 포함된 열 이름
+        periods (list[str], 선택): 계산할 기간. 예: ['일간', '월간'] 지정하지 않으면 모든 기간을 계산합니다.
+        stats (list[str], 선택): 계산할 통계 항목. 지정하지 않으면 모두 계산합니다.
+        chunksize (int): 한 번에 읽을 행 수
+        clean_dates (bool): True이면 clean_date_column으로 날짜를 정리합니다.
+        **read_csv_kwargs: pd.read_csv에 전달할 추가 인자 (encoding 등)
+
+    반환값:
+        dict[str, pd.DataFrame]: 기간 이름('일간', '주간', '월간', '년간') → 통계 결과
+            각 결과는 day_stat, week_stat, month_stat, year_stat과 같은 형태입니다.
+    """
+    if periods is None:
+        periods = list(PERIODS)
+
+    daily = None
+
+    reader = pd.read_csv(
+        file_path,
+        usecols=[date_col, value_col],
+        chunksize=chunksize,
+        **read_csv_kwargs
+    )
+    for chunk in reader:
+        if clean_dates:
+            chunk = clean_date_column(chunk, date_col)
+        chunk = safe_datetime(chunk, date_col)
+        chunk = safe_numeric(chunk, value_col)
+
+        part = _daily_partial(chunk[date_col], chunk[value_col])
+        daily = _merge_partials([daily, part])
+
+    return {
+        p: _finalize_partial(_rollup_partial(daily, p), p, stats)
+        for p in periods
+    }
+
+
+# 증분 집계 (일 단위 상태 저장 / 추가분 반영)
+
+# 상태 파일 형식 버전 (열 구성이 바뀌면 올림)
+DAILY_STATE_VERSION = 1
+
+
+class DailyStats:
+    """
+    일 단위 부분 집계(합계, 건수, 최소, 최대)를 보관하는 증분 집계 상태입니다.
+    새 거래가 들어오면 update로 해당 일자만 병합하고, 그 일자가 속한
+    주/월/년만 다시 계산하므로 갱신 비용이 전체 이력이 아닌 추가분에 비례합니다.
+    save / load로 작은 .npz 파일에 저장해 두고 다음 실행에서 이어 씁니다.
+
+    사용 예:
+        state = DailyStats.from_frame(df, '거래일', '거래금액')
+        state.save('daily_state.npz')
+
+        state = DailyStats.load('daily_state.npz')
+        state.update(new_rows, '거래일', '거래금액')
+        state.save('daily_state.npz')
+        result = state.stats()   # rollup_stats와 같은 형태
+    """
+
+    def __init__(self, daily=None):
+        self.daily = None if daily is None or daily.empty else daily.sort_index()
+        self._periods = {}  # 기간 → 부분 집계 (필요할 때 만들고 update 때 부분 갱신)
+
+    def __len__(self):
+        return 0 if self.daily is None else len(self.daily)
+
+    @classmethod
+    def from_frame(cls, df, date_col, value_col):
+        """거래 데이터 전체로부터 상태를 만듭니다."""
+        state = cls()
+        state.update(df, date_col, value_col)
+        return state
+
+    def update(self, new_rows, date_col='거래일', value_col='거래금액'):
+        """
+        새 거래 행을 상태에 반영합니다.
+        새 행이 있는 일자만 기존 값과 병합하고, 그 일자가 속한 주/월/년의
+        부분 집계만 일 단위 상태에서 다시 계산합니다.
+
+        매개변수:
+            new_rows (pd.DataFrame): 추가된 거래 데이터 (수정하지 않음)
+            date_col (str): 날짜가 포함된 열 이름
+            value_col (str): 거래금액이 포함된 열 이름
+
+        반환값:
+            dict[str, pd.Index]: 기간 이름 → 값이 바뀐 기간 키
+                (일간/주간/월간은 일자/주시작일/월초, 년간은 년도)
+        """
+        dates = new_rows[date_col]
+        if not pd.api.types.is_datetime64_any_dtype(dates):
+            dates = pd.to_datetime(dates, errors='coerce')
+
+        values = new_rows[value_col]
+        if not pd.api.types.is_numeric_dtype(values):
+            values = values.astype(str).str.replace(',', '', regex=False).astype(float)
+
+        part = _daily_partial(dates, values)
+        if part.empty:
+            return {p: pd.Index([]) for p in PERIODS}
+
+        # 1. 새 행이 있는 일자만 기존 일 단위 값과 병합
+        touched = part.index
+        if self.daily is None:
+            self.daily = part.sort_index()
+        else:
+            old = self.daily.index.intersection(touched)
+            merged = _merge_partials([self.daily.loc[old], part])
+            self.daily = pd.concat([self.daily.drop(old), merged]).sort_index()
+
+        # 2. 바뀐 일자가 속한 주/월/년만 일 단위 상태에서 다시 계산
+        changed = {'일간': touched.sort_values()}
+        day_keys = touched.to_series()
+        for period in PERIODS[1:]:
+            keys = pd.Index(_period_key(day_keys, period).unique()).sort_values()
+            changed[period] = keys
+            current = self._periods.get(period)
+            if current is None:
+                continue  # 아직 만들지 않은 기간은 stats 호출 시 한 번에 만듦
+            all_keys = _period_key(self.daily.index.to_series(), period).to_numpy()
+            fresh = _rollup_partial(self.daily[np.isin(all_keys, keys)], period)
+            self._periods[period] = pd.concat(
+                [current.drop(current.index.intersection(keys)), fresh]
+            ).sort_index()
+        return changed
+
+    def partial(self, period):
+        """기간별 부분 집계(합계, 건수, 최소, 최대)를 반환합니다."""
+        if period == '일간':
+            return self.daily
+        if period not in PERIODS:
+            raise ValueError(f"지원하지 않는 기간: {period}")
+        if period not in self._periods and self.daily is not None:
+            self._periods[period] = _rollup_partial(self.daily, period)
+        return self._periods.get(period)
+
+    def stats(self, periods=None, stats=None):
+        """
+        현재 상태의 기간별 통계를 계산합니다.
+
+        반환값:
+            dict[str, pd.DataFrame]: rollup_stats와 같은 형태의 결과
+        """
+        if periods is None:
+            periods = list(PERIODS)
+        return {
+            p: _finalize_partial(self.partial(p), p, stats)
+            for p in periods
+        }
+
+    def save(self, path):
+        """
+        상태를 압축된 .npz 파일로 저장합니다. (일자별 한 행, 임시 파일에 쓴 뒤 교체)
+        """
+        daily = self.daily
+        if daily is None:
+            daily = pd.DataFrame(
+                {'sum': [], 'count': [], 'min': [], 'max': []},
+                index=pd.DatetimeIndex([])
+            )
+        tmp = f"{path}.tmp"
+        with open(tmp, 'wb') as f:
+            np.savez_compressed(
+                f,
+                version=np.array(DAILY_STATE_VERSION),
+                day=daily.index.to_numpy().astype('datetime64[D]'),
+                **{col: daily[col].to_numpy() for col in _PARTIAL_AGG}
+            )
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path):
+        """save로 저장한 상태 파일을 읽습니다."""
+        with np.load(path) as data:
+            version = int(data['version'])
+            if version != DAILY_STATE_VERSION:
+                raise ValueError(f"지원하지 않는 상태 파일 버전: {version}")
+            index = pd.DatetimeIndex(data['day'].astype('datetime64[ns]'))
+            daily = pd.DataFrame(
+                {col: data[col] for col in _PARTIAL_AGG},
+                index=index
+            )
+        return cls(daily)
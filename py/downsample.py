@@ -0,0 +1,76 @@
+import numpy as np
+
+
+# 시계열 차트용 다운샘플링 (Largest-Triangle-Three-Buckets)
+
+def _bucket_edges(n, n_out):
+    """가운데 점들(첫/마지막 점 제외)을 n_out - 2개 구간으로 나눈 경계"""
+    return np.floor(np.linspace(1, n - 1, n_out - 1)).astype(np.int64)
+
+
+def lttb_indices(x, y, n_out):
+    """
+    LTTB 방식으로 시계열을 n_out개 점으로 줄일 때 남길 점의 인덱스를 반환합니다.
+    첫 점과 마지막 점은 항상 포함되며, 각 구간에서는 (이전에 고른 점, 다음 구간 평균)과
+    만드는 삼각형의 넓이가 가장 큰 점을 고릅니다.
+
+    매개변수:
+        x (array-like): 정렬된 x 값 (예: 1970-01-01 기준 일 코드)
+        y (array-like): y 값 (결측은 0으로 취급)
+        n_out (int): 남길 점의 수 (3 이상)
+
+    반환값:
+        np.ndarray: 오름차순 인덱스 (n_out >= len(x)이면 전체)
+    """
+    if n_out < 3:
+        raise ValueError(f"n_out은 3 이상이어야 합니다. ({n_out})")
+
+    x = np.asarray(x, dtype='float64')
+    y = np.nan_to_num(np.asarray(y, dtype='float64'))
+    n = len(x)
+    if n_out >= n:
+        return np.arange(n)
+
+    edges = _bucket_edges(n, n_out)
+    starts, ends = edges[:-1], edges[1:]
+
+    # 구간별 평균점 (다음 구간 평균으로 사용, 마지막 구간 다음은 마지막 점)
+    counts = ends - starts
+    avg_x = np.add.reduceat(x[:-1], starts) / counts
+    avg_y = np.add.reduceat(y[:-1], starts) / counts
+    next_x = np.append(avg_x[1:], x[-1])
+    next_y = np.append(avg_y[1:], y[-1])
+
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for i, (lo, hi) in enumerate(zip(starts.tolist(), ends.tolist())):
+        bx, by = x[lo:hi], y[lo:hi]
+        area = np.abs(
+            (x[a] - next_x[i]) * (by - y[a])
+            - (x[a] - bx) * (next_y[i] - y[a])
+        )
+        a = lo + int(np.argmax(area))
+        selected[i + 1] = a
+    return selected
+
+
+def lttb_union(x, ys, n_out):
+    """
+    같은 x축에 여러 열을 그릴 때, 열마다 LTTB로 고른 점을 합친 인덱스를 반환합니다.
+    점 개수 예산 n_out을 열 수로 나누어 쓰므로(열마다 최소 3개) 결과는
+    max(n_out, 열 수 × 3)개를 넘지 않습니다.
+
+    매개변수:
+        x (array-like): 정렬된 x 값
+        ys (list[array-like]): 열별 y 값
+        n_out (int): 남길 점의 최대 수 (3 이상)
+
+    반환값:
+        np.ndarray: 오름차순 인덱스
+    """
+    if not ys:
+        raise ValueError("ys에 열이 하나 이상 있어야 합니다.")
+    per_column = max(3, n_out // len(ys))
+    picked = [lttb_indices(x, y, per_column) for y in ys]
+    return np.unique(np.concatenate(picked))
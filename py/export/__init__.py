@@ -0,0 +1,15 @@
+"""
+JSON 내보내기(export) 패키지 (py/tojson.ipynb 대체)
+
+사용 예시:
+    python -m py.export              # 입력 CSV나 코드가 바뀐 출력만 다시 생성
+    python -m py.export --dry-run    # 다시 만들 출력만 표시
+    python -m py.export --only 일간,주간 --force
+    python -m py.export --workers 4  # 독립 출력은 프로세스 4개로 병렬 생성
+    python -m py.export --compact    # 최소 JSON + .gz / .br 압축본 (배포용)
+    python -m py.export --arrow file # JSON과 함께 Arrow IPC 파일(.arrow) 저장 (분석용)
+"""
+
+from .pipeline import INPUTS, TARGETS, build, execute, plan
+
+__all__ = ['INPUTS', 'TARGETS', 'build', 'execute', 'plan']
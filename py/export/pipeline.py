@@ -0,0 +1,663 @@
+"""
+증분(incremental) JSON 내보내기 파이프라인
+
+출력 파일마다 입력 CSV의 내용 해시와 그 출력을 만드는 코드의 해시를 매니페스트에
+기록하고, 다음 실행에서는 입력·코드·형식 중 하나라도 바뀐 출력만 다시 만듭니다.
+입력 해시는 파일 (크기, 수정 시각)이 그대로이면 매니페스트에 저장된 값을 재사용합니다.
+
+다시 만들 출력은 작업(task) 단위로 묶어 프로세스 풀에서 병렬로 생성합니다.
+여러 작업이 함께 쓰는 큰 중간 결과(정제된 거래 데이터)는 한 번만 만들어 열별 .npy로
+저장하고, 각 작업은 pickle 전달 없이 memory-map으로 읽습니다.
+
+--compact 모드는 공백 없는 JSON과 함께 .gz / .br 압축본을 저장합니다.
+(정적 파일 라우트가 요청마다 압축하지 않고 압축본을 그대로 전송)
+
+--arrow file|stream 옵션은 출력마다 dtype이 유지되는 Arrow IPC 파일(.arrow / .arrows)을
+JSON 옆에 함께 저장합니다. (pandas / Polars에서 JSON 파싱 없이 memory-map으로 읽기)
+"""
+import argparse
+import hashlib
+import inspect
+import json
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .. import date_cmp as dc
+from .. import floor as flo
+from .. import serialize as sz
+from ..core.loader import _read_area_csv, _read_volume_csv
+
+ROOT_DIR = Path(__file__).resolve().parent.parent.parent
+DEFAULT_DATA_DIR = ROOT_DIR / 'data'
+DEFAULT_OUT_DIR = ROOT_DIR / 'py'
+MANIFEST_NAME = '.export_manifest.json'
+MANIFEST_VERSION = 1
+FORMATS = ('records', 'columns')
+ARROW_KINDS = tuple(sz.ARROW_SUFFIXES)
+
+# 입력 이름 → data_dir 기준 파일명
+INPUTS = {
+    'transactions': 'apt_20y_data.csv',
+    'deal': '(월) 거래규모별 아파트거래현황.csv',
+    'volume': '2020년 광역 지자체별 아파트 거래량.csv',
+    'area': '2020년 지자체 거래 호수 및 면적 통계자료.csv',
+}
+
+
+# --- 중간 결과 (한 번 실행하는 동안 같은 CSV는 한 번만 파싱) ---
+
+def _load_transactions(run):
+    df = pd.read_csv(run.paths['transactions'])
+    df = dc.clean_date_column(df, '거래일')
+    # 쉼표가 든 금액 문자열 → 실수 (공유 중간 결과를 memory-map 가능한 숫자 열로)
+    return dc.safe_numeric(df, '거래금액')
+
+
+def _load_rollup(run):
+    return dc.rollup_stats(run.get('transactions'), '거래일', '거래금액')
+
+
+def _load_volume(run):
+    return _read_volume_csv(run.paths['volume'], 'utf-8-sig')
+
+
+def _load_area(run):
+    return _read_area_csv(run.paths['area'], 'utf-8-sig')
+
+
+def _load_deal(run):
+    return pd.read_csv(run.paths['deal'])
+
+
+LOADERS: Dict[str, Callable[['Run'], Any]] = {
+    'transactions': _load_transactions,
+    'rollup': _load_rollup,
+    'volume': _load_volume,
+    'area': _load_area,
+    'deal': _load_deal,
+}
+
+
+# 작업 간에 memory-map으로 공유하는 중간 결과 → 저장할 열
+STAGED = {
+    'transactions': ('거래일', '거래금액', '층'),
+}
+
+
+def save_columns(df: pd.DataFrame, columns: Tuple[str, ...], path: Path) -> None:
+    """
+    DataFrame의 열을 열마다 .npy 파일로 저장합니다. (memory-map으로 다시 열 수 있도록)
+    숫자/날짜/불리언 열만 허용하며, object 열은 pickle 복사가 되므로 TypeError를 냅니다.
+    """
+    path.mkdir(parents=True, exist_ok=True)
+    names = []
+    for i, col in enumerate(columns):
+        values = df[col].to_numpy()
+        if values.dtype.kind not in 'biufmM':
+            raise TypeError(
+                f"memory-map으로 공유할 수 없는 열입니다: {col} ({values.dtype})"
+            )
+        np.save(path / f"{i}.npy", values, allow_pickle=False)
+        names.append(col)
+    (path / 'columns.json').write_text(
+        json.dumps(names, ensure_ascii=False), encoding='utf-8'
+    )
+
+
+def load_columns(path: Path) -> pd.DataFrame:
+    """save_columns로 저장한 열을 복사 없이(memory-map) DataFrame으로 엽니다."""
+    names = json.loads((path / 'columns.json').read_text(encoding='utf-8'))
+    columns = {}
+    for i, name in enumerate(names):
+        values = np.load(path / f"{i}.npy", mmap_mode='r')
+        columns[name] = pd.Series(values, name=name, copy=False)
+    return pd.DataFrame(columns, copy=False)
+
+
+class Run:
+    """
+    한 프로세스에서 읽은 입력과 중간 결과를 보관합니다.
+    stage_dir에 저장된 중간 결과가 있으면 다시 계산하지 않고 memory-map으로 엽니다.
+    """
+
+    def __init__(self, paths: Dict[str, Path], stage_dir: Optional[Path] = None):
+        self.paths = paths
+        self.stage_dir = stage_dir
+        self._values: Dict[str, Any] = {}
+
+    def get(self, name: str) -> Any:
+        if name not in self._values:
+            staged = None if self.stage_dir is None else self.stage_dir / name
+            if staged is not None and (staged / 'columns.json').exists():
+                self._values[name] = load_columns(staged)
+            else:
+                self._values[name] = LOADERS[name](self)
+        return self._values[name]
+
+
+# --- 출력 정의 ---
+
+def _rollup_period(period):
+    def build(run):
+        return run.get('rollup')[period]
+    return build
+
+
+def _build_floor(run):
+    return flo.floor_home(run.get('transactions')['층'])
+
+
+def _build_volume(run):
+    return run.get('volume')
+
+
+def _build_area(run):
+    return run.get('area')
+
+
+def _build_area_months(run):
+    columns = ['시도', '시군구'] + [f"{m}월_면적" for m in range(1, 13)]
+    return run.get('area').loc[:, columns]
+
+
+def _build_deal(run):
+    return flo.mu_home(run.get('deal'))
+
+
+@dataclass(frozen=True)
+class Target:
+    """출력 파일 하나의 정의"""
+
+    task: str  # 같은 프로세스에서 함께 만드는 출력 묶음 (중간 결과 공유)
+    inputs: Tuple[str, ...]  # INPUTS 이름
+    uses: Tuple[str, ...]  # LOADERS 이름 (코드 해시에 포함)
+    modules: Tuple[Any, ...]  # 결과에 영향을 주는 모듈 (소스 파일 해시에 포함)
+    build: Callable[[Run], pd.DataFrame]
+
+
+_ROLLUP = dict(task='rollup', inputs=('transactions',),
+               uses=('transactions', 'rollup'), modules=(dc,))
+_AREA = dict(task='area', inputs=('area',), uses=('area',), modules=())
+
+# 출력 이름(파일명에서 .json 제외) → 정의, tojson.ipynb의 출력과 같음
+TARGETS: Dict[str, Target] = {
+    '일간': Target(build=_rollup_period('일간'), **_ROLLUP),
+    '주간': Target(build=_rollup_period('주간'), **_ROLLUP),
+    '월간': Target(build=_rollup_period('월간'), **_ROLLUP),
+    '년간': Target(build=_rollup_period('년간'), **_ROLLUP),
+    '층별': Target('floor', ('transactions',), ('transactions',), (dc, flo),
+                 _build_floor),
+    '월별 아파트 거래량': Target('volume', ('volume',), ('volume',), (),
+                          _build_volume),
+    '월별 아파트 거래 거래량 면적': Target(build=_build_area, **_AREA),
+    '월별 아파트 거래 면적': Target(build=_build_area_months, **_AREA),
+    '면적': Target('deal', ('deal',), ('deal',), (flo,), _build_deal),
+}
+
+
+# --- 해시 / 매니페스트 ---
+
+def file_sha256(path: Path) -> str:
+    """파일 내용의 SHA-256 (1MB 단위로 읽음)"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def code_hash(target: Target) -> str:
+    """
+    출력을 만드는 코드의 해시: 출력/중간 결과 함수 소스, 관련 모듈 소스 파일,
+    정제 함수가 있는 loader 모듈과 직렬화 모듈 소스, 그리고 이 모듈 소스
+    (출력 목록, 작업 묶기, 본문 구성, 중간 결과 열 정의가 모두 여기에 있음)
+    """
+    from ..core import loader
+    digest = hashlib.sha256()
+    for fn in [target.build] + [LOADERS[name] for name in target.uses]:
+        digest.update(inspect.getsource(fn).encode('utf-8'))
+    for module in target.modules + (loader, sz):
+        digest.update(Path(module.__file__).read_bytes())
+    digest.update(Path(__file__).read_bytes())
+    return digest.hexdigest()
+
+
+def load_manifest(path: Path) -> Dict[str, Any]:
+    """매니페스트를 읽습니다. (없거나 형식이 다르면 빈 매니페스트)"""
+    try:
+        manifest = json.loads(Path(path).read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        manifest = None
+    if not isinstance(manifest, dict) or manifest.get('version') != MANIFEST_VERSION:
+        manifest = {'version': MANIFEST_VERSION}
+    manifest.setdefault('inputs', {})
+    manifest.setdefault('outputs', {})
+    return manifest
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """임시 파일에 쓴 뒤 교체 (중간에 실패해도 이전 파일이 남음)"""
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def save_manifest(path: Path, manifest: Dict[str, Any]) -> None:
+    text = json.dumps(manifest, ensure_ascii=False, indent=2, sort_keys=True)
+    _write_atomic(Path(path), (text + '\n').encode('utf-8'))
+
+
+def input_hashes(
+    data_dir: Path,
+    names: List[str],
+    manifest: Dict[str, Any]
+) -> Dict[str, Optional[str]]:
+    """
+    입력 이름별 내용 해시 (파일이 없으면 None).
+    크기와 수정 시각이 매니페스트 기록과 같으면 다시 읽지 않습니다.
+    """
+    cache = manifest['inputs']
+    hashes = {}
+    for name in names:
+        file_name = INPUTS[name]
+        path = data_dir / file_name
+        try:
+            st = path.stat()
+        except OSError:
+            hashes[name] = None
+            continue
+        entry = cache.get(file_name)
+        if entry and entry['size'] == st.st_size and entry['mtime_ns'] == st.st_mtime_ns:
+            hashes[name] = entry['sha256']
+            continue
+        digest = file_sha256(path)
+        cache[file_name] = {
+            'size': st.st_size, 'mtime_ns': st.st_mtime_ns, 'sha256': digest
+        }
+        hashes[name] = digest
+    return hashes
+
+
+# --- 실행 계획 / 생성 ---
+
+def plan(
+    targets: List[str],
+    data_dir: Path,
+    out_dir: Path,
+    manifest: Dict[str, Any],
+    fmt: str = 'records',
+    force: bool = False,
+    compact: bool = False,
+    arrow: Optional[str] = None
+) -> Dict[str, Dict[str, Any]]:
+    """
+    출력별로 다시 만들어야 하는 이유를 계산합니다.
+
+    반환값:
+        {출력 이름: {'reason': 이유 또는 None(최신), 'inputs': {파일명: 해시},
+                   'code': 코드 해시, 'missing': 없는 입력 파일 목록}}
+    """
+    needed = sorted({name for t in targets for name in TARGETS[t].inputs})
+    hashes = input_hashes(data_dir, needed, manifest)
+
+    result = {}
+    for name in targets:
+        target = TARGETS[name]
+        inputs = {INPUTS[i]: hashes[i] for i in target.inputs}
+        code = code_hash(target)
+        missing = [f for f, h in inputs.items() if h is None]
+        entry = manifest['outputs'].get(f"{name}.json")
+        out_path = out_dir / f"{name}.json"
+
+        if missing:
+            reason = None
+        elif force:
+            reason = '강제 재생성'
+        elif entry is None:
+            reason = '기록 없음'
+        elif not out_path.exists():
+            reason = '출력 파일 없음'
+        elif entry.get('format') != fmt:
+            reason = f"형식 변경 ({entry.get('format')} → {fmt})"
+        elif entry.get('compact', False) != compact:
+            reason = '압축 모드 변경'
+        elif any(not Path(f"{out_path}{suffix}").exists()
+                 for suffix in entry.get('compressed', [])):
+            reason = '압축본 없음'
+        elif entry.get('arrow') != arrow:
+            reason = f"Arrow 출력 변경 ({entry.get('arrow')} → {arrow})"
+        elif arrow and not _arrow_path(out_dir, name, arrow).exists():
+            reason = 'Arrow 파일 없음'
+        elif entry.get('code') != code:
+            reason = '코드 변경'
+        elif entry.get('inputs') != inputs:
+            changed = [f for f, h in inputs.items()
+                       if entry.get('inputs', {}).get(f) != h]
+            reason = f"입력 변경: {', '.join(changed)}"
+        elif file_sha256(out_path) != entry.get('sha256'):
+            reason = '출력 파일이 수정됨'
+        else:
+            reason = None
+
+        result[name] = {
+            'reason': reason, 'inputs': inputs, 'code': code, 'missing': missing
+        }
+    return result
+
+
+def _arrow_path(out_dir: Path, name: str, kind: str) -> Path:
+    return out_dir / f"{name}{sz.ARROW_SUFFIXES[kind]}"
+
+
+def _write_arrow(df: pd.DataFrame, out_dir: Path, name: str,
+                 kind: Optional[str]) -> None:
+    """Arrow IPC 파일을 저장하고 다른 종류(또는 kind가 None이면 전부)의 이전 파일을 지웁니다."""
+    if kind is not None:
+        _write_atomic(_arrow_path(out_dir, name, kind), sz.arrow_bytes(df, kind))
+    for other in ARROW_KINDS:
+        if other != kind:
+            try:
+                os.remove(_arrow_path(out_dir, name, other))
+            except FileNotFoundError:
+                pass
+
+
+def _build_targets(
+    run: Run,
+    names: List[str],
+    out_dir: Path,
+    fmt: str,
+    compact: bool,
+    arrow: Optional[str] = None
+) -> Dict[str, Dict[str, Any]]:
+    """
+    출력들을 만들어 저장합니다. compact이면 최소 JSON과 .gz / .br 압축본을,
+    arrow('file' / 'stream')이면 Arrow IPC 파일도 씁니다.
+
+    반환값:
+        {출력 이름: {'sha256', 'rows', 'compressed', 'seconds'} 또는 {'error'}}
+    """
+    results = {}
+    for name in names:
+        start = time.perf_counter()
+        try:
+            df = TARGETS[name].build(run)
+            payload = sz.to_columns(df) if fmt == 'columns' else {name: df}
+            body = sz.dumps(payload, indent=not compact)
+            path = out_dir / f"{name}.json"
+            _write_atomic(path, body)
+            if compact:
+                compressed = sz.write_compressed(path, body)
+            else:
+                sz.remove_compressed(path)
+                compressed = []
+            _write_arrow(df, out_dir, name, arrow)
+        except Exception as e:
+            results[name] = {'error': f"{type(e).__name__}: {e}"}
+            continue
+        results[name] = {
+            'sha256': hashlib.sha256(body).hexdigest(),
+            'rows': len(df),
+            'compressed': compressed,
+            'seconds': round(time.perf_counter() - start, 3),
+        }
+    return results
+
+
+def _run_task(
+    names: List[str],
+    paths: Dict[str, Path],
+    stage_dir: Optional[Path],
+    out_dir: Path,
+    fmt: str,
+    compact: bool,
+    arrow: Optional[str] = None
+) -> Dict[str, Dict[str, Any]]:
+    """(작업 프로세스) 같은 작업의 출력들을 만들어 저장합니다."""
+    return _build_targets(Run(paths, stage_dir), names, out_dir, fmt, compact,
+                          arrow)
+
+
+def _run_stage(name: str, paths: Dict[str, Path], stage_dir: Path) -> None:
+    """(작업 프로세스) 공유 중간 결과를 만들어 열별 .npy로 저장합니다."""
+    save_columns(Run(paths).get(name), STAGED[name], stage_dir / name)
+
+
+def execute(
+    tasks: Dict[str, List[str]],
+    paths: Dict[str, Path],
+    out_dir: Path,
+    fmt: str = 'records',
+    workers: Optional[int] = None,
+    compact: bool = False,
+    arrow: Optional[str] = None
+) -> Dict[str, Dict[str, Any]]:
+    """
+    작업들을 의존 관계 순서대로 실행합니다.
+
+    - 서로 독립인 작업은 프로세스 풀에서 동시에 실행
+    - 두 개 이상 작업이 쓰는 STAGED 중간 결과는 먼저 한 번만 만들고,
+      그 중간 결과를 쓰는 작업은 완료 후 시작 (나머지 작업은 기다리지 않음)
+    - workers가 1이거나 작업이 하나뿐이면 현재 프로세스에서 순서대로 실행
+
+    매개변수:
+        tasks (dict): 작업 이름 → 출력 이름 목록
+        workers (int, 선택): 프로세스 수 (기본: CPU 코어 수)
+
+    반환값:
+        dict: 출력 이름 → _run_task 결과
+    """
+    workers = min(len(tasks), workers or os.cpu_count() or 1)
+    if workers <= 1:
+        run = Run(paths)
+        results = {}
+        for names in tasks.values():
+            results.update(_build_targets(run, names, out_dir, fmt, compact,
+                                          arrow))
+        return results
+
+    users: Dict[str, List[str]] = {}
+    for task, names in tasks.items():
+        for stage in sorted({u for n in names for u in TARGETS[n].uses}):
+            if stage in STAGED:
+                users.setdefault(stage, []).append(task)
+    shared = [stage for stage, tasks_ in users.items() if len(tasks_) > 1]
+    waiting = {
+        task: {stage for stage in shared if task in users[stage]}
+        for task in tasks
+    }
+
+    results: Dict[str, Dict[str, Any]] = {}
+    with tempfile.TemporaryDirectory(prefix='export-') as tmp, \
+            ProcessPoolExecutor(max_workers=workers) as pool:
+        stage_dir = Path(tmp)
+        stages = {
+            pool.submit(_run_stage, stage, paths, stage_dir): stage
+            for stage in shared
+        }
+        jobs = {}
+
+        def submit_ready():
+            for task in [t for t, deps in waiting.items() if not deps]:
+                del waiting[task]
+                future = pool.submit(
+                    _run_task, tasks[task], paths, stage_dir, out_dir, fmt,
+                    compact, arrow
+                )
+                jobs[future] = task
+
+        submit_ready()
+        pending = set(stages) | set(jobs)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future in stages:
+                    # 실패해도 각 작업이 직접 만들도록 두고 오류는 작업 결과로 보고
+                    for deps in waiting.values():
+                        deps.discard(stages[future])
+                    continue
+                try:
+                    results.update(future.result())
+                except Exception as e:  # 작업 프로세스 비정상 종료 등
+                    for name in tasks[jobs[future]]:
+                        results[name] = {'error': f"{type(e).__name__}: {e}"}
+            before = set(jobs)
+            submit_ready()
+            pending |= set(jobs) - before
+    return results
+
+
+def build(
+    targets: Optional[List[str]] = None,
+    data_dir: Path = DEFAULT_DATA_DIR,
+    out_dir: Path = DEFAULT_OUT_DIR,
+    manifest_path: Optional[Path] = None,
+    fmt: str = 'records',
+    force: bool = False,
+    dry_run: bool = False,
+    workers: Optional[int] = None,
+    compact: bool = False,
+    arrow: Optional[str] = None
+) -> Dict[str, Dict[str, Any]]:
+    """
+    바뀐 출력만 다시 만들고 매니페스트를 갱신합니다.
+
+    매개변수:
+        targets (list[str], 선택): 대상 출력 이름 (기본: 전체)
+        data_dir (Path): 입력 CSV 폴더
+        out_dir (Path): JSON 출력 폴더
+        manifest_path (Path, 선택): 매니페스트 경로 (기본: out_dir/.export_manifest.json)
+        fmt (str): 'records' ({"이름": [행, ...]}) 또는 'columns' ({"columns", "data"})
+        force (bool): True이면 변경 여부와 관계없이 모두 다시 생성
+        dry_run (bool): True이면 계획만 계산하고 파일은 쓰지 않음
+        workers (int, 선택): 병렬 프로세스 수 (기본: CPU 코어 수, 1이면 순차)
+        compact (bool): True이면 공백 없는 JSON과 .gz / .br 압축본 저장
+        arrow (str, 선택): 'file'(.arrow) 또는 'stream'(.arrows)이면 Arrow IPC 파일도 저장
+
+    반환값:
+        dict: 출력 이름 → {'status': 'built' | 'fresh' | 'skipped' | 'error' | 'planned',
+                          'reason', 'seconds', 'error'}
+    """
+    targets = list(TARGETS) if targets is None else list(targets)
+    data_dir, out_dir = Path(data_dir), Path(out_dir)
+    manifest_path = Path(manifest_path or out_dir / MANIFEST_NAME)
+    manifest = load_manifest(manifest_path)
+
+    steps = plan(targets, data_dir, out_dir, manifest, fmt=fmt, force=force,
+                 compact=compact, arrow=arrow)
+    report = {}
+    tasks: Dict[str, List[str]] = {}
+    for name, step in steps.items():
+        if step['missing']:
+            report[name] = {'status': 'skipped',
+                            'reason': f"입력 파일 없음: {', '.join(step['missing'])}"}
+        elif step['reason'] is None:
+            report[name] = {'status': 'fresh', 'reason': None}
+        elif dry_run:
+            report[name] = {'status': 'planned', 'reason': step['reason']}
+        else:
+            tasks.setdefault(TARGETS[name].task, []).append(name)
+
+    if tasks:
+        out_dir.mkdir(parents=True, exist_ok=True)
+        paths = {name: data_dir / file_name for name, file_name in INPUTS.items()}
+        results = execute(tasks, paths, out_dir, fmt=fmt, workers=workers,
+                          compact=compact, arrow=arrow)
+        for name, result in results.items():
+            step = steps[name]
+            if 'error' in result:
+                report[name] = {'status': 'error', 'reason': step['reason'],
+                                'error': result['error']}
+                continue
+            manifest['outputs'][f"{name}.json"] = {
+                'inputs': step['inputs'],
+                'code': step['code'],
+                'format': fmt,
+                'compact': compact,
+                'compressed': result['compressed'],
+                'arrow': arrow,
+                'sha256': result['sha256'],
+                'rows': result['rows'],
+                'built_at': datetime.now().isoformat(timespec='seconds'),
+            }
+            report[name] = {'status': 'built', 'reason': step['reason'],
+                            'seconds': result['seconds']}
+
+    if not dry_run:
+        save_manifest(manifest_path, manifest)
+    return report
+
+
+# --- 실행 진입점 ---
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='python -m py.export',
+        description='data 폴더의 CSV로 py/*.json을 만듭니다. (바뀐 출력만 다시 생성)'
+    )
+    parser.add_argument('--data-dir', default=str(DEFAULT_DATA_DIR),
+                        help='입력 CSV 폴더')
+    parser.add_argument('--out-dir', default=str(DEFAULT_OUT_DIR),
+                        help='JSON 출력 폴더')
+    parser.add_argument('--manifest', default=None,
+                        help=f"매니페스트 경로 (기본: 출력 폴더/{MANIFEST_NAME})")
+    parser.add_argument('--only', default='all',
+                        help=f"생성할 출력 (쉼표 구분): {', '.join(TARGETS)}")
+    parser.add_argument('--format', choices=FORMATS, default='records',
+                        help='JSON 형식 (columns: {"columns": [...], "data": {...}})')
+    parser.add_argument('--compact', action='store_true',
+                        help='공백 없는 JSON과 .gz / .br 압축본 저장 (배포용)')
+    parser.add_argument('--arrow', choices=ARROW_KINDS, default=None,
+                        help='Arrow IPC 파일도 저장 (file: .arrow / Feather v2, '
+                             'stream: .arrows)')
+    parser.add_argument('--force', action='store_true',
+                        help='변경 여부와 관계없이 모두 다시 생성')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='다시 만들 출력만 표시하고 파일은 쓰지 않음')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='병렬 프로세스 수 (기본: CPU 코어 수, 1이면 순차 실행)')
+    args = parser.parse_args(argv)
+
+    targets = list(TARGETS) if args.only == 'all' else [
+        t.strip() for t in args.only.split(',') if t.strip()
+    ]
+    unknown = [t for t in targets if t not in TARGETS]
+    if unknown:
+        parser.error(f"알 수 없는 출력: {', '.join(unknown)}")
+    if args.arrow and not sz.HAS_ARROW:
+        parser.error('--arrow를 사용하려면 pyarrow가 필요합니다. (pip install pyarrow)')
+
+    report = build(
+        targets,
+        data_dir=Path(args.data_dir),
+        out_dir=Path(args.out_dir),
+        manifest_path=args.manifest,
+        fmt=args.format,
+        force=args.force,
+        dry_run=args.dry_run,
+        workers=args.workers,
+        compact=args.compact,
+        arrow=args.arrow,
+    )
+
+    labels = {'built': '생성', 'fresh': '최신', 'planned': '생성 예정',
+              'skipped': '건너뜀', 'error': '오류'}
+    for name in targets:
+        entry = report[name]
+        detail = entry.get('error') or entry.get('reason') or ''
+        seconds = f" {entry['seconds']}s" if 'seconds' in entry else ''
+        print(f"[export] {name}.json: {labels[entry['status']]}{seconds}"
+              f"{f' ({detail})' if detail else ''}", file=sys.stderr)
+
+    failed = [e for e in report.values() if e['status'] in ('error', 'skipped')]
+    return 1 if failed else 0
@@ -0,0 +1,459 @@
+import gzip
+import json
+import math
+import os
+
+import numpy as np
+import pandas as pd
+
+try:
+    import orjson  # 선택 의존성: 설치된 경우 빠른 직렬화
+except ImportError:
+    orjson = None
+
+try:
+    import brotli  # 선택 의존성: 설치된 경우 .br 압축본도 저장
+except ImportError:
+    brotli = None
+
+try:
+    import pyarrow as pa  # 선택 의존성: 설치된 경우 Arrow IPC 저장
+    import pyarrow.ipc
+except ImportError:
+    pa = None
+
+HAS_ORJSON = orjson is not None
+HAS_ARROW = pa is not None
+
+# 압축본(원본 옆 파일) 확장자와 최소 크기 (작은 파일은 압축 이득이 작음)
+COMPRESSED_SUFFIXES = {'gzip': '.gz', 'br': '.br'}
+MIN_COMPRESS_SIZE = 512
+
+# Arrow IPC 종류별 확장자 ('file'은 Feather v2와 같은 형식, 'stream'은 스트림 형식)
+ARROW_SUFFIXES = {'file': '.arrow', 'stream': '.arrows'}
+
+
+# DataFrame → JSON 변환 규칙 (orjson / 표준 json 공통)
+# - NaN, inf, NaT, None → null
+# - NumPy 정수/실수/불리언 → JSON 숫자/불리언
+# - 날짜/시각 → str()과 같은 문자열 ('2020-01-01 00:00:00', date는 '2020-01-01')
+# - 그 밖의 객체 → str()
+
+
+# 열 단위 변환 함수
+
+def _datetime_strings(values):
+    """tz 없는 datetime64 배열 → str(Timestamp)와 같은 문자열 목록 (NaT는 None)"""
+    values = values.astype('datetime64[ns]')
+    missing = np.isnat(values)
+    ns = values.astype('int64')[~missing]
+    if (ns % 10**9 == 0).all():
+        unit = 's'
+    elif (ns % 1000 == 0).all():
+        unit = 'us'
+    else:
+        unit = 'ns'
+    text = np.char.replace(np.datetime_as_string(values, unit=unit), 'T', ' ')
+    out = text.astype(object)
+    out[missing] = None
+    return out.tolist()
+
+
+def column_values(s):
+    """
+    Series를 JSON 기본 타입(int, float, str, bool, None) 값 목록으로 바꿉니다.
+    값마다 pandas 객체를 만들지 않고 열 전체를 한 번에 변환합니다.
+
+    매개변수:
+        s (pd.Series): 변환할 열
+
+    반환값:
+        list: 행 순서대로의 값
+    """
+    dtype = s.dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        lookup = column_values(pd.Series(dtype.categories)) + [None]
+        return np.array(lookup, dtype=object)[s.cat.codes.to_numpy()].tolist()
+
+    if isinstance(dtype, np.dtype):
+        if dtype.kind in 'iub':
+            return s.to_numpy().tolist()
+        if dtype.kind == 'f':
+            values = s.to_numpy()
+            bad = ~np.isfinite(values)
+            if bad.any():
+                values = values.astype(object)
+                values[bad] = None
+            return values.tolist()
+        if dtype.kind == 'M':
+            return _datetime_strings(s.to_numpy())
+
+    # object, 문자열, tz 있는 날짜, nullable 정수 등
+    values = s.to_numpy(dtype=object, na_value=None)
+    missing = pd.isna(values)
+    if missing.any():
+        values = values.copy()
+        values[missing] = None
+    return [_native(v) for v in values.tolist()]
+
+
+def to_records(df):
+    """
+    DataFrame.to_dict(orient='records')와 같은 모양의 목록을 만듭니다.
+    행 딕셔너리는 만들지만 값은 열 단위로 한 번에 변환하므로 셀마다
+    pandas / NumPy 객체를 만들지 않습니다. (NaN → None)
+    JSON으로 쓸 때는 행 딕셔너리도 만들지 않는 dumps를 사용합니다.
+
+    매개변수:
+        df (pd.DataFrame): 변환할 데이터프레임
+
+    반환값:
+        list[dict]: 행별 딕셔너리 목록
+    """
+    columns = [str(col) for col in df.columns]
+    values = [column_values(df.iloc[:, i]) for i in range(df.shape[1])]
+    return [dict(zip(columns, row)) for row in zip(*values)]
+
+
+def to_columns(df):
+    """
+    열 단위(struct-of-arrays) 형식으로 바꿉니다. 행마다 키를 반복하지 않습니다.
+
+    매개변수:
+        df (pd.DataFrame): 변환할 데이터프레임
+
+    반환값:
+        dict: {"columns": [열 이름, ...], "data": {열 이름: [값, ...]}}
+    """
+    columns = [str(col) for col in df.columns]
+    return {
+        'columns': columns,
+        'data': {
+            col: column_values(df.iloc[:, i]) for i, col in enumerate(columns)
+        },
+    }
+
+
+# DataFrame 변환 방식 (dumps의 orient)
+ORIENTS = {'records': to_records, 'columns': to_columns}
+
+
+def _json_fragments(s, encode, encode_list):
+    """
+    열 값을 행 순서대로의 JSON 조각(바이트) 목록으로 바꿉니다.
+    숫자 / 불리언 열은 목록 전체를 한 번 직렬화한 뒤 쉼표로 나누고,
+    문자열 열은 서로 다른 값만 인코딩해 코드로 펼칩니다.
+    """
+    values = column_values(s)
+    if isinstance(s.dtype, np.dtype) and s.dtype.kind in 'iufb':
+        # 문자열이 없으므로 쉼표는 값 사이에만 있음
+        return encode_list(values)[1:-1].split(b',')
+    if pd.api.types.infer_dtype(values, skipna=True) in ('string', 'empty'):
+        codes, uniques = pd.factorize(np.array(values, dtype=object))
+        lookup = np.array([encode(v) for v in uniques] + [b'null'], dtype=object)
+        return lookup[codes].tolist()
+    return list(map(encode, values))
+
+
+def _records_json(df, encode, encode_list, indent=0, sort_keys=False,
+                  level=0):
+    """
+    records 형식 JSON 바이트를 열 배열에서 바로 씁니다. (행 딕셔너리 없이)
+    열마다 값을 JSON 조각으로 인코딩한 뒤 행 템플릿에 채워 넣으므로
+    결과는 to_records 목록을 직렬화기에 넘긴 것과 같습니다.
+
+    매개변수:
+        df (pd.DataFrame): 변환할 데이터프레임
+        encode: 기본 타입 값 하나 → JSON 바이트
+        encode_list: 기본 타입 값 목록 → 공백 없는 JSON 배열 바이트
+        indent (int): 들여쓰기 칸 수 (0이면 공백 없이)
+        sort_keys (bool): True이면 열 이름 정렬
+        level (int): 들여쓰기할 때 목록이 놓이는 깊이
+    """
+    # 이름이 같은 열은 딕셔너리처럼 처음 위치에 마지막 열의 값
+    positions = {}
+    for i, col in enumerate(df.columns):
+        positions[str(col)] = i
+    keys = sorted(positions) if sort_keys else list(positions)
+    if not keys or not len(df):
+        return b'[]'  # to_records와 같이 열이 없으면 빈 목록
+    frags = [
+        _json_fragments(df.iloc[:, positions[key]], encode, encode_list)
+        for key in keys
+    ]
+    names = [encode(key).replace(b'%', b'%%') for key in keys]
+
+    if indent:
+        unit = b' ' * indent
+        pad = b'\n' + unit * level
+        template = (pad + unit + b'{'
+                    + b','.join(pad + unit * 2 + name + b': %s' for name in names)
+                    + pad + unit + b'}')
+    else:
+        pad = b''
+        template = b'{' + b','.join(name + b':%s' for name in names) + b'}'
+    return b'[' + b','.join(template % row for row in zip(*frags)) + pad + b']'
+
+
+# 스칼라 변환 함수
+
+def _native(obj):
+    """단일 값을 JSON 기본 타입으로 바꿉니다. (기본 타입은 그대로)"""
+    if obj is None or isinstance(obj, (str, bool, int)):
+        return obj
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    return _default(obj)
+
+
+def _default(obj):
+    """직렬화기가 직접 처리하지 못하는 값의 변환 규칙"""
+    if isinstance(obj, pd.DataFrame):
+        return to_records(obj)
+    if isinstance(obj, pd.Series):
+        return column_values(obj)
+    if isinstance(obj, np.ndarray):
+        return column_values(pd.Series(obj.ravel())) if obj.ndim == 1 else obj.tolist()
+    if isinstance(obj, np.bool_):
+        return bool(obj)
+    if isinstance(obj, np.integer):
+        return int(obj)
+    if isinstance(obj, np.floating):
+        value = float(obj)
+        return value if math.isfinite(value) else None
+    if obj is pd.NaT:
+        return None
+    if isinstance(obj, np.datetime64):
+        return None if np.isnat(obj) else str(pd.Timestamp(obj))
+    return str(obj)  # date, datetime, Timestamp 등
+
+
+def _sanitize(obj):
+    """중첩 구조 안의 NaN / inf 실수를 None으로 (표준 json 경로 전용)"""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _sanitize(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_sanitize(value) for value in obj]
+    return obj
+
+
+# 직렬화 함수
+
+def dumps(obj, indent=False, sort_keys=False, orient='records'):
+    """
+    객체를 UTF-8 JSON 바이트로 직렬화합니다.
+    값으로 들어 있는 DataFrame은 행 딕셔너리를 만들지 않고 열 배열에서 바로 씁니다.
+    orjson이 있으면 사용하고, 없으면 표준 json 모듈로 같은 결과를 만듭니다.
+
+    매개변수:
+        obj: 직렬화할 객체 (dict, list, DataFrame 등)
+        indent (bool | int): True이면 2칸, 정수이면 그 칸 수만큼 들여쓰기
+            (orjson은 2칸만 지원하므로 다른 칸 수는 표준 json 모듈로 씀)
+        sort_keys (bool): True이면 딕셔너리 키 정렬
+        orient (str): DataFrame 형식 ('records' 행 목록, 'columns' 열 단위)
+
+    반환값:
+        bytes: JSON (ensure_ascii=False와 같은 UTF-8)
+    """
+    indent = 2 if indent is True else int(indent or 0)
+    # records 형식 DataFrame은 자리표시 문자열로 바꿔 두었다가 열 배열에서
+    # 바로 쓴 JSON 조각으로 교체 (\x00은 JSON에서 \u0000으로 이스케이프됨)
+    frames = {}
+
+    def convert(value):
+        if orient != 'records':
+            return ORIENTS[orient](value)
+        marker = f"\x00frame{len(frames)}\x00"
+        frames[json.dumps(marker).encode('utf-8')] = value
+        return marker
+
+    if isinstance(obj, pd.DataFrame):
+        obj = convert(obj)
+    elif isinstance(obj, dict):
+        obj = {
+            key: convert(value) if isinstance(value, pd.DataFrame) else value
+            for key, value in obj.items()
+        }
+
+    if orjson is not None and indent in (0, 2):
+        option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        body = orjson.dumps(obj, default=_default, option=option)
+        encode = encode_list = orjson.dumps
+    else:
+        kwargs = dict(
+            ensure_ascii=False,
+            default=_default,
+            sort_keys=sort_keys,
+            allow_nan=False,
+            indent=indent or None,
+            separators=None if indent else (',', ':'),
+        )
+        try:
+            text = json.dumps(obj, **kwargs)
+        except ValueError:
+            # 레코드 밖에 직접 넣은 NaN 실수가 있는 경우만 한 번 더 정리
+            text = json.dumps(_sanitize(obj), **kwargs)
+        body = text.encode('utf-8')
+        encoder = json.JSONEncoder(ensure_ascii=False, allow_nan=False,
+                                   separators=(',', ':'))
+
+        def encode(value):
+            return encoder.encode(value).encode('utf-8')
+        encode_list = encode
+
+    level = 0 if isinstance(obj, str) else 1
+    for marker, df in frames.items():
+        records = _records_json(df, encode, encode_list, indent=indent,
+                                sort_keys=sort_keys, level=level)
+        body = body.replace(marker, records, 1)
+    return body
+
+
+def dump(obj, path, indent=True, sort_keys=False, orient='records',
+         compress=False):
+    """
+    객체를 JSON 파일로 저장합니다. (dumps와 같은 규칙)
+
+    매개변수:
+        obj: 직렬화할 객체
+        path (str | Path): 저장 경로
+        indent (bool | int): True이면 2칸, 정수이면 그 칸 수만큼 들여쓰기
+            (False이면 공백 없는 최소 JSON)
+        sort_keys (bool): True이면 딕셔너리 키 정렬
+        orient (str): DataFrame 형식 ('records', 'columns')
+        compress (bool): True이면 .gz / .br 압축본도 함께 저장
+
+    반환값:
+        bytes: 저장한 JSON 본문
+    """
+    body = dumps(obj, indent=indent, sort_keys=sort_keys, orient=orient)
+    with open(path, 'wb') as f:
+        f.write(body)
+    if compress:
+        write_compressed(path, body)
+    else:
+        remove_compressed(path)
+    return body
+
+
+# 압축본 저장 함수
+
+def _write_replace(path, data):
+    """임시 파일에 쓴 뒤 교체 (읽는 쪽이 쓰다 만 파일을 보지 않도록)"""
+    tmp = f"{path}.tmp"
+    with open(tmp, 'wb') as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def write_compressed(path, body):
+    """
+    본문의 gzip(.gz) / brotli(.br) 압축본을 원본 옆에 저장합니다.
+    정적 파일 서버가 요청마다 압축하지 않고 그대로 전송할 수 있습니다.
+    만들지 않은 압축본(작은 본문, brotli 미설치)은 이전 파일이 남지 않도록 지웁니다.
+
+    매개변수:
+        path (str | Path): 원본 JSON 경로
+        body (bytes): 원본 본문
+
+    반환값:
+        list[str]: 저장한 압축본 확장자 (예: ['.gz', '.br'])
+    """
+    variants = {}
+    if len(body) >= MIN_COMPRESS_SIZE:
+        variants['gzip'] = gzip.compress(body, compresslevel=9, mtime=0)
+        if brotli is not None:
+            variants['br'] = brotli.compress(body, quality=11)
+
+    written = []
+    for encoding, suffix in COMPRESSED_SUFFIXES.items():
+        if encoding in variants:
+            _write_replace(f"{path}{suffix}", variants[encoding])
+            written.append(suffix)
+        else:
+            remove_compressed(path, [suffix])
+    return written
+
+
+def remove_compressed(path, suffixes=None):
+    """원본 옆의 압축본을 지웁니다. (원본만 다시 쓸 때 오래된 압축본 제거)"""
+    for suffix in suffixes or COMPRESSED_SUFFIXES.values():
+        try:
+            os.remove(f"{path}{suffix}")
+        except FileNotFoundError:
+            pass
+
+
+# Arrow IPC 저장 함수
+
+def _require_arrow():
+    if pa is None:
+        raise ImportError("Arrow 형식으로 저장하려면 pyarrow가 필요합니다. (pip install pyarrow)")
+
+
+def to_arrow(df):
+    """
+    DataFrame을 pyarrow.Table로 바꿉니다. 열 dtype(정수, 실수, 날짜, 범주형)을
+    그대로 유지하며 인덱스는 포함하지 않습니다. (값이 없는 object 열은 문자열 열)
+    """
+    _require_arrow()
+    if not all(isinstance(col, str) for col in df.columns):
+        df = df.rename(columns=str)
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    # 비어 있거나 값이 모두 없는 object 열은 null 타입이 되므로 문자열 열로 고정
+    for i, field in enumerate(table.schema):
+        if pa.types.is_null(field.type):
+            table = table.set_column(i, field.with_type(pa.string()),
+                                     table.column(i).cast(pa.string()))
+    return table
+
+
+def arrow_bytes(df, kind='stream'):
+    """
+    DataFrame을 Arrow IPC 바이트로 직렬화합니다.
+
+    매개변수:
+        df (pd.DataFrame): 변환할 데이터프레임
+        kind (str): 'stream' (스트림 형식, HTTP 전송용) 또는
+            'file' (파일 형식, memory-map으로 복사 없이 열기용)
+
+    반환값:
+        bytes: Arrow IPC 본문 (압축하지 않음)
+    """
+    if kind not in ARROW_SUFFIXES:
+        raise ValueError(f"지원하지 않는 Arrow 형식: {kind}")
+    table = to_arrow(df)
+    sink = pa.BufferOutputStream()
+    new = pa.ipc.new_file if kind == 'file' else pa.ipc.new_stream
+    with new(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def dump_arrow(df, path, kind='file'):
+    """DataFrame을 Arrow IPC 파일로 저장하고 본문을 반환합니다. (임시 파일에 쓴 뒤 교체)"""
+    body = arrow_bytes(df, kind)
+    _write_replace(path, body)
+    return body
+
+
+def read_arrow(path, memory_map=True):
+    """
+    Arrow IPC 파일(file / stream 형식 모두)을 pyarrow.Table로 읽습니다.
+    memory_map이면 버퍼를 복사하지 않고 파일을 그대로 참조합니다.
+    DataFrame이 필요하면 .to_pandas()를 호출합니다.
+    """
+    _require_arrow()
+    source = pa.memory_map(str(path)) if memory_map else pa.OSFile(str(path))
+    with source:
+        try:
+            return pa.ipc.open_file(source).read_all()
+        except pa.ArrowInvalid:  # 스트림 형식
+            source.seek(0)
+            return pa.ipc.open_stream(source).read_all()
@@ -5,27 +5,268 @@
 - 동적 라우팅 방식으로 확장성 극대화
 """
 
-from flask import Flask, render_template, jsonify, send_from_directory
+from flask import (
+    Flask, current_app, render_template, request, send_from_directory
+)
+import base64
+import numpy as np
 import pandas as pd
+import functools
+import threading
 import sys
 import os
 
+# 저장소 루트의 py 패키지(공용 분석 모듈)와 이 폴더의 보조 모듈 경로 설정
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.abspath(os.path.join(APP_DIR, '..'))
+for _path in (ROOT_DIR, APP_DIR):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
+
+from py.compact import compact_dtypes  # noqa: E402
+from py.downsample import lttb_union  # noqa: E402
+from py.serialize import dumps, to_columns  # noqa: E402
+from precompress import (  # noqa: E402
+    StaticPrecompressor, compress_for_request, compress_variants, content_etag,
+    send_static, send_variants
+)
+from snapshot import SnapshotStore  # noqa: E402
+from metrics import Metrics, mark_cache, phase  # noqa: E402
+
 
 # ============================================
 # 1. 데이터 가공 클래스
 # ============================================
+# 기간 코드: 1970-01-01 기준 정수 (일/주 시작 월요일은 일수, 월은 년*12+월-1, 년은 연도)
+PERIOD_NA = np.iinfo(np.int32).min  # 거래일 결측 표시값
+
+
+def make_period_codes(dates):
+    """
+    datetime Series로부터 일/주/월/년 정수 기간 코드 배열을 만듭니다.
+
+    :param dates: datetime64 Series
+    :return: {'D': 일, 'W': 주 시작(월요일) 일, 'M': 월, 'Y': 연도} (int32 배열)
+    """
+    values = dates.to_numpy().astype('datetime64[D]')
+    missing = np.isnat(values)
+    days = values.astype('int64')
+    weekday = (days + 3) % 7  # 1970-01-01은 목요일 → 월요일 0
+    years = dates.dt.year.to_numpy()
+    months = dates.dt.month.to_numpy()
+
+    codes = {
+        'D': days,
+        'W': days - weekday,
+        'M': years * 12 + months - 1,
+        'Y': years,
+    }
+    for freq, code in codes.items():
+        code = np.where(missing, PERIOD_NA, np.nan_to_num(code, nan=0))
+        codes[freq] = code.astype('int32')
+    return codes
+
+
+def period_labels(codes, freq):
+    """
+    기간 코드를 pandas Period 문자열과 같은 라벨로 바꿉니다.
+    (D: 2020-01-01, W: 2019-12-30/2020-01-05, M: 2020-01, Y: 2020)
+    """
+    codes = np.asarray(codes, dtype='int64')
+    if freq in ('D', 'W'):
+        start = pd.to_datetime(codes, unit='D')
+        labels = start.strftime('%Y-%m-%d')
+        if freq == 'W':
+            end = (start + pd.Timedelta(days=6)).strftime('%Y-%m-%d')
+            labels = labels + '/' + end
+        return np.asarray(labels, dtype=object)
+    if freq == 'M':
+        years, months = np.divmod(codes, 12)
+        return np.array(
+            [f"{y:04d}-{m + 1:02d}" for y, m in zip(years, months)],
+            dtype=object
+        )
+    return codes.astype(str).astype(object)
+
+
+def dump_json(payload):
+    """
+    응답 JSON 바이트 (orjson 사용 가능 시 orjson, 압축 구분자, UTF-8)
+    키 정렬은 jsonify와 같이 app.json.sort_keys 설정을 따릅니다.
+    """
+    return dumps(payload, sort_keys=current_app.json.sort_keys) + b'\n'
+
+
+class ParamError(ValueError):
+    """잘못된 요청 파라미터 (format, from / to / limit / cursor, points) → 400"""
+
+
+# ----------------------------------------
+# 응답 형식 (?format=records | columns)
+# ----------------------------------------
+RESPONSE_FORMATS = ('records', 'columns')
+
+
+def parse_format(args):
+    """format 파라미터 (없으면 'records')"""
+    fmt = args.get('format', 'records')
+    if fmt not in RESPONSE_FORMATS:
+        raise ParamError(
+            f"format: {' / '.join(RESPONSE_FORMATS)} 중 하나여야 합니다. ({fmt})"
+        )
+    return fmt
+
+
+def format_payload(payload, fmt):
+    """
+    {key_name: DataFrame, ...} 응답을 요청한 형식으로 바꿉니다.
+
+    - records: {key_name: [{열: 값}, ...], ...} (기존 형식, dumps가 행 목록으로 변환)
+    - columns: {"columns": [열 이름], "data": {열: [값, ...]}, ...}
+               (열 배열에서 바로 만들며, DataFrame 외의 값은 그대로 둠)
+    """
+    if fmt != 'columns':
+        return payload
+    out = {}
+    for key, value in payload.items():
+        if isinstance(value, pd.DataFrame):
+            out.update(to_columns(value))
+        else:
+            out[key] = value
+    return out
+
+
+# ----------------------------------------
+# 기간 범위 조회 / 커서 페이지네이션
+# ----------------------------------------
+
+
+def parse_day(value, name):
+    """'YYYY-MM-DD' 문자열을 일 코드(1970-01-01 기준 일수)로 바꿉니다."""
+    try:
+        return int(np.datetime64(value, 'D').astype('int64'))
+    except ValueError:
+        raise ParamError(f"{name}: 날짜 형식은 YYYY-MM-DD 입니다. ({value})")
+
+
+def encode_cursor(freq, start, end):
+    """다음 페이지 위치(시작 코드)와 범위 끝을 불투명한 커서 문자열로 만듭니다."""
+    raw = f"{freq}:{start}:{'' if end is None else end}".encode('ascii')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor, freq):
+    """:return: (시작 코드, 끝 코드 또는 None)"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        c_freq, start, end = raw.decode('ascii').split(':')
+        if c_freq != freq:
+            raise ValueError
+        return int(start), (int(end) if end else None)
+    except ValueError:
+        raise ParamError(f"cursor: 올바르지 않은 커서입니다. ({cursor})")
+
+
+def parse_page_args(args, freq):
+    """
+    요청 파라미터를 기간 코드 범위로 바꿉니다.
+
+    :param args: request.args (from, to, limit, cursor)
+    :param freq: 'D' 또는 'W'
+    :return: (시작 코드 또는 None, 끝 코드 또는 None, limit 또는 None)
+    """
+    limit = args.get('limit')
+    if limit is not None:
+        if not limit.isdigit() or int(limit) < 1:
+            raise ParamError(f"limit: 1 이상의 정수여야 합니다. ({limit})")
+        limit = int(limit)
+
+    if args.get('cursor'):
+        start, end = decode_cursor(args['cursor'], freq)
+        return start, end, limit
+
+    start = end = None
+    if args.get('from'):
+        start = parse_day(args['from'], 'from')
+    if args.get('to'):
+        end = parse_day(args['to'], 'to')
+    if freq == 'W' and start is not None:
+        start -= (start + 3) % 7  # from 날짜가 속한 주(월요일 시작)부터
+    return start, end, limit
+
+
+# 다운샘플링(points=N) 응답을 보관할 최대 N 종류 수 (요청마다 N이 달라도 메모리 제한)
+DOWNSAMPLE_CACHE_MAX = 32
+
+
+def parse_points(args):
+    """points 파라미터 (없으면 None, 3 이상의 정수)"""
+    points = args.get('points')
+    if points is None:
+        return None
+    if not points.isdigit() or int(points) < 3:
+        raise ParamError(f"points: 3 이상의 정수여야 합니다. ({points})")
+    return int(points)
+
+
+def cached_json(method):
+    """
+    API 메소드의 결과를 JSON 바이트로 한 번만 직렬화해 보관하는 데코레이터
+
+    - 데이터가 바뀌기 전까지 같은 응답 본문을 재사용 (pandas 연산 생략)
+    - gzip/brotli 압축본도 함께 만들어 Accept-Encoding에 맞게 전송
+    - 본문 해시를 strong ETag로 사용하여 If-None-Match 요청에 304 응답
+    - ?format=columns 요청은 열 단위 형식으로 따로 보관
+    """
+    @functools.wraps(method)
+    def wrapper(self):
+        fmt = parse_format(request.args)
+        key = method.__name__
+        if fmt != 'records':
+            key = f"{key}:{fmt}"
+        entry = self._responses.get(key)
+        mark_cache(entry is not None)
+        if entry is None:
+            with phase('compute'):
+                payload = method(self)
+            with phase('serialize'):
+                body = dump_json(format_payload(payload, fmt))
+                entry = (compress_variants(body), content_etag(body))
+            with self._responses_lock:
+                self._responses[key] = entry
+
+        variants, etag = entry
+        return send_variants(variants, etag, 'application/json')
+
+    wrapper.cached_json = True
+    return wrapper
+
+
 class Data:
     """
     CSV 데이터를 로드하고 다양한 집계 방식으로 가공하는 클래스
     """
 
-    def __init__(self, file_path):
+    def __init__(self, file_path, compact=False, exit_on_error=True):
         """
         클래스 생성 시 CSV 파일을 로드하고 전처리합니다.
 
         :param file_path: CSV 파일 경로
+        :param compact: True이면 메모리 절약 타입 프로파일을 적용
+        :param exit_on_error: False이면 로드/전처리 오류 시 종료하지 않고 예외 전달
+                              (실행 중 재로드에 사용)
         """
         self.df_origin = None
+        self.compact = compact
+        self.exit_on_error = exit_on_error
+        self.shared = False
+        self.period_codes = {}
+
+        # 엔드포인트별 직렬화된 응답 캐시: {메소드명[:형식]: (압축본들, ETag)}
+        self._responses = {}
+        self._responses_lock = threading.Lock()
+        # 기간별 통계: {freq: (정렬된 기간 코드 배열, 통계 DataFrame, 값 배열)}
+        self._series = {}
 
         try:
             # CSV 파일을 utf-8 인코딩으로 로드
@@ -36,6 +277,8 @@ class Data:
             self.preprocess()
 
         except FileNotFoundError:
+            if not self.exit_on_error:
+                raise
             print(
                 f"치명적 오류: '{file_path}' 파일을 찾을 수 없습니다."
             )
@@ -45,6 +288,8 @@ class Data:
             )
             sys.exit()
         except Exception as e:
+            if not self.exit_on_error:
+                raise
             print(f"CSV 로드 중 치명적 오류: {e}")
             print(
                 "(해결책) CSV 파일을 VS Code로 열고 "
@@ -57,6 +302,7 @@ class Data:
         로드된 DataFrame을 전처리합니다.
         (datetime 변환, 컬럼명 변경 등)
         """
+        self.invalidate()
         try:
             # 거래금액 컬럼 전처리 (콤마 제거 후 숫자 변환)
             if ('거래금액' in self.df_origin.columns and
@@ -81,141 +327,269 @@ class Data:
             else:
                 raise KeyError("로드된 CSV에 '거래일' 컬럼이 없습니다.")
 
+            # 지역명 category, 숫자 타입 축소 (선택)
+            if self.compact:
+                self.df_origin = compact_dtypes(self.df_origin, verbose=True)
+
+            # 일/주/월/년 정수 기간 코드 (요청마다 문자열 키를 만들지 않도록)
+            self.period_codes = make_period_codes(self.df_origin['거래일'])
+
         except KeyError as e:
+            if not self.exit_on_error:
+                raise
             print(f"전처리 중 치명적 오류: {e}")
             sys.exit()
 
-    def create_json_response(self, key_name, records):
+    def invalidate(self):
+        """직렬화된 응답 캐시와 기간별 통계를 비웁니다. (데이터 변경 시 호출)"""
+        with self._responses_lock:
+            self._responses = {}
+            self._series = {}
+
+    def validate(self):
         """
-        데이터를 JSON 형식으로 래핑하여 반환합니다.
+        새로 만든 데이터를 서비스에 넣기 전에 최소한의 정합성을 검사합니다.
+        (재로드 시 사용, 문제가 있으면 ValueError)
+        """
+        if self.df_origin is None or self.df_origin.empty:
+            raise ValueError("데이터가 비어 있습니다.")
+        for col in ('거래일', '거래금액', '층', '전용면적', '시도'):
+            if col not in self.df_origin.columns:
+                raise ValueError(f"'{col}' 컬럼이 없습니다.")
+        if (self.period_codes['D'] == PERIOD_NA).all():
+            raise ValueError("유효한 거래일이 없습니다.")
+
+    def share_layout(self):
+        """
+        문자열(object) 열을 category로 바꿔 행마다 파이썬 객체가 남지 않게 합니다.
+        프리포크 실행(serve.py)에서 워커를 만들기 전에 호출하면, 참조 카운트 갱신으로
+        인한 페이지 복사 없이 워커들이 데이터 메모리를 공유합니다.
+
+        :return: 변환 전후 메모리 사용량 {'before', 'after', 'ratio'}
+        """
+        object_cols = [
+            col for col in self.df_origin.columns
+            if self.df_origin[col].dtype == object
+        ]
+        self.df_origin = compact_dtypes(
+            self.df_origin, categories=object_cols, numerics=(), dates=()
+        )
+        self.shared = True
+        return self.df_origin.attrs['memory_report']
+
+    def period_key(self, freq, name):
+        """기간 코드 배열을 DataFrame과 같은 인덱스의 Series로 감쌉니다. (복사 없음)"""
+        return pd.Series(
+            self.period_codes[freq], index=self.df_origin.index,
+            name=name, copy=False
+        )
+
+    def period_series(self, freq, label):
+        """
+        기간 코드별 평균거래가 및 거래량을 한 번만 계산해 보관합니다.
+
+        :param freq: 'D', 'W', 'M', 'Y'
+        :param label: 결과의 기간 컬럼명
+        :return: (정렬된 기간 코드 배열, [label, 평균거래가, 거래량] DataFrame,
+                  [평균거래가, 거래량] 값 배열)
+        """
+        series = self._series.get(freq)
+        if series is None:
+            df_processed = (
+                self.df_origin['거래금액']
+                .groupby(self.period_key(freq, label))
+                .agg(평균거래가='mean', 거래량='count')
+            )
+            df_processed = df_processed[df_processed.index != PERIOD_NA]
+            codes = df_processed.index.to_numpy()
+            values = df_processed.to_numpy(dtype='float64')
+            df_processed.insert(0, label, period_labels(codes, freq))
+            series = (codes, df_processed.reset_index(drop=True), values)
+            with self._responses_lock:
+                self._series[freq] = series
+        return series
+
+    def period_page(self, freq, label, key_name, args):
+        """
+        기간 통계의 일부를 from / to 범위와 limit 단위 커서로 잘라 반환합니다.
+        범위는 정렬된 기간 코드 배열에서 이진 탐색으로 찾습니다.
+        points=N이면 (범위 안의) 시계열을 LTTB로 N개 점 이내로 줄입니다.
+
+        :param args: request.args
+                     (from, to: YYYY-MM-DD, limit, cursor, points, format)
+        :return: {key_name: 레코드 목록, 'next_cursor': 다음 페이지 커서 또는 None}
+                 (format=columns이면 {'columns', 'data', 'next_cursor'})
+        """
+        fmt = parse_format(args)
+        start, end, limit = parse_page_args(args, freq)
+        points = parse_points(args)
+        if points is not None and (limit is not None or args.get('cursor')):
+            raise ParamError("points는 limit / cursor와 함께 쓸 수 없습니다.")
+        if points is not None and start is None and end is None:
+            return self.downsampled_series(freq, label, key_name, points, fmt)
+
+        with phase('compute'):
+            codes, frame, values = self.period_series(freq, label)
+
+            lo = 0 if start is None else int(
+                np.searchsorted(codes, start, 'left')
+            )
+            hi = len(codes) if end is None else int(
+                np.searchsorted(codes, end, 'right')
+            )
+            next_cursor = None
+            if limit is not None and hi - lo > limit:
+                next_cursor = encode_cursor(freq, int(codes[lo + limit]), end)
+                hi = lo + limit
+
+            if points is not None:
+                page = self.downsample(codes[lo:hi], frame.iloc[lo:hi],
+                                       values[lo:hi], points)
+            else:
+                page = frame.iloc[lo:hi]
+
+        payload = self.create_json_response(key_name, page)
+        payload['next_cursor'] = next_cursor
+        with phase('serialize'):
+            body = dump_json(format_payload(payload, fmt))
+            variants = compress_for_request(body)
+        return send_variants(variants, content_etag(body), 'application/json')
+
+    @staticmethod
+    def downsample(codes, frame, values, points):
+        """평균거래가 / 거래량 두 선을 함께 그릴 수 있도록 LTTB로 고른 행만 남깁니다."""
+        if len(frame) <= points:
+            return frame
+        keep = lttb_union(codes, [values[:, 0], values[:, 1]], points)
+        return frame.iloc[keep]
+
+    def downsampled_series(self, freq, label, key_name, points, fmt='records'):
+        """
+        전체 시계열의 points=N 다운샘플링 응답 (N, 형식별로 직렬화/압축본 보관)
+        """
+        key = f"{freq}:points={points}:{fmt}"
+        entry = self._responses.get(key)
+        mark_cache(entry is not None)
+        if entry is None:
+            with phase('compute'):
+                codes, frame, values = self.period_series(freq, label)
+                payload = self.create_json_response(
+                    key_name, self.downsample(codes, frame, values, points)
+                )
+            payload['next_cursor'] = None
+            with phase('serialize'):
+                body = dump_json(format_payload(payload, fmt))
+                entry = (compress_variants(body), content_etag(body))
+            with self._responses_lock:
+                cached = sum(1 for k in self._responses if ':points=' in k)
+                if cached < DOWNSAMPLE_CACHE_MAX:
+                    self._responses[key] = entry
+
+        variants, etag = entry
+        return send_variants(variants, etag, 'application/json')
+
+    def label_months(self, df_processed):
+        """집계 결과의 '년월' 월 코드를 'YYYY-MM' 라벨로 바꿉니다. (결측 제외)"""
+        df_processed = df_processed[df_processed['년월'] != PERIOD_NA]
+        return df_processed.assign(
+            년월=period_labels(df_processed['년월'].to_numpy(), 'M')
+        )
+
+    def create_json_response(self, key_name, df_processed):
+        """
+        데이터를 JSON 응답 형식으로 래핑하여 반환합니다.
+        (형식 변환·직렬화와 ETag 처리는 cached_json 데코레이터가 담당)
 
         :param key_name: JSON의 최상위 키
-        :param records: 데이터 리스트
-        :return: Flask jsonify 응답
+        :param df_processed: 집계 결과 DataFrame
+        :return: {key_name: df_processed} 딕셔너리
         """
-        if records is None or len(records) == 0:
-            return jsonify({key_name: []})
-        return jsonify({key_name: records})
+        if df_processed is None:
+            df_processed = pd.DataFrame()
+        return {key_name: df_processed}
 
     # ----------------------------------------
     # 기간별 데이터 API 메소드
     # ----------------------------------------
 
+    @cached_json
     def get_data_floor(self):
         """층별 거래금액 합계"""
-        df_temp = self.df_origin.copy()
         df_processed = (
-            df_temp.groupby('층')['거래금액']
+            self.df_origin.groupby('층')['거래금액']
             .sum()
             .reset_index()
         )
         df_processed = df_processed.rename(columns={'층': '구분'})
-        records = df_processed.to_dict('records')
-        return self.create_json_response("층별", records)
+        return self.create_json_response("층별", df_processed)
 
+    @cached_json
     def get_data_daily(self):
         """일간 평균거래가 및 거래량"""
-        df_temp = self.df_origin.copy()
-        df_temp['일'] = (
-            df_temp['거래일']
-            .dt.to_period('D')
-            .astype(str)
-        )
-        df_processed = df_temp.groupby('일').agg(
-            평균거래가=('거래금액', 'mean'),
-            거래량=('거래금액', 'count')
-        ).reset_index()
-        df_processed = df_processed.rename(columns={'일': '거래일'})
-        records = df_processed.to_dict('records')
-        return self.create_json_response("일간", records)
+        df_processed = self.period_series('D', '거래일')[1]
+        return self.create_json_response("일간", df_processed)
 
+    @cached_json
     def get_data_weekly(self):
         """주간 평균거래가 및 거래량"""
-        df_temp = self.df_origin.copy()
-        df_temp['주차'] = (
-            df_temp['거래일']
-            .dt.to_period('W')
-            .astype(str)
-        )
-        df_processed = df_temp.groupby('주차').agg(
-            평균거래가=('거래금액', 'mean'),
-            거래량=('거래금액', 'count')
-        ).reset_index()
-        records = df_processed.to_dict('records')
-        return self.create_json_response("주간", records)
+        df_processed = self.period_series('W', '주차')[1]
+        return self.create_json_response("주간", df_processed)
 
+    @cached_json
     def get_data_monthly(self):
         """월간 평균거래가 및 거래량"""
-        df_temp = self.df_origin.copy()
-        df_temp['년월'] = (
-            df_temp['거래일']
-            .dt.to_period('M')
-            .astype(str)
-        )
-        df_processed = df_temp.groupby('년월').agg(
-            평균거래가=('거래금액', 'mean'),
-            거래량=('거래금액', 'count')
-        ).reset_index()
-        records = df_processed.to_dict('records')
-        return self.create_json_response("월간", records)
+        df_processed = self.period_series('M', '년월')[1]
+        return self.create_json_response("월간", df_processed)
 
+    @cached_json
     def get_data_yearly(self):
         """년간 평균거래가 및 거래량"""
-        df_temp = self.df_origin.copy()
-        df_temp['년'] = df_temp['거래일'].dt.year.astype(str)
-        df_processed = df_temp.groupby('년').agg(
-            평균거래가=('거래금액', 'mean'),
-            거래량=('거래금액', 'count')
-        ).reset_index()
-        records = df_processed.to_dict('records')
-        return self.create_json_response("년간", records)
+        df_processed = self.period_series('Y', '년')[1]
+        return self.create_json_response("년간", df_processed)
 
     # ----------------------------------------
     # 지역별 데이터 API 메소드
     # ----------------------------------------
 
+    @cached_json
     def get_data_apt_volume(self):
         """지역별 아파트 거래량"""
         df_processed = (
             self.df_origin
-            .groupby('시도')
+            .groupby('시도', observed=True)
             .size()
             .reset_index(name="거래량")
         )
-        records = df_processed.to_dict('records')
-        return self.create_json_response("아파트 거래량", records)
+        return self.create_json_response("아파트 거래량", df_processed)
 
+    @cached_json
     def get_data_apt_area(self):
         """지역별 평균 전용면적"""
         df_processed = (
             self.df_origin
-            .groupby('시도')['전용면적']
+            .groupby('시도', observed=True)['전용면적']
             .mean()
             .reset_index()
         )
-        records = df_processed.to_dict('records')
-        return self.create_json_response("아파트 거래 면적", records)
+        return self.create_json_response("아파트 거래 면적", df_processed)
 
     # ----------------------------------------
     # 월별 통합 데이터 API 메소드
     # ----------------------------------------
 
+    @cached_json
     def get_monthly_apt_volume(self):
         """월별 지역별 아파트 거래량"""
-        df_temp = self.df_origin.copy()
-        df_temp['년월'] = (
-            df_temp['거래일']
-            .dt.to_period('M')
-            .astype(str)
-        )
+        month_key = self.period_key('M', '년월')
 
         # 년월별, 시도별 거래량 집계
         df_processed = (
-            df_temp
-            .groupby(['년월', '시도'])
+            self.df_origin
+            .groupby([month_key, '시도'], observed=True)
             .size()
             .reset_index(name='거래량')
         )
+        df_processed = self.label_months(df_processed)
 
         # 피벗 테이블로 변환 (년월을 행, 시도를 컬럼으로)
         df_pivot = (
@@ -228,25 +602,21 @@ class Data:
         # 컬럼명을 '년월', '서울', '부산' 등으로 정리
         df_pivot.columns.name = None
 
-        records = df_pivot.to_dict('records')
-        return self.create_json_response("월별 아파트 거래량", records)
+        return self.create_json_response("월별 아파트 거래량", df_pivot)
 
+    @cached_json
     def get_monthly_apt_area(self):
         """월별 지역별 평균 전용면적"""
-        df_temp = self.df_origin.copy()
-        df_temp['년월'] = (
-            df_temp['거래일']
-            .dt.to_period('M')
-            .astype(str)
-        )
+        month_key = self.period_key('M', '년월')
 
         # 년월별, 시도별 평균 전용면적 집계
         df_processed = (
-            df_temp
-            .groupby(['년월', '시도'])['전용면적']
+            self.df_origin
+            .groupby([month_key, '시도'], observed=True)['전용면적']
             .mean()
             .reset_index()
         )
+        df_processed = self.label_months(df_processed)
 
         # 피벗 테이블로 변환
         df_pivot = (
@@ -257,28 +627,25 @@ class Data:
         df_pivot = df_pivot.reset_index()
         df_pivot.columns.name = None
 
-        records = df_pivot.to_dict('records')
-        return self.create_json_response("월별 아파트 거래 면적", records)
+        return self.create_json_response("월별 아파트 거래 면적", df_pivot)
 
+    @cached_json
     def get_monthly_apt_volume_area(self):
         """월별 지역별 거래량 + 면적 통합"""
-        df_temp = self.df_origin.copy()
-        df_temp['년월'] = (
-            df_temp['거래일']
-            .dt.to_period('M')
-            .astype(str)
-        )
+        month_key = self.period_key('M', '년월')
 
         # 거래량과 평균면적을 동시에 집계
-        df_processed = df_temp.groupby(['년월', '시도']).agg(
+        df_processed = self.df_origin.groupby(
+            [month_key, '시도'], observed=True
+        ).agg(
             거래량=('거래금액', 'count'),
             평균면적=('전용면적', 'mean')
         ).reset_index()
+        df_processed = self.label_months(df_processed)
 
-        records = df_processed.to_dict('records')
         return self.create_json_response(
             "월별 아파트 거래 거래량 면적",
-            records
+            df_processed
         )
 
 
@@ -291,14 +658,57 @@ app = Flask(
     static_folder=None  # 수동으로 정적 파일 처리
 )
 
+# 엔드포인트별 지연 시간 / 응답 크기 / 캐시 적중 지표 (/metrics)
+metrics = Metrics(app)
+
 
 # ============================================
 # 3. 데이터 로드 (서버 시작 전 1회 실행)
 # ============================================
+DATA_FILE = 'Apart Deal2020.csv'
+DATA_COMPACT = os.environ.get('DATA_COMPACT', '0') == '1'
+# 원본 CSV 변경 확인 주기(초), 0이면 자동 재로드 안 함
+RELOAD_INTERVAL = float(os.environ.get('DATA_RELOAD_INTERVAL', '60'))
+
+# cached_json이 적용된 API 메소드 이름 목록
+CACHED_METHODS = [
+    name for name, method in vars(Data).items()
+    if getattr(method, 'cached_json', False)
+]
+
+
+def warm_snapshot(snapshot):
+    """스냅샷의 모든 JSON 응답(직렬화/압축본)을 미리 만듭니다."""
+    with app.test_request_context():
+        for name in CACHED_METHODS:
+            getattr(snapshot, name)()
+
+
+def build_snapshot():
+    """
+    재로드용 새 스냅샷 생성: 로드 → 전처리 → 검사 → 응답 캐시 준비
+    (요청 처리와 무관한 백그라운드 스레드에서 실행, 실패하면 예외)
+    """
+    snapshot = Data(DATA_FILE, compact=DATA_COMPACT, exit_on_error=False)
+    snapshot.validate()
+    current = store.current
+    if current is not None and current.shared:
+        snapshot.share_layout()
+    warm_snapshot(snapshot)
+    return snapshot
+
+
 print("--- 데이터 로드를 시작합니다... ---")
-data = Data('Apart Deal2020.csv')
+# 요청마다 store.current를 한 번 읽어 사용 (재로드 시 참조만 교체)
+store = SnapshotStore(build_snapshot, [DATA_FILE], interval=RELOAD_INTERVAL)
+store.load(lambda: Data(DATA_FILE, compact=DATA_COMPACT))
+store.start()
 print("--- 데이터 로드 및 전처리 완료 ---")
 
+# JS 파일 압축본 준비 (요청마다 압축하지 않도록)
+js_files = StaticPrecompressor(os.path.join(app.root_path, 'js'))
+print(f"--- JS 압축본 준비 완료 ({js_files.warm()}개) ---")
+
 
 # ============================================
 # 4. 라우트 정의
@@ -363,13 +773,13 @@ def serve_favicon():
 @app.route('/static/<path:filename>')
 def serve_static(filename):
     """
-    정적 파일(CSS, 이미지 등)을 제공합니다.
+    정적 파일(CSS, 이미지 등)을 제공합니다. (.br / .gz 압축본이 있으면 압축본)
 
     :param filename: 요청된 정적 파일명
     :return: 정적 파일 또는 404
     """
     try:
-        return send_from_directory('static', filename)
+        return send_static('static', filename)
     except Exception as e:
         print(f"정적 파일 로드 오류: {e}")
         return "정적 파일을 찾을 수 없습니다.", 404
@@ -378,11 +788,20 @@ def serve_static(filename):
 @app.route('/js/<path:filename>')
 def serve_js(filename):
     """
-    JavaScript 파일을 제공합니다.
+    JavaScript 파일을 제공합니다. (미리 압축해 둔 gzip/brotli 본 우선)
 
     :param filename: 요청된 JS 파일명
     :return: JS 파일 또는 404
     """
+    entry = js_files.get(filename)
+    if entry is not None:
+        variants, etag, mtime = entry
+        return send_variants(
+            variants, etag, 'text/javascript',
+            cache_control='public, max-age=0, must-revalidate',
+            last_modified=mtime
+        )
+
     try:
         return send_from_directory('js', filename)
     except Exception as e:
@@ -393,13 +812,13 @@ def serve_js(filename):
 @app.route('/data/<path:filename>')
 def serve_data(filename):
     """
-    데이터 파일을 제공합니다.
+    데이터 파일을 제공합니다. (.br / .gz 압축본이 있으면 압축본)
 
     :param filename: 요청된 데이터 파일명
     :return: 데이터 파일 또는 404
     """
     try:
-        return send_from_directory('data', filename)
+        return send_static('data', filename)
     except Exception as e:
         print(f"데이터 파일 로드 오류: {e}")
         return "데이터 파일을 찾을 수 없습니다.", 404
@@ -409,34 +828,78 @@ def serve_data(filename):
 # JSON API 엔드포인트 (기간별)
 # ----------------------------------------
 
+@app.errorhandler(ParamError)
+def handle_param_error(e):
+    """잘못된 요청 파라미터는 400으로 응답"""
+    return f"잘못된 요청 파라미터: {e}", 400
+
+
+# 범위/커서 조회 파라미터 (그 밖의 파라미터(캐시 무효화용 ?_= 등)는 전체 응답 캐시 사용)
+PAGE_PARAMS = ('from', 'to', 'limit', 'cursor')
+
+
+def is_page_request(args):
+    """범위/커서 조회 파라미터(from, to, limit, cursor)가 있는지 여부"""
+    return any(name in args for name in PAGE_PARAMS)
+
+
+def period_response(freq, label, key_name, full):
+    """
+    일간/주간 API 공통 처리
+    - 범위/커서 조회 → period_page (범위 안의 points=N 다운샘플링 포함)
+    - points=N만 있으면 → N별로 보관하는 다운샘플링 응답
+    - 그 밖에는 → full(데이터)의 전체 응답 (cached_json)
+    """
+    data = store.current
+    args = request.args
+    if is_page_request(args):
+        return data.period_page(freq, label, key_name, args)
+    points = parse_points(args)
+    if points is not None:
+        return data.downsampled_series(freq, label, key_name, points,
+                                       parse_format(args))
+    return full(data)
+
+
 @app.route('/py/층별.json')
 def api_floor():
     """층별 거래금액 합계 API"""
-    return data.get_data_floor()
+    return store.current.get_data_floor()
 
 
 @app.route('/py/일간.json')
 def api_daily():
-    """일간 평균거래가 및 거래량 API"""
-    return data.get_data_daily()
+    """
+    일간 평균거래가 및 거래량 API
+    ?from=YYYY-MM-DD&to=YYYY-MM-DD&limit=N&cursor=... 로 일부만 조회
+    ?points=N 이면 차트용으로 N개 점 이내로 줄인 시계열
+    ?format=columns 이면 {"columns": [...], "data": {열: [...]}} 형식
+    """
+    return period_response('D', '거래일', '일간', Data.get_data_daily)
 
 
 @app.route('/py/주간.json')
 def api_weekly():
-    """주간 평균거래가 및 거래량 API"""
-    return data.get_data_weekly()
+    """
+    주간 평균거래가 및 거래량 API
+    ?from=YYYY-MM-DD&to=YYYY-MM-DD&limit=N&cursor=... 로 일부만 조회
+    ?points=N 이면 차트용으로 N개 점 이내로 줄인 시계열
+    ?format=columns 이면 {"columns": [...], "data": {열: [...]}} 형식
+    (from 날짜가 속한 주부터, to 날짜 이전에 시작하는 주까지)
+    """
+    return period_response('W', '주차', '주간', Data.get_data_weekly)
 
 
 @app.route('/py/월간.json')
 def api_monthly():
     """월간 평균거래가 및 거래량 API"""
-    return data.get_data_monthly()
+    return store.current.get_data_monthly()
 
 
 @app.route('/py/년간.json')
 def api_yearly():
     """년간 평균거래가 및 거래량 API"""
-    return data.get_data_yearly()
+    return store.current.get_data_yearly()
 
 
 # ----------------------------------------
@@ -446,13 +909,13 @@ def api_yearly():
 @app.route('/py/아파트 거래량.json')
 def api_apt_volume():
     """지역별 아파트 거래량 API"""
-    return data.get_data_apt_volume()
+    return store.current.get_data_apt_volume()
 
 
 @app.route('/py/아파트 거래 면적.json')
 def api_apt_area():
     """지역별 평균 전용면적 API"""
-    return data.get_data_apt_area()
+    return store.current.get_data_apt_area()
 
 
 # ----------------------------------------
@@ -462,19 +925,19 @@ def api_apt_area():
 @app.route('/py/월별 아파트 거래량.json')
 def api_monthly_apt_volume():
     """월별 지역별 아파트 거래량 API"""
-    return data.get_monthly_apt_volume()
+    return store.current.get_monthly_apt_volume()
 
 
 @app.route('/py/월별 아파트 거래 면적.json')
 def api_monthly_apt_area():
     """월별 지역별 평균 전용면적 API"""
-    return data.get_monthly_apt_area()
+    return store.current.get_monthly_apt_area()
 
 
 @app.route('/py/월별 아파트 거래 거래량 면적.json')
 def api_monthly_apt_volume_area():
     """월별 지역별 거래량+면적 통합 API"""
-    return data.get_monthly_apt_volume_area()
+    return store.current.get_monthly_apt_volume_area()
 
 
 # ============================================
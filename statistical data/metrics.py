@@ -0,0 +1,398 @@
+# -*- coding: utf-8 -*-
+"""
+엔드포인트별 성능 지표 수집 도구
+- 요청 수(상태 코드별), 전체 지연 시간, 계산/직렬화 시간 히스토그램
+- 응답 크기 히스토그램, 응답 캐시 적중 여부, 압축 방식별 응답 수
+- /metrics 에서 Prometheus 텍스트 형식, /metrics?format=json 에서 JSON으로 제공
+
+지표는 프로세스마다 모이며, share(디렉토리)를 호출하면(serve.py 멀티 워커)
+프로세스마다 디렉토리/<pid>.json 에 주기적으로 기록하고 /metrics 는 모든 워커의
+기록을 합산해 보여줍니다. (종료된 워커의 기록도 남겨 카운터가 줄어들지 않음)
+"""
+
+import bisect
+import contextlib
+import json
+import os
+import threading
+import time
+
+from flask import Response, g, has_request_context, jsonify, request
+
+
+# 지연 시간(초) / 응답 크기(바이트) 히스토그램 구간 상한
+LATENCY_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+SIZE_BUCKETS = (1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+
+# 요청 처리 중 따로 재는 구간
+PHASES = ('compute', 'serialize')
+
+
+# ============================================
+# 1. 요청 안에서 호출하는 기록 함수
+# ============================================
+@contextlib.contextmanager
+def phase(name):
+    """
+    요청 처리 중 한 구간(compute / serialize)의 소요 시간을 기록합니다.
+    요청 밖(서버 시작 시 캐시 준비 등)에서는 아무것도 기록하지 않습니다.
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        if has_request_context():
+            phases = g.setdefault('metrics_phases', {})
+            phases[name] = phases.get(name, 0.0) + time.perf_counter() - start
+
+
+def mark_cache(hit):
+    """현재 요청이 응답 캐시를 사용했는지(hit) 기록합니다."""
+    if has_request_context():
+        g.metrics_cache = 'hit' if hit else 'miss'
+
+
+# ============================================
+# 2. 집계 자료구조
+# ============================================
+class Histogram:
+    """누적 구간(Prometheus 방식) 히스토그램"""
+
+    def __init__(self, buckets):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # 마지막 칸은 +Inf
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q):
+        """구간 상한으로 근사한 분위수 (관측값이 없으면 None, 최대 구간 초과는 '+Inf')"""
+        if not self.count:
+            return None
+        target = q * self.count
+        seen = 0
+        for bound, n in zip(self.buckets, self.counts):
+            seen += n
+            if seen >= target:
+                return bound
+        return '+Inf'
+
+    def cumulative(self):
+        """(구간 상한, 누적 개수) 목록, 마지막은 ('+Inf', 전체 개수)"""
+        total = 0
+        out = []
+        for bound, n in zip(self.buckets + ('+Inf',), self.counts):
+            total += n
+            out.append((bound, total))
+        return out
+
+    def state(self):
+        """합산 가능한 원시 값 (공유 디렉토리 기록용)"""
+        return {'counts': list(self.counts), 'count': self.count, 'sum': self.sum}
+
+    def merge(self, state):
+        """state()로 기록한 값을 더합니다. (구간 구성이 같아야 함)"""
+        if len(state['counts']) != len(self.counts):
+            return
+        self.counts = [a + b for a, b in zip(self.counts, state['counts'])]
+        self.count += state['count']
+        self.sum += state['sum']
+
+    def to_dict(self):
+        return {
+            'count': self.count,
+            'sum': round(self.sum, 6),
+            'avg': round(self.sum / self.count, 6) if self.count else None,
+            'p50': self.quantile(0.5),
+            'p95': self.quantile(0.95),
+            'buckets': {str(bound): n for bound, n in self.cumulative()},
+        }
+
+
+class EndpointStats:
+    """엔드포인트 하나의 지표 묶음"""
+
+    def __init__(self):
+        self.status = {}
+        self.cache = {'hit': 0, 'miss': 0}
+        self.encodings = {}
+        self.latency = Histogram(LATENCY_BUCKETS)
+        self.phases = {name: Histogram(LATENCY_BUCKETS) for name in PHASES}
+        self.size = Histogram(SIZE_BUCKETS)
+
+    def state(self):
+        """합산 가능한 원시 값 (공유 디렉토리 기록용)"""
+        return {
+            'status': dict(self.status),
+            'cache': dict(self.cache),
+            'encodings': dict(self.encodings),
+            'latency': self.latency.state(),
+            'phases': {name: hist.state() for name, hist in self.phases.items()},
+            'size': self.size.state(),
+        }
+
+    def merge(self, state):
+        """다른 프로세스의 state()를 더합니다."""
+        for name in ('status', 'cache', 'encodings'):
+            target = getattr(self, name)
+            for key, n in state[name].items():
+                target[key] = target.get(key, 0) + n
+        self.latency.merge(state['latency'])
+        for name, hist in self.phases.items():
+            if name in state['phases']:
+                hist.merge(state['phases'][name])
+        self.size.merge(state['size'])
+
+    @classmethod
+    def from_state(cls, state):
+        stats = cls()
+        stats.merge(state)
+        return stats
+
+    def to_dict(self):
+        return {
+            'requests': dict(self.status),
+            'cache': dict(self.cache),
+            'encodings': dict(self.encodings),
+            'latency_seconds': self.latency.to_dict(),
+            **{
+                f"{name}_seconds": hist.to_dict()
+                for name, hist in self.phases.items()
+            },
+            'response_bytes': self.size.to_dict(),
+        }
+
+
+# ============================================
+# 3. Flask 연동
+# ============================================
+class Metrics:
+    """
+    요청마다 지표를 모으는 미들웨어
+    """
+
+    def __init__(self, app=None, path='/metrics'):
+        self.path = path
+        self.started_at = time.time()
+        self._endpoints = {}
+        self._lock = threading.Lock()
+        # 멀티 워커 합산 (share 호출 시)
+        self.shared_dir = None
+        self.flush_interval = 1.0
+        self._dirty = False
+        self._flusher_pid = None
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        """요청 전/후 훅과 지표 조회 라우트를 등록합니다."""
+        app.before_request(self._before)
+        app.after_request(self._after)
+        app.add_url_rule(self.path, 'metrics', self.view)
+
+    def _before(self):
+        g.metrics_start = time.perf_counter()
+
+    def _after(self, response):
+        start = g.get('metrics_start')
+        if start is None or request.path == self.path:
+            return response
+
+        rule = request.url_rule.rule if request.url_rule else '<unmatched>'
+        self.observe(
+            rule,
+            status=response.status_code,
+            seconds=time.perf_counter() - start,
+            phases=g.get('metrics_phases', {}),
+            size=response.content_length or 0,
+            encoding=response.headers.get('Content-Encoding', 'identity'),
+            cache=g.get('metrics_cache'),
+        )
+        return response
+
+    def reset(self):
+        """모은 지표를 모두 버립니다. (fork 전 캐시 준비 요청 등을 제외할 때)"""
+        with self._lock:
+            self._endpoints = {}
+            self._dirty = False
+
+    # --- 멀티 워커 합산 ---
+
+    def share(self, directory, flush_interval=1.0):
+        """
+        워커 간 지표 합산을 켭니다. (fork 전에 마스터에서 호출)
+        프로세스마다 flush_interval초 주기로 directory/<pid>.json 에 자기 지표를 쓰고,
+        /metrics 는 응답하는 워커가 디렉토리의 모든 기록을 합산합니다.
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.shared_dir = directory
+        self.flush_interval = flush_interval
+
+    def _ensure_flusher(self):
+        """현재 프로세스의 주기 기록 스레드를 (없으면) 시작합니다. (fork 후 워커마다 1개)"""
+        pid = os.getpid()
+        if self.shared_dir is None or self._flusher_pid == pid:
+            return
+        self._flusher_pid = pid
+        threading.Thread(
+            target=self._flush_loop, name='metrics-flush', daemon=True
+        ).start()
+
+    def _flush_loop(self):
+        while True:
+            time.sleep(self.flush_interval)
+            try:
+                self.flush()
+            except OSError:
+                pass  # 디렉토리 삭제 등: 다음 주기에 다시 시도
+
+    def flush(self):
+        """현재 프로세스의 지표를 공유 디렉토리에 기록합니다. (바뀐 경우만)"""
+        if self.shared_dir is None:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            state = {rule: stats.state() for rule, stats in self._endpoints.items()}
+            self._dirty = False
+        path = os.path.join(self.shared_dir, f"{os.getpid()}.json")
+        tmp = f"{path}.tmp"
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(state, f, ensure_ascii=False)
+        os.replace(tmp, path)
+
+    def _collect(self):
+        """
+        보여줄 지표: (엔드포인트, EndpointStats) 정렬 목록과 합산한 프로세스 PID 목록
+        공유 모드이면 모든 워커 기록의 합, 아니면 현재 프로세스 값의 복사본
+        """
+        if self.shared_dir is None:
+            with self._lock:
+                items = [
+                    (rule, EndpointStats.from_state(stats.state()))
+                    for rule, stats in self._endpoints.items()
+                ]
+            return sorted(items), [os.getpid()]
+
+        self.flush()
+        merged = {}
+        pids = []
+        for name in sorted(os.listdir(self.shared_dir)):
+            if not name.endswith('.json'):
+                continue
+            try:
+                with open(os.path.join(self.shared_dir, name), encoding='utf-8') as f:
+                    state = json.load(f)
+            except (OSError, ValueError):
+                continue
+            pids.append(int(name[:-len('.json')]))
+            for rule, entry in state.items():
+                merged.setdefault(rule, EndpointStats()).merge(entry)
+        return sorted(merged.items()), sorted(pids)
+
+    def observe(self, endpoint, status, seconds, phases, size, encoding, cache):
+        """요청 하나의 측정값을 더합니다."""
+        self._ensure_flusher()
+        with self._lock:
+            self._dirty = True
+            stats = self._endpoints.get(endpoint)
+            if stats is None:
+                stats = self._endpoints[endpoint] = EndpointStats()
+            key = str(status)
+            stats.status[key] = stats.status.get(key, 0) + 1
+            stats.latency.observe(seconds)
+            for name, value in phases.items():
+                if name in stats.phases:
+                    stats.phases[name].observe(value)
+            stats.size.observe(size)
+            stats.encodings[encoding] = stats.encodings.get(encoding, 0) + 1
+            if cache is not None:
+                stats.cache[cache] += 1
+
+    def snapshot(self):
+        """모든 지표를 JSON으로 쓸 수 있는 딕셔너리로 반환합니다."""
+        items, pids = self._collect()
+        return {
+            'pid': os.getpid(),
+            'workers': pids,
+            'uptime_seconds': round(time.time() - self.started_at, 3),
+            'endpoints': {rule: stats.to_dict() for rule, stats in items},
+        }
+
+    def prometheus(self):
+        """Prometheus 텍스트 노출 형식 (version 0.0.4)"""
+        items, _ = self._collect()
+        lines = []
+
+        def header(name, kind, text):
+            lines.append(f"# HELP {name} {text}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        def histogram(name, text, get):
+            header(name, 'histogram', text)
+            for rule, stats in items:
+                hist = get(stats)
+                label = f'endpoint="{_escape(rule)}"'
+                for bound, total in hist.cumulative():
+                    lines.append(f'{name}_bucket{{{label},le="{bound}"}} {total}')
+                lines.append(f"{name}_sum{{{label}}} {hist.sum:.6f}")
+                lines.append(f"{name}_count{{{label}}} {hist.count}")
+
+        header('app_requests_total', 'counter', '엔드포인트/상태 코드별 요청 수')
+        for rule, stats in items:
+            for status, n in sorted(stats.status.items()):
+                lines.append(
+                    f'app_requests_total{{endpoint="{_escape(rule)}",'
+                    f'status="{status}"}} {n}'
+                )
+
+        header('app_response_cache_total', 'counter', '응답 캐시 적중/미스 수')
+        for rule, stats in items:
+            if not any(stats.cache.values()):
+                continue  # 응답 캐시를 쓰지 않는 엔드포인트
+            for result, n in sorted(stats.cache.items()):
+                lines.append(
+                    f'app_response_cache_total{{endpoint="{_escape(rule)}",'
+                    f'result="{result}"}} {n}'
+                )
+
+        header('app_response_encoding_total', 'counter',
+               'Content-Encoding(압축 방식)별 응답 수')
+        for rule, stats in items:
+            for encoding, n in sorted(stats.encodings.items()):
+                lines.append(
+                    f'app_response_encoding_total{{endpoint="{_escape(rule)}",'
+                    f'encoding="{_escape(encoding)}"}} {n}'
+                )
+
+        histogram('app_request_duration_seconds', '요청 전체 처리 시간',
+                  lambda s: s.latency)
+        histogram('app_compute_duration_seconds', '데이터 집계 시간 (캐시 미스 시)',
+                  lambda s: s.phases['compute'])
+        histogram('app_serialize_duration_seconds', 'JSON 직렬화/압축 시간',
+                  lambda s: s.phases['serialize'])
+        histogram('app_response_bytes', '전송한 응답 본문 크기(압축 후)',
+                  lambda s: s.size)
+
+        return '\n'.join(lines) + '\n'
+
+    def view(self):
+        """GET /metrics (Prometheus), /metrics?format=json (JSON)"""
+        if request.args.get('format') == 'json':
+            return jsonify(self.snapshot())
+        return Response(
+            self.prometheus(),
+            content_type='text/plain; version=0.0.4; charset=utf-8'
+        )
+
+
+def _escape(value):
+    """Prometheus 레이블 값 이스케이프"""
+    return (str(value).replace('\\', '\\\\')
+            .replace('"', '\\"').replace('\n', '\\n'))
@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+"""
+응답 본문 사전 압축(gzip / brotli) 도구
+- 압축은 캐시를 채우거나 서버를 시작할 때 한 번만 수행
+- 요청마다 Accept-Encoding에 맞는 압축본을 골라 그대로 전송
+- 디스크에 미리 만들어 둔 압축본(파일.gz / 파일.br)도 그대로 전송
+  (python -m py.export --compact 출력)
+"""
+
+import gzip
+import hashlib
+import mimetypes
+import os
+import threading
+
+from flask import Response, current_app, request, send_from_directory
+
+try:
+    import brotli  # 선택 의존성: 설치된 경우에만 br 압축본 생성
+except ImportError:
+    brotli = None
+
+
+# 이보다 작은 본문은 압축 이득이 작아 원본만 보관
+MIN_COMPRESS_SIZE = 512
+
+# 서버 선호 순서 (클라이언트 품질값이 0보다 크면 앞에서부터 선택)
+PREFERRED_ENCODINGS = ('br', 'gzip')
+
+# ETag 접미사: 압축 방식(content-coding)마다 다른 strong ETag 사용
+_ETAG_SUFFIX = {'identity': '', 'gzip': '-gz', 'br': '-br'}
+
+# 디스크 압축본 확장자
+_FILE_SUFFIX = {'gzip': '.gz', 'br': '.br'}
+
+# 압축 수준: 보관용(한 번 압축해 재사용)은 최대, 요청마다 압축하는 응답은 속도 우선
+CACHED_LEVELS = {'gzip': 9, 'br': 11}
+DYNAMIC_LEVELS = {'gzip': 6, 'br': 5}
+
+
+def compress_variants(body, encodings=PREFERRED_ENCODINGS, levels=None):
+    """
+    본문 바이트의 압축본을 만듭니다.
+
+    :param body: 원본 바이트
+    :param encodings: 만들 압축 방식 (기본: 모두)
+    :param levels: 압축 방식별 수준 (기본: CACHED_LEVELS)
+    :return: {'identity': 원본, 'gzip': ..., 'br': ...} (가능한 것만)
+    """
+    levels = levels or CACHED_LEVELS
+    variants = {'identity': body}
+    if len(body) < MIN_COMPRESS_SIZE:
+        return variants
+
+    if 'gzip' in encodings:
+        variants['gzip'] = gzip.compress(
+            body, compresslevel=levels['gzip'], mtime=0
+        )
+    if 'br' in encodings and brotli is not None:
+        variants['br'] = brotli.compress(body, quality=levels['br'])
+    return variants
+
+
+def compress_for_request(body):
+    """
+    보관하지 않는 응답(범위 조회 등)용: 현재 요청이 받을 수 있는 압축 방식 하나만
+    속도 우선 수준으로 만듭니다. (send_variants에 그대로 전달)
+    """
+    available = [e for e in PREFERRED_ENCODINGS if e != 'br' or brotli is not None]
+    encoding = choose_encoding(available)
+    return compress_variants(body, (encoding,), DYNAMIC_LEVELS)
+
+
+def content_etag(body):
+    """본문 해시 (strong ETag 값)"""
+    return hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+def choose_encoding(variants):
+    """현재 요청의 Accept-Encoding에 맞는 압축 방식을 고릅니다."""
+    accepted = request.accept_encodings
+    for encoding in PREFERRED_ENCODINGS:
+        if encoding in variants and accepted[encoding] > 0:
+            return encoding
+    return 'identity'
+
+
+def send_variants(variants, etag, mimetype, cache_control='no-cache',
+                  last_modified=None):
+    """
+    압축본 중 하나를 골라 조건부(304) 처리까지 마친 응답을 만듭니다.
+
+    :param variants: compress_variants 결과
+    :param etag: 원본 기준 ETag
+    :param mimetype: 응답 MIME 타입
+    :param cache_control: Cache-Control 헤더 값
+    :param last_modified: Last-Modified (선택)
+    :return: Flask Response
+    """
+    encoding = choose_encoding(variants)
+    response = Response(variants[encoding], mimetype=mimetype)
+    if encoding != 'identity':
+        response.headers['Content-Encoding'] = encoding
+    if len(variants) > 1:
+        response.vary.add('Accept-Encoding')
+    response.set_etag(etag + _ETAG_SUFFIX[encoding])
+    response.headers['Cache-Control'] = cache_control
+    if last_modified is not None:
+        response.last_modified = last_modified
+    return response.make_conditional(request)
+
+
+def send_static(directory, filename, **kwargs):
+    """
+    정적 파일을 전송하되, 옆에 원본보다 오래되지 않은 압축본(.br / .gz)이 있고
+    클라이언트가 받을 수 있으면 압축본을 그대로 보냅니다. (요청마다 압축하지 않음)
+
+    :param directory: 정적 파일 디렉토리 (상대 경로는 send_from_directory와 같이
+                      앱 root_path 기준)
+    :param filename: 요청된 파일명
+    :param kwargs: send_from_directory 추가 인자 (mimetype 등)
+    :return: Flask Response (파일이 없으면 send_from_directory의 404)
+    """
+    directory = os.path.join(current_app.root_path, directory)
+    path = os.path.join(directory, filename)
+    if (os.path.commonpath([os.path.abspath(path), os.path.abspath(directory)])
+            == os.path.abspath(directory) and os.path.isfile(path)):
+        mtime = os.stat(path).st_mtime_ns
+        for encoding in PREFERRED_ENCODINGS:
+            sibling = path + _FILE_SUFFIX[encoding]
+            if (request.accept_encodings[encoding] > 0
+                    and os.path.isfile(sibling)
+                    and os.stat(sibling).st_mtime_ns >= mtime):
+                mimetype = kwargs.pop('mimetype', None) or (
+                    mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+                )
+                response = send_from_directory(
+                    directory, filename + _FILE_SUFFIX[encoding],
+                    mimetype=mimetype, **kwargs
+                )
+                response.headers['Content-Encoding'] = encoding
+                response.vary.add('Accept-Encoding')
+                return response
+
+    response = send_from_directory(directory, filename, **kwargs)
+    if any(os.path.isfile(path + suffix) for suffix in _FILE_SUFFIX.values()):
+        response.vary.add('Accept-Encoding')
+    return response
+
+
+class StaticPrecompressor:
+    """
+    정적 파일 디렉토리의 압축본을 메모리에 보관하는 캐시
+    파일의 수정 시각이나 크기가 바뀌면 다시 압축합니다.
+    """
+
+    def __init__(self, directory, extensions=('.js',)):
+        """
+        :param directory: 정적 파일 디렉토리
+        :param extensions: 압축 대상 확장자
+        """
+        self.directory = os.path.abspath(directory)
+        self.extensions = tuple(extensions)
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def _resolve(self, filename):
+        """디렉토리 밖을 가리키는 경로는 거부합니다."""
+        path = os.path.abspath(os.path.join(self.directory, filename))
+        if os.path.commonpath([path, self.directory]) != self.directory:
+            return None
+        return path
+
+    def warm(self):
+        """디렉토리의 대상 파일을 미리 압축합니다. (서버 시작 시 호출)"""
+        if not os.path.isdir(self.directory):
+            return 0
+        count = 0
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                if name.endswith(self.extensions):
+                    rel = os.path.relpath(os.path.join(root, name), self.directory)
+                    if self.get(rel) is not None:
+                        count += 1
+        return count
+
+    def get(self, filename):
+        """
+        압축본 항목을 반환합니다. 대상이 아니거나 파일이 없으면 None
+
+        :return: (variants, etag, mtime) 튜플
+        """
+        if not filename.endswith(self.extensions):
+            return None
+        path = self._resolve(filename)
+        if path is None or not os.path.isfile(path):
+            return None
+
+        st = os.stat(path)
+        signature = (st.st_size, st.st_mtime_ns)
+        entry = self._entries.get(path)
+        if entry is not None and entry[0] == signature:
+            return entry[1]
+
+        with open(path, 'rb') as f:
+            body = f.read()
+        value = (compress_variants(body), content_etag(body), int(st.st_mtime))
+        with self._lock:
+            self._entries[path] = (signature, value)
+        return value
@@ -0,0 +1,253 @@
+# -*- coding: utf-8 -*-
+"""
+프리포크(pre-fork) 멀티 워커 서버 실행 진입점 (Linux / macOS)
+
+마스터 프로세스가 데이터를 한 번만 로드·전처리하고 모든 API 응답을 미리 만든 뒤
+워커 N개를 fork 합니다. 워커는 같은 리스닝 소켓에서 요청을 받으며,
+데이터는 copy-on-write로 공유되어 워커 수만큼 복사되지 않습니다.
+
+- 문자열 열은 category로 변환 (행마다 파이썬 객체가 없어야 페이지가 공유됨)
+- gc.freeze()로 로드된 객체를 GC 추적 대상에서 제외 (GC가 페이지를 건드리지 않도록)
+- --report 옵션으로 워커별 RSS / PSS / 공유 / 전용 메모리 확인
+- /metrics 는 모든 워커의 지표를 합산 (워커마다 임시 디렉토리에 주기적으로 기록)
+- CSV가 바뀌면 워커마다 새 스냅샷을 만들어 교체 (app.py의 DATA_RELOAD_INTERVAL)
+  재로드된 데이터는 워커 간 공유되지 않으므로, 메모리를 다시 줄이려면 서버를 재시작
+
+사용법 (app.py와 같은 폴더에서 실행):
+    python serve.py --host 0.0.0.0 --port 5000 --workers 4 --report
+"""
+
+import argparse
+import gc
+import os
+import shutil
+import signal
+import sys
+import tempfile
+import time
+
+from werkzeug.serving import make_server
+
+
+# ============================================
+# 1. 메모리 측정
+# ============================================
+def read_memory(pid):
+    """
+    /proc/<pid>/smaps_rollup 에서 프로세스 메모리(MB)를 읽습니다. (Linux 전용)
+
+    :return: {'rss', 'pss', 'shared', 'private'} 또는 측정 불가 시 None
+    """
+    fields = {}
+    try:
+        with open(f"/proc/{pid}/smaps_rollup") as f:
+            for line in f:
+                parts = line.split()
+                if len(parts) >= 2 and parts[0].endswith(':'):
+                    fields[parts[0][:-1]] = int(parts[1])  # kB
+    except OSError:
+        return None
+
+    def mb(*keys):
+        return round(sum(fields.get(key, 0) for key in keys) / 1024, 1)
+
+    return {
+        'rss': mb('Rss'),
+        'pss': mb('Pss'),
+        'shared': mb('Shared_Clean', 'Shared_Dirty'),
+        'private': mb('Private_Clean', 'Private_Dirty'),
+    }
+
+
+def print_memory_report(master_pid, worker_pids):
+    """마스터와 워커들의 메모리 사용량을 표로 출력합니다."""
+    rows = [('master', master_pid)] + [
+        (f"worker{i}", pid) for i, pid in enumerate(worker_pids)
+    ]
+    print(f"{'프로세스':<10}{'PID':>8}{'RSS':>10}{'PSS':>10}"
+          f"{'공유':>10}{'전용':>10}  (MB)")
+    total_pss = 0.0
+    for name, pid in rows:
+        mem = read_memory(pid)
+        if mem is None:
+            print(f"{name:<10}{pid:>8}  (메모리 측정 불가: /proc 없음)")
+            continue
+        total_pss += mem['pss']
+        print(f"{name:<10}{pid:>8}{mem['rss']:>10}{mem['pss']:>10}"
+              f"{mem['shared']:>10}{mem['private']:>10}")
+    print(f"전체 PSS(실제 점유 메모리 합): {total_pss:.1f}MB")
+
+
+# ============================================
+# 2. 마스터 준비 (데이터 로드, 응답 캐시 채우기)
+# ============================================
+def warm_responses(app):
+    """모든 JSON API를 형식(records / columns)별로 한 번씩 호출해 캐시를 채웁니다."""
+    client = app.test_client()
+    count = 0
+    for rule in app.url_map.iter_rules():
+        if rule.rule.startswith('/py/') and not rule.arguments:
+            for fmt in ('records', 'columns'):
+                client.get(rule.rule, query_string={'format': fmt})
+            count += 1
+    return count
+
+
+def prepare():
+    """
+    app 모듈을 불러와 데이터를 로드하고, fork 전에 공유 가능한 형태로 정리합니다.
+
+    :return: (Flask 앱, 스냅샷 저장소, 지표 수집기)
+    """
+    from app import app, metrics, store  # 데이터 로드 및 전처리 (1회)
+
+    # 재로드 스레드는 fork 이후 워커마다 다시 시작 (fork 중 잠금 보유 방지)
+    store.stop()
+
+    report = store.current.share_layout()
+    print(f"--- 데이터 메모리 {report['before'] / 2**20:.1f}MB → "
+          f"{report['after'] / 2**20:.1f}MB (문자열 → category) ---")
+    print(f"--- API 응답 캐시 준비 완료 ({warm_responses(app)}개) ---")
+    # 캐시 준비 요청은 지표에서 제외 (워커마다 같은 값을 물려받지 않도록)
+    metrics.reset()
+    # 워커별 지표를 모아 /metrics 에서 합산 (실행마다 새 디렉토리)
+    metrics.share(tempfile.mkdtemp(prefix='metrics-'))
+
+    # 지금까지 만든 객체는 GC 대상에서 제외 (워커에서 GC가 공유 페이지를 쓰지 않도록)
+    gc.collect()
+    gc.freeze()
+    return app, store, metrics
+
+
+# ============================================
+# 3. 워커 관리
+# ============================================
+def spawn_worker(server, store):
+    """워커를 fork 합니다. 자식 프로세스는 요청 처리 루프를 돌다 종료됩니다."""
+    pid = os.fork()
+    if pid:
+        return pid
+
+    # --- 자식 프로세스 ---
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_IGN)  # Ctrl+C는 마스터가 정리
+    store.start()
+    code = 0
+    try:
+        server.serve_forever()
+    except Exception as e:
+        print(f"[worker {os.getpid()}] 오류로 종료: {e}", file=sys.stderr)
+        code = 1
+    finally:
+        os._exit(code)
+
+
+def stop_workers(workers, timeout=10.0):
+    """워커들에 SIGTERM을 보내고 종료를 기다립니다."""
+    for pid in list(workers):
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except ProcessLookupError:
+            workers.discard(pid)
+
+    deadline = time.monotonic() + timeout
+    while workers and time.monotonic() < deadline:
+        try:
+            pid, _ = os.waitpid(-1, os.WNOHANG)
+        except ChildProcessError:
+            break
+        if pid:
+            workers.discard(pid)
+        else:
+            time.sleep(0.05)
+
+    for pid in workers:
+        try:
+            os.kill(pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+
+
+def serve(app, store, host, port, workers, threaded=True, report=False):
+    """
+    소켓을 연 뒤 워커를 fork 하고, 종료된 워커는 다시 띄웁니다.
+
+    :param store: 데이터 스냅샷 저장소 (워커에서 재로드 스레드 시작)
+    :param workers: 워커 프로세스 수
+    :param threaded: 워커마다 요청을 스레드로 처리할지 여부
+    :param report: 워커 시작 후 메모리 사용량 출력 여부
+    """
+    server = make_server(host, port, app, threaded=threaded)
+    print(f"--- http://{host}:{port} 워커 {workers}개로 서비스 시작 "
+          f"(마스터 PID {os.getpid()}) ---")
+
+    pids = set()
+    stopping = False
+
+    def handle_stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+
+    signal.signal(signal.SIGTERM, handle_stop)
+    signal.signal(signal.SIGINT, handle_stop)
+
+    for _ in range(workers):
+        pids.add(spawn_worker(server, store))
+
+    if report:
+        time.sleep(1.0)
+        print_memory_report(os.getpid(), sorted(pids))
+
+    try:
+        while not stopping:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                pid = 0
+            if not pid:
+                time.sleep(0.2)
+                continue
+            pids.discard(pid)
+            if not stopping:
+                print(f"[master] 워커 {pid} 종료(상태 {status}) → 재시작",
+                      file=sys.stderr)
+                pids.add(spawn_worker(server, store))
+    finally:
+        print("--- 워커 종료 중... ---")
+        stop_workers(pids)
+        server.server_close()
+
+
+# ============================================
+# 4. 실행
+# ============================================
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='데이터 1회 로드 후 워커를 fork 하는 멀티 프로세스 서버'
+    )
+    parser.add_argument('--host', default='0.0.0.0', help='바인드 주소')
+    parser.add_argument('--port', type=int, default=5000, help='포트')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help='워커 프로세스 수 (기본: CPU 코어 수)')
+    parser.add_argument('--no-threads', action='store_true',
+                        help='워커당 요청을 하나씩 순차 처리')
+    parser.add_argument('--report', action='store_true',
+                        help='워커 시작 후 프로세스별 메모리 사용량 출력')
+    args = parser.parse_args(argv)
+
+    if not hasattr(os, 'fork'):
+        print("이 운영체제는 fork를 지원하지 않습니다. app.py를 직접 실행하세요.",
+              file=sys.stderr)
+        return 1
+
+    app, store, metrics = prepare()
+    try:
+        serve(app, store, args.host, args.port, max(1, args.workers),
+              threaded=not args.no_threads, report=args.report)
+    finally:
+        shutil.rmtree(metrics.shared_dir, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
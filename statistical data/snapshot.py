@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+"""
+데이터 스냅샷 무중단 교체(hot reload) 도구
+- 원본 파일이 바뀌면 백그라운드 스레드에서 새 스냅샷을 끝까지 만든 뒤 참조만 교체
+- 새 스냅샷 생성/검사에 실패하면 기존 스냅샷으로 계속 서비스
+- 요청은 시작할 때 store.current를 한 번 읽어 그 스냅샷으로 끝까지 처리
+"""
+
+import os
+import threading
+import time
+
+
+class SnapshotStore:
+    """
+    현재 서비스 중인 데이터 스냅샷을 보관하고, 원본 파일 변경 시 교체하는 저장소
+    """
+
+    def __init__(self, factory, watch_paths, interval=60.0):
+        """
+        :param factory: 새 스냅샷을 만들고 검사까지 마치는 함수 (실패 시 예외)
+        :param watch_paths: 변경을 감시할 원본 파일 경로 목록
+        :param interval: 변경 확인 주기(초), None 또는 0이면 자동 재로드 안 함
+        """
+        self.factory = factory
+        self.watch_paths = tuple(watch_paths)
+        self.interval = interval
+
+        self.current = None
+        self.generation = 0
+        self.loaded_at = None
+        self.last_error = None
+
+        self._signature = None
+        self._failed_signature = None
+        self._lock = threading.Lock()  # 동시에 하나의 스냅샷만 생성
+        self._stop = threading.Event()
+        self._thread = None
+
+    def file_signature(self):
+        """감시 파일들의 (경로, 크기, 수정 시각) 목록, 없는 파일이 있으면 None"""
+        try:
+            return tuple(
+                (path, st.st_size, st.st_mtime_ns)
+                for path, st in ((p, os.stat(p)) for p in self.watch_paths)
+            )
+        except OSError:
+            return None
+
+    def _swap(self, snapshot, signature):
+        """참조 교체 (진행 중인 요청은 이전 스냅샷을 계속 사용)"""
+        self.current = snapshot
+        self._signature = signature
+        self._failed_signature = None
+        self.generation += 1
+        self.loaded_at = time.time()
+        self.last_error = None
+
+    def load(self, builder=None):
+        """
+        스냅샷을 만들어 바로 적용합니다. (서버 시작 시 사용, 실패하면 예외 그대로 전달)
+
+        :param builder: 스냅샷 생성 함수 (기본: factory)
+        :return: 적용된 스냅샷
+        """
+        with self._lock:
+            signature = self.file_signature()
+            snapshot = (builder or self.factory)()
+            self._swap(snapshot, signature)
+            return snapshot
+
+    def reload(self, force=False):
+        """
+        원본이 바뀌었으면 새 스냅샷을 만들어 교체합니다.
+
+        :param force: True이면 변경 여부와 관계없이 다시 생성
+        :return: 교체했으면 True
+        """
+        with self._lock:
+            signature = self.file_signature()
+            if signature is None:
+                return False  # 파일 교체 중일 수 있으므로 다음 확인까지 대기
+            if not force and signature in (self._signature, self._failed_signature):
+                return False
+
+            try:
+                snapshot = self.factory()
+            except Exception as e:  # 실패해도 기존 스냅샷으로 서버 유지
+                self._failed_signature = signature
+                self.last_error = f"{type(e).__name__}: {e}"
+                print(f"--- 데이터 재로드 실패, 기존 데이터 유지: {self.last_error} ---")
+                return False
+
+            self._swap(snapshot, signature)
+            print(f"--- 데이터 재로드 완료 (generation {self.generation}) ---")
+            return True
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.reload()
+
+    def start(self):
+        """변경 감시 스레드를 시작합니다. (이미 실행 중이거나 주기가 없으면 무시)"""
+        if not self.interval:
+            return
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name='snapshot-reloader', daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        """변경 감시 스레드를 멈춥니다. (진행 중인 재로드는 끝까지 수행)"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def status(self):
+        """현재 스냅샷 정보"""
+        return {
+            'generation': self.generation,
+            'loaded_at': self.loaded_at,
+            'last_error': self.last_error,
+            'watching': self._thread is not None and self._thread.is_alive(),
+        }
@@ -0,0 +1,128 @@
+"""
+pytest 공통 설정 / 픽스처
+
+실행 방법 (저장소 루트에서):
+    pytest
+
+주의: `python -m pytest`는 현재 폴더가 sys.path 맨 앞에 들어가 저장소의 py 패키지가
+pytest 내부에서 쓰는 pylib 호환 모듈(py)을 가리므로 pytest 명령으로 실행합니다.
+"""
+
+import importlib.util
+import os
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+APP_DIR = ROOT_DIR / 'statistical data'
+
+# pytest가 먼저 불러 둔 pylib 호환 모듈(py)을 내리고 저장소의 py 패키지를 사용
+sys.modules.pop('py', None)
+for path in (str(APP_DIR), str(ROOT_DIR)):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+from py import date_cmp as dc  # noqa: E402
+from py.bench.generator import generate_regional, generate_transactions  # noqa: E402
+
+
+# ============================================
+# 합성 데이터
+# ============================================
+@pytest.fixture(scope='session')
+def transactions_csv(tmp_path_factory):
+    """여러 날짜 형식이 섞인 합성 거래 CSV (3,000행, 2019-12 ~ 2021-02)"""
+    path = tmp_path_factory.mktemp('transactions') / 'apt_20y_data.csv'
+    return generate_transactions(
+        path, 3_000, start='2019-12-01', end='2021-02-28', seed=7
+    )
+
+
+@pytest.fixture
+def transactions(transactions_csv):
+    """합성 거래 원본 DataFrame (테스트마다 새로 읽음)"""
+    return pd.read_csv(transactions_csv)
+
+
+@pytest.fixture
+def clean_transactions(transactions):
+    """날짜/금액을 정리한 합성 거래 DataFrame"""
+    df = dc.clean_date_column(transactions, '거래일')
+    return dc.safe_numeric(df, '거래금액')
+
+
+@pytest.fixture
+def regional_dir(tmp_path):
+    """2019, 2020년 KOSIS 형식 거래량 / 호수·면적 CSV 폴더"""
+    data_dir = tmp_path / 'data'
+    generate_regional(data_dir, years=[2019, 2020], seed=3)
+    return data_dir
+
+
+# ============================================
+# Flask 앱 (statistical data/app.py)
+# ============================================
+def write_app_csv(path, rows=2_000, seed=11):
+    """app.py가 읽는 'Apart Deal2020.csv' 형식(YYYY-MM-DD 거래일) 파일을 만듭니다."""
+    generate_transactions(path, rows, start='2020-01-01', end='2021-06-30',
+                          seed=seed)
+    df = dc.clean_date_column(pd.read_csv(path), '거래일')
+    df['거래일'] = df['거래일'].dt.strftime('%Y-%m-%d')
+    df.to_csv(path, index=False)
+    return path
+
+
+@pytest.fixture(scope='session')
+def app_dir(tmp_path_factory):
+    """앱 데이터 파일이 있는 작업 폴더"""
+    directory = tmp_path_factory.mktemp('app')
+    write_app_csv(directory / 'Apart Deal2020.csv')
+    return directory
+
+
+@pytest.fixture(scope='session')
+def app_module(app_dir):
+    """
+    app.py 모듈 (세션에서 한 번 로드, 자동 재로드 끔)
+    serve.py의 `from app import ...`도 같은 모듈을 쓰도록 sys.modules에 등록합니다.
+    """
+    cwd = os.getcwd()
+    reload_interval = os.environ.get('DATA_RELOAD_INTERVAL')
+    os.environ['DATA_RELOAD_INTERVAL'] = '0'
+    os.chdir(app_dir)
+    try:
+        spec = importlib.util.spec_from_file_location('app', APP_DIR / 'app.py')
+        module = importlib.util.module_from_spec(spec)
+        sys.modules['app'] = module
+        spec.loader.exec_module(module)
+    finally:
+        os.chdir(cwd)
+        if reload_interval is None:
+            os.environ.pop('DATA_RELOAD_INTERVAL', None)
+        else:
+            os.environ['DATA_RELOAD_INTERVAL'] = reload_interval
+    yield module
+    module.store.stop()
+
+
+@pytest.fixture
+def data(app_module, app_dir, monkeypatch):
+    """
+    테스트 전용 스냅샷을 store.current로 교체하고, 끝나면 원래 스냅샷으로 되돌립니다.
+    (응답 캐시가 비어 있는 상태에서 시작)
+    """
+    monkeypatch.chdir(app_dir)
+    store = app_module.store
+    previous = store.current
+    snapshot = app_module.Data(app_module.DATA_FILE, exit_on_error=False)
+    store.current = snapshot
+    yield snapshot
+    store.current = previous
+
+
+@pytest.fixture
+def client(app_module, data):
+    return app_module.app.test_client()
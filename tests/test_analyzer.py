@@ -0,0 +1,214 @@
+"""RealEstateAnalyzer 조회 (시도 × 월 큐브, 결과 캐시) 테스트"""
+
+import threading
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from py.config.settings import AnalysisConfig
+from py.core.analyzer import RealEstateAnalyzer
+from py.core.cube import RegionMonthCube
+from py.core.loader import DataLoader
+from py.core.memo import ResultCache
+
+REPO_DATA_DIR = Path(__file__).resolve().parent.parent / 'data'
+
+
+def _analyzer(data_dir, cache_size=0, **kwargs):
+    kwargs.setdefault('use_disk_cache', False)
+    loader = DataLoader(AnalysisConfig(data_dir=data_dir, **kwargs))
+    return RealEstateAnalyzer(loader, cache_size=cache_size)
+
+
+def _reference_volume_and_area(df_v, df_a, sidos=None, start_m=None,
+                               end_m=None):
+    """이전 구현: melt / merge로 만든 시도별 월간 거래 호수 / 면적 'Long' 레코드"""
+    if sidos:
+        df_v = df_v[df_v['시도'].isin(sidos)].reset_index(drop=True)
+        df_a = df_a[df_a['시도'].isin(sidos)].reset_index(drop=True)
+    if df_v.empty or df_a.empty:
+        return []
+
+    vol_long = df_v.melt(id_vars=['시도'], var_name='월', value_name='거래호수')
+    a_cols = [col for col in df_a.columns if '_면적' in col]
+    area_long = df_a.melt(id_vars=['시도'], value_vars=a_cols,
+                          var_name='월_col', value_name='거래면적(천㎡)')
+    area_long['월'] = area_long['월_col'].str.replace('_면적', '')
+    area_long = area_long.drop(columns=['월_col'])
+
+    merged = pd.merge(vol_long, area_long, on=['시도', '월'], how='outer')
+    if start_m:
+        merged = merged[merged['월'] >= start_m]
+    if end_m:
+        merged = merged[merged['월'] <= end_m]
+    merged = merged.fillna(0)
+    merged['거래면적(천㎡)'] = merged['거래면적(천㎡)'].round(0).astype(int)
+    merged['거래호수'] = merged['거래호수'].astype(int)
+    merged = merged.sort_values(by=['시도', '월']).reset_index(drop=True)
+    return merged.to_dict(orient='records')
+
+
+QUERIES = [
+    {},
+    {'sidos': ['서울특별시']},
+    {'sidos': ['부산광역시', '경기도', '없는시도']},
+    {'sidos': ['없는시도']},
+    {'start_m': '3월'},
+    {'end_m': '2월'},
+    {'start_m': '10월', 'end_m': '12월', 'sidos': ['제주특별자치도']},
+    {'start_m': '9월', 'end_m': '1월'},
+]
+
+
+@pytest.fixture(params=['repo', 'synthetic'])
+def cube_data_dir(request, regional_dir):
+    """저장소의 2020년 원본 데이터와 합성 데이터"""
+    return REPO_DATA_DIR if request.param == 'repo' else regional_dir
+
+
+# ============================================
+# 시도 × 월 큐브
+# ============================================
+@pytest.mark.parametrize('query', QUERIES)
+def test_cube_matches_melt_merge(cube_data_dir, query):
+    analyzer = _analyzer(cube_data_dir)
+    df_v = analyzer.loader.load_volume_data()
+    df_a = analyzer.loader.load_area_data()
+
+    expected = _reference_volume_and_area(df_v, df_a, **query)
+    assert analyzer.get_monthly_volume_and_area(**query) == expected
+
+
+def test_cube_missing_values(regional_dir):
+    analyzer = _analyzer(regional_dir)
+    df_v = analyzer.loader.load_volume_data().copy()
+    df_a = analyzer.loader.load_area_data().copy()
+    # 한쪽에만 있는 시도 / 월, 결측값
+    df_v = df_v[df_v['시도'] != '세종특별자치시'].drop(columns=['12월'])
+    df_v.loc[df_v.index[0], '3월'] = float('nan')
+    df_a['5월_면적'] = df_a['5월_면적'].astype('float64')
+    df_a.loc[df_a.index[1], '5월_면적'] = 12.5
+
+    cube = RegionMonthCube.build(df_v, df_a)
+    assert cube.query() == _reference_volume_and_area(df_v, df_a)
+    assert cube.query(sidos=['세종특별자치시']) == []
+
+
+def test_cube_rebuilt_after_reload(regional_dir):
+    analyzer = _analyzer(regional_dir)
+    cube = analyzer._get_cube()
+    assert analyzer._get_cube() is cube
+
+    analyzer.loader.load_volume_data(force_reload=True)
+    rebuilt = analyzer._get_cube()
+    assert rebuilt is not cube
+    assert rebuilt.generation == analyzer.loader.generation
+
+
+def test_frame_and_records_agree(regional_dir):
+    analyzer = _analyzer(regional_dir)
+    records = analyzer.get_monthly_volume_and_area(sidos=['경기도'])
+    df = analyzer.get_frame('get_monthly_volume_and_area', sidos=['경기도'])
+    assert list(df.columns) == ['시도', '월', '거래호수', '거래면적(천㎡)']
+    assert df.to_dict(orient='records') == records
+
+    with pytest.raises(ValueError):
+        analyzer.get_frame('get_unknown')
+
+
+# ============================================
+# 조회 결과 LRU 캐시
+# ============================================
+def test_result_cache_lru():
+    cache = ResultCache(maxsize=2)
+    calls = []
+
+    def get(key, generation=1):
+        return cache.get_or_compute(
+            key, generation, lambda: calls.append(key) or key.upper(),
+            lambda: generation
+        )
+
+    assert [get('a'), get('b'), get('a'), get('c')] == ['A', 'B', 'A', 'C']
+    assert calls == ['a', 'b', 'c']
+    get('b')  # 가장 오래전에 쓴 b가 밀려났으므로 다시 계산
+    assert calls == ['a', 'b', 'c', 'b']
+    info = cache.info()
+    assert (info['hits'], info['misses'], info['size']) == (1, 4, 2)
+
+    get('b', generation=2)  # generation이 바뀌면 모두 버림
+    assert calls[-1] == 'b' and cache.info()['size'] == 1
+
+
+def test_result_cache_disabled():
+    cache = ResultCache(maxsize=0)
+    calls = []
+    for _ in range(2):
+        cache.get_or_compute('a', 1, lambda: calls.append(1), lambda: 1)
+    assert len(calls) == 2 and cache.info()['size'] == 0
+
+
+def test_reload_during_compute_is_not_cached():
+    generation = [1]
+
+    def compute():
+        generation[0] += 1  # 계산하는 동안 다른 스레드가 재로드
+        return 'old'
+
+    cache = ResultCache(maxsize=8)
+    assert cache.get_or_compute('a', 1, compute, lambda: generation[0]) == 'old'
+    assert cache.info()['size'] == 0
+    assert cache.get_or_compute('a', 2, lambda: 'new', lambda: 2) == 'new'
+    assert cache.get_or_compute('a', 2, lambda: 'other', lambda: 2) == 'new'
+
+
+def test_analyzer_cache_hits_and_copies(regional_dir):
+    analyzer = _analyzer(regional_dir, cache_size=8)
+    # 첫 로드 중에 계산한 결과는 generation이 바뀌므로 저장하지 않음 → 미리 로드
+    analyzer._get_cube()
+    first = analyzer.get_sido_monthly_volume(sidos=['경기도', '서울특별시'])
+    first[0]['1월'] = -1  # 반환값을 고쳐도 캐시에는 영향 없음
+    second = analyzer.get_sido_monthly_volume(sidos=['서울특별시', '경기도'])
+    assert second[0]['1월'] != -1
+    assert analyzer.cache_info()['hits'] == 1
+
+    uncached = _analyzer(regional_dir)
+    expected = uncached.get_sido_monthly_volume(sidos=['경기도', '서울특별시'])
+    assert second == expected
+
+
+def test_analyzer_reload_racing_cache_fill(regional_dir, monkeypatch):
+    analyzer = _analyzer(regional_dir, cache_size=8,
+                         reload_check_interval=None)
+    loader = analyzer.loader
+    loader.load_volume_data()
+    volume_frame = RealEstateAnalyzer._volume_frame
+    raced = []
+
+    def racing_volume_frame(self, *args):
+        df = volume_frame(self, *args)
+        if not raced:
+            # 결과를 계산한 뒤, 저장하기 전에 다른 스레드에서 원본 변경 + 재로드
+            raced.append(True)
+            source = loader.config.volume_path
+            changed = pd.read_csv(source, encoding='utf-8-sig')
+            changed['1월'] = 7
+            changed.to_csv(source, index=False, encoding='utf-8-sig')
+            thread = threading.Thread(
+                target=loader.load_volume_data, kwargs={'force_reload': True}
+            )
+            thread.start()
+            thread.join()
+        return df
+
+    monkeypatch.setattr(RealEstateAnalyzer, '_volume_frame', racing_volume_frame)
+
+    stale = analyzer.get_sido_monthly_volume()
+    assert stale[0]['1월'] != 7
+    assert analyzer.cache_info()['size'] == 0
+
+    fresh = analyzer.get_sido_monthly_volume()
+    assert {r['1월'] for r in fresh} == {7}
+    assert analyzer.get_sido_monthly_volume() == fresh
+    assert analyzer.cache_info()['hits'] == 1
@@ -0,0 +1,229 @@
+"""Flask 앱(statistical data/app.py) JSON API 테스트"""
+
+import json
+
+import pandas as pd
+import pytest
+
+ENDPOINTS = [
+    '/py/층별.json', '/py/일간.json', '/py/주간.json', '/py/월간.json',
+    '/py/년간.json', '/py/아파트 거래량.json', '/py/아파트 거래 면적.json',
+    '/py/월별 아파트 거래량.json', '/py/월별 아파트 거래 면적.json',
+    '/py/월별 아파트 거래 거래량 면적.json',
+]
+
+
+def _origin(app_dir):
+    """이전 구현의 전처리 결과 (거래금액 정수, 시도, 거래일 datetime)"""
+    df = pd.read_csv(app_dir / 'Apart Deal2020.csv', encoding='utf-8')
+    df['거래금액'] = df['거래금액'].str.replace(',', '').astype(int)
+    df['시도'] = df['법정동']
+    df['거래일'] = pd.to_datetime(df['거래일'])
+    return df
+
+
+def _records(df):
+    """이전 구현과 같이 to_dict('records')를 JSON으로 주고받은 값"""
+    return json.loads(json.dumps(df.to_dict('records')))
+
+
+# ============================================
+# 응답 캐시 / ETag
+# ============================================
+@pytest.mark.parametrize('url', ENDPOINTS)
+def test_etag_and_not_modified(client, url):
+    response = client.get(url)
+    assert response.status_code == 200
+    assert response.mimetype == 'application/json'
+    assert response.headers['Cache-Control'] == 'no-cache'
+    etag = response.headers['ETag']
+
+    cached = client.get(url, headers={'If-None-Match': etag})
+    assert cached.status_code == 304
+    assert cached.data == b''
+
+    other = client.get(url, headers={'If-None-Match': '"stale"'})
+    assert other.status_code == 200
+    assert other.data == response.data
+
+
+def test_response_serialized_once(client, data, monkeypatch):
+    first = client.get('/py/층별.json')
+    assert 'get_data_floor' in data._responses
+
+    def fail(*args, **kwargs):
+        raise AssertionError('캐시된 응답은 다시 집계하지 않아야 함')
+
+    monkeypatch.setattr(pd.DataFrame, 'groupby', fail)
+    second = client.get('/py/층별.json')
+    assert second.data == first.data
+    assert second.headers['ETag'] == first.headers['ETag']
+
+
+def test_etag_follows_content(app_module, client, data):
+    etag = client.get('/py/층별.json').headers['ETag']
+
+    # 같은 데이터로 새로 만든 스냅샷은 같은 ETag
+    app_module.store.current = app_module.Data(app_module.DATA_FILE,
+                                               exit_on_error=False)
+    assert client.get('/py/층별.json').headers['ETag'] == etag
+
+    # 데이터가 바뀌면 (preprocess가 캐시를 비우고) 다른 ETag
+    snapshot = app_module.store.current
+    snapshot.df_origin = snapshot.df_origin.iloc[:-10].reset_index(drop=True)
+    snapshot.preprocess()
+    assert snapshot._responses == {}
+    assert client.get('/py/층별.json').headers['ETag'] != etag
+
+
+def test_floor_matches_previous_output(client, app_dir):
+    df = _origin(app_dir)
+    expected = (
+        df.groupby('층')['거래금액'].sum().reset_index()
+        .rename(columns={'층': '구분'})
+    )
+    assert client.get('/py/층별.json').get_json() == {'층별': _records(expected)}
+
+
+# ============================================
+# 기간 코드 기반 집계 = 이전 구현의 결과
+# ============================================
+def _previous_outputs(df):
+    """이전 구현(요청마다 df_origin 복사 + Period 문자열 키)의 응답"""
+    def by_period(freq, label):
+        key = (df['거래일'].dt.year.astype(str) if freq == 'Y'
+               else df['거래일'].dt.to_period(freq).astype(str))
+        return df.assign(**{label: key}).groupby(label).agg(
+            평균거래가=('거래금액', 'mean'), 거래량=('거래금액', 'count')
+        ).reset_index()
+
+    month = df.assign(년월=df['거래일'].dt.to_period('M').astype(str))
+
+    def monthly_pivot(values):
+        pivot = values.pivot(index='년월', columns='시도',
+                             values=values.columns[-1]).fillna(0)
+        pivot = pivot.reset_index()
+        pivot.columns.name = None
+        return pivot
+
+    return {
+        '/py/일간.json': {'일간': by_period('D', '거래일')},
+        '/py/주간.json': {'주간': by_period('W', '주차')},
+        '/py/월간.json': {'월간': by_period('M', '년월')},
+        '/py/년간.json': {'년간': by_period('Y', '년')},
+        '/py/아파트 거래량.json': {
+            '아파트 거래량': df.groupby('시도').size().reset_index(name='거래량')
+        },
+        '/py/아파트 거래 면적.json': {
+            '아파트 거래 면적': df.groupby('시도')['전용면적'].mean().reset_index()
+        },
+        '/py/월별 아파트 거래량.json': {
+            '월별 아파트 거래량': monthly_pivot(
+                month.groupby(['년월', '시도']).size().reset_index(name='거래량')
+            )
+        },
+        '/py/월별 아파트 거래 면적.json': {
+            '월별 아파트 거래 면적': monthly_pivot(
+                month.groupby(['년월', '시도'])['전용면적'].mean().reset_index()
+            )
+        },
+        '/py/월별 아파트 거래 거래량 면적.json': {
+            '월별 아파트 거래 거래량 면적': month.groupby(['년월', '시도']).agg(
+                거래량=('거래금액', 'count'), 평균면적=('전용면적', 'mean')
+            ).reset_index()
+        },
+    }
+
+
+@pytest.mark.parametrize('compact', [False, True])
+def test_outputs_match_previous_implementation(app_module, client, app_dir,
+                                               compact):
+    if compact:
+        app_module.store.current = app_module.Data(
+            app_module.DATA_FILE, compact=True, exit_on_error=False
+        )
+    expected = _previous_outputs(_origin(app_dir))
+    for url, payload in expected.items():
+        body = client.get(url).get_json()
+        if not compact:
+            assert body == {key: _records(df) for key, df in payload.items()}, url
+            continue
+        # compact는 면적을 float32로 저장하므로 평균 면적은 float32 정밀도까지만 같음
+        assert list(body) == list(payload), url
+        for key, df in payload.items():
+            pd.testing.assert_frame_equal(
+                pd.DataFrame(body[key]), pd.DataFrame(_records(df)),
+                check_dtype=False, check_like=True, rtol=1e-6,
+                obj=url
+            )
+
+
+def test_period_codes_do_not_copy_origin(app_module, data, monkeypatch):
+    copy = pd.DataFrame.copy
+
+    def guarded_copy(self, *args, **kwargs):
+        if self is data.df_origin:
+            raise AssertionError('요청마다 df_origin을 복사하지 않아야 함')
+        return copy(self, *args, **kwargs)
+
+    monkeypatch.setattr(pd.DataFrame, 'copy', guarded_copy)
+    with app_module.app.test_request_context():
+        for name in ('get_data_daily', 'get_data_weekly', 'get_data_monthly',
+                     'get_monthly_apt_volume_area'):
+            assert getattr(data, name)().status_code == 200
+
+
+# ============================================
+# 열 단위 응답 형식 (?format=columns)
+# ============================================
+def _rows(columns_body):
+    """{"columns", "data"} 응답을 행 목록으로 되돌립니다."""
+    data = columns_body['data']
+    values = [data[col] for col in columns_body['columns']]
+    return [dict(zip(columns_body['columns'], row)) for row in zip(*values)]
+
+
+@pytest.mark.parametrize('url', ENDPOINTS)
+def test_columns_format_matches_records(client, url):
+    records = client.get(url).get_json()
+    response = client.get(url, query_string={'format': 'columns'})
+    assert response.status_code == 200
+    body = response.get_json()
+
+    [(key, rows)] = records.items()
+    assert set(body) == {'columns', 'data'}
+    assert _rows(body) == rows
+    assert set(body['data']) == set(body['columns'])
+    # 형식마다 따로 보관하며 ETag도 다름
+    assert response.headers['ETag'] != client.get(url).headers['ETag']
+
+
+def test_columns_format_is_cached(client, data):
+    client.get('/py/층별.json', query_string={'format': 'columns'})
+    assert list(data._responses) == ['get_data_floor:columns']
+    client.get('/py/층별.json')
+    assert set(data._responses) == {'get_data_floor', 'get_data_floor:columns'}
+
+
+def test_columns_format_on_pages(client):
+    params = {'from': '2020-02-01', 'to': '2020-04-30', 'limit': 30}
+    records = client.get('/py/일간.json', query_string=params).get_json()
+    body = client.get('/py/일간.json',
+                      query_string=dict(params, format='columns')).get_json()
+    assert _rows(body) == records['일간']
+    assert body['next_cursor'] == records['next_cursor'] is not None
+
+    points = client.get('/py/주간.json', query_string={
+        'points': 10, 'format': 'columns'
+    }).get_json()
+    assert _rows(points) == client.get(
+        '/py/주간.json', query_string={'points': 10}
+    ).get_json()['주간']
+
+
+@pytest.mark.parametrize('url', ['/py/층별.json', '/py/일간.json',
+                                 '/py/월별 아파트 거래량.json'])
+def test_bad_format_returns_400(client, url):
+    response = client.get(url, query_string={'format': 'xml'})
+    assert response.status_code == 400
+    assert 'format' in response.get_data(as_text=True)
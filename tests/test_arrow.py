@@ -0,0 +1,138 @@
+"""Arrow IPC 출력 (serialize / analyzer.to_arrow / export --arrow) 테스트"""
+
+import json
+import shutil
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from py import serialize as sz
+from py.config.settings import AnalysisConfig
+from py.core.analyzer import RealEstateAnalyzer
+from py.core.loader import DataLoader
+from py.export import INPUTS, build
+from py.export.pipeline import main
+
+pa = pytest.importorskip('pyarrow')
+
+
+@pytest.fixture
+def frame():
+    return pd.DataFrame({
+        '시도': pd.Categorical(['서울특별시', '경기도', '서울특별시']),
+        '법정동': ['역삼동', None, '정자동'],
+        '거래금액': np.array([52_000, 31_500, 7], dtype='int32'),
+        '전용면적': np.array([84.97, np.nan, 59.5], dtype='float32'),
+        '거래일': pd.to_datetime(['2020-01-01', None, '2020-12-31']),
+        '비고': [None, None, None],
+        2020: [1.5, 2.5, 3.5],
+    })
+
+
+@pytest.mark.parametrize('kind', ['file', 'stream'])
+def test_round_trip(frame, tmp_path, kind):
+    path = tmp_path / f"frame{sz.ARROW_SUFFIXES[kind]}"
+    body = sz.dump_arrow(frame, path, kind)
+    assert path.read_bytes() == body == sz.arrow_bytes(frame, kind)
+
+    for memory_map in (True, False):
+        table = sz.read_arrow(path, memory_map=memory_map)
+        assert table.schema.field('비고').type == pa.string()
+        assert table.schema.field('거래금액').type == pa.int32()
+        df = table.to_pandas()
+        expected = frame.rename(columns=str)
+        expected['비고'] = expected['비고'].astype(object)
+        pd.testing.assert_frame_equal(df, expected, check_dtype=False)
+        assert df['시도'].dtype == 'category'
+        assert df['전용면적'].dtype == 'float32'
+        assert df['거래일'].dtype.kind == 'M'
+
+
+def test_stream_bytes_open_as_stream(frame):
+    table = pa.ipc.open_stream(sz.arrow_bytes(frame)).read_all()
+    assert table.num_rows == 3
+    assert table.column_names == [str(col) for col in frame.columns]
+
+
+def test_arrow_errors(frame, tmp_path, monkeypatch):
+    with pytest.raises(ValueError):
+        sz.arrow_bytes(frame, 'parquet')
+    monkeypatch.setattr(sz, 'pa', None)
+    with pytest.raises(ImportError):
+        sz.arrow_bytes(frame)
+    with pytest.raises(ImportError):
+        sz.read_arrow(tmp_path / 'missing.arrow')
+
+
+def test_analyzer_to_arrow(regional_dir, tmp_path):
+    loader = DataLoader(AnalysisConfig(data_dir=regional_dir,
+                                       use_disk_cache=False))
+    analyzer = RealEstateAnalyzer(loader)
+    for name in ('get_sido_monthly_volume', 'get_sido_monthly_area',
+                 'get_monthly_volume_and_area'):
+        expected = analyzer.get_frame(name, sidos=['경기도', '서울특별시'])
+        table = pa.ipc.open_stream(
+            analyzer.to_arrow(name, sidos=['경기도', '서울특별시'])
+        ).read_all()
+        pd.testing.assert_frame_equal(table.to_pandas(),
+                                      expected.reset_index(drop=True))
+
+    path = tmp_path / 'volume.arrow'
+    body = analyzer.to_arrow('get_sido_monthly_volume', path=path, kind='file')
+    assert path.read_bytes() == body
+    pd.testing.assert_frame_equal(
+        sz.read_arrow(path).to_pandas(),
+        analyzer.get_frame('get_sido_monthly_volume').reset_index(drop=True)
+    )
+    with pytest.raises(ValueError):
+        analyzer.to_arrow('get_unknown')
+
+
+# ============================================
+# export --arrow
+# ============================================
+@pytest.fixture
+def export_dirs(tmp_path, transactions_csv):
+    data_dir = tmp_path / 'data'
+    data_dir.mkdir()
+    shutil.copy(transactions_csv, data_dir / INPUTS['transactions'])
+    return data_dir, tmp_path / 'out'
+
+
+def test_export_arrow(export_dirs):
+    data_dir, out_dir = export_dirs
+    kwargs = dict(targets=['일간', '층별'], data_dir=data_dir, out_dir=out_dir,
+                  workers=1)
+
+    build(arrow='file', **kwargs)
+    for name in ('일간', '층별'):
+        rows = json.loads((out_dir / f"{name}.json").read_text(
+            encoding='utf-8'))[name]
+        df = sz.read_arrow(out_dir / f"{name}.arrow").to_pandas()
+        assert json.loads(sz.dumps(df)) == rows
+    # JSON과 달리 숫자 열의 dtype이 유지됨
+    schema = sz.read_arrow(out_dir / '일간.arrow').schema
+    assert schema.field('거래건수').type == pa.int64()
+    assert schema.field('평균').type == pa.float64()
+    assert build(arrow='file', **kwargs)['일간']['status'] == 'fresh'
+
+    (out_dir / '층별.arrow').unlink()
+    assert build(arrow='file', **kwargs)['층별']['reason'] == 'Arrow 파일 없음'
+
+    report = build(arrow='stream', **kwargs)
+    assert report['일간']['reason'] == 'Arrow 출력 변경 (file → stream)'
+    assert (out_dir / '일간.arrows').exists()
+    assert not (out_dir / '일간.arrow').exists()
+
+    build(**kwargs)
+    assert not list(out_dir.glob('*.arrow*'))
+
+
+def test_export_arrow_requires_pyarrow(export_dirs, monkeypatch):
+    data_dir, out_dir = export_dirs
+    monkeypatch.setattr(sz, 'HAS_ARROW', False)
+    with pytest.raises(SystemExit):
+        main(['--data-dir', str(data_dir), '--out-dir', str(out_dir),
+              '--only', '일간', '--arrow', 'file'])
+    assert not out_dir.exists()
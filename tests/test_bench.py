@@ -0,0 +1,81 @@
+"""벤치마크 합성 데이터 생성기 / 실행기 테스트"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from py import date_cmp as dc
+from py.bench.generator import (
+    SIDOS, generate_regional, generate_transactions, parse_size
+)
+from py.config.settings import AnalysisConfig
+from py.core.analyzer import RealEstateAnalyzer
+from py.core.loader import DataLoader
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+
+@pytest.mark.parametrize('size, rows', [
+    (500, 500), ('100k', 100_000), ('1M', 1_000_000), ('1.5m', 1_500_000),
+    (' 10_000 ', 10_000),
+])
+def test_parse_size(size, rows):
+    assert parse_size(size) == rows
+
+
+def test_generate_transactions(tmp_path):
+    path = generate_transactions(tmp_path / 'a.csv', 2_500, start='2020-01-01',
+                                 end='2020-12-31', seed=1, chunk_rows=1_000)
+    df = pd.read_csv(path)
+    assert list(df.columns) == ['거래일', '거래금액', '층', '전용면적', '법정동']
+    assert len(df) == 2_500
+    assert set(df['법정동']) <= set(SIDOS)
+
+    cleaned = dc.clean_date_column(df, '거래일')
+    assert cleaned.attrs['date_parse_report']['failed'] == 0
+    assert cleaned['거래일'].between('2020-01-01', '2020-12-31').all()
+    amounts = dc.safe_numeric(cleaned, '거래금액')['거래금액']
+    assert amounts.between(500, 900_000).all()
+
+
+def test_generate_transactions_is_deterministic(tmp_path):
+    a = generate_transactions(tmp_path / 'a.csv', 300, seed=5)
+    b = generate_transactions(tmp_path / 'b.csv', 300, seed=5)
+    c = generate_transactions(tmp_path / 'c.csv', 300, seed=6)
+    assert a.read_bytes() == b.read_bytes()
+    assert a.read_bytes() != c.read_bytes()
+
+
+def test_generate_regional_loads(tmp_path):
+    paths = generate_regional(tmp_path, years=[2023, 2024], seed=2)
+    assert len(paths) == 4
+    loader = DataLoader(AnalysisConfig(
+        data_dir=tmp_path, use_disk_cache=False,
+        volume_filename='*년 광역 지자체별 아파트 거래량.csv',
+        area_filename='*년 지자체 거래 호수 및 면적 통계자료.csv',
+    ))
+    records = RealEstateAnalyzer(loader).get_monthly_volume_and_area()
+    assert len(records) == len(SIDOS) * 12 * 2
+    assert all(r['거래호수'] >= 300 for r in records)
+
+
+def test_bench_cli(tmp_path):
+    # 시나리오는 spawn 프로세스에서 실행되므로 pytest 밖에서 CLI로 실행
+    scenarios = ['rollup_stats', 'analyzer_volume_and_area_memo']
+    out = tmp_path / 'result.json'
+    subprocess.run(
+        [sys.executable, '-m', 'py.bench', '--sizes', '1k',
+         '--scenarios', ','.join(scenarios), '--workdir', str(tmp_path),
+         '--out', str(out)],
+        cwd=ROOT_DIR, check=True, capture_output=True
+    )
+    report = json.loads(out.read_text(encoding='utf-8'))
+    assert [r['scenario'] for r in report['results']] == scenarios
+    for result in report['results']:
+        assert 'error' not in result, result
+        assert result['processed'] > 0
+    assert (tmp_path / 'transactions_1k_seed0.csv').exists()
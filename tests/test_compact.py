@@ -0,0 +1,71 @@
+"""compact_dtypes 메모리 절약 타입 프로파일 테스트"""
+
+import numpy as np
+import pandas as pd
+
+from py import date_cmp as dc
+from py.compact import DAY_INDEX_NAT, compact_dtypes
+from py.config.settings import AnalysisConfig
+from py.core.loader import DataLoader
+
+
+def test_compact_preserves_values(clean_transactions):
+    df = clean_transactions
+    compact = compact_dtypes(df)
+
+    assert isinstance(compact['법정동'].dtype, pd.CategoricalDtype)
+    assert compact['층'].dtype == np.int8
+    assert compact['거래금액'].dtype.kind == 'i'
+    assert compact['전용면적'].dtype == np.float32
+
+    pd.testing.assert_frame_equal(
+        compact.astype({'법정동': object}), df,
+        check_dtype=False, rtol=0, atol=5e-5
+    )
+    report = compact.attrs['memory_report']
+    assert report['after'] < report['before']
+
+
+def test_compact_keeps_source_frame(clean_transactions):
+    before = clean_transactions.copy()
+    compact_dtypes(clean_transactions)
+    pd.testing.assert_frame_equal(clean_transactions, before)
+
+
+def test_compact_stats_unchanged(clean_transactions):
+    expected = dc.rollup_stats(clean_transactions, '거래일', '거래금액')
+    compact = compact_dtypes(clean_transactions)
+    result = dc.rollup_stats(compact, '거래일', '거래금액')
+    for period in expected:
+        # 정수로 줄어든 금액의 합계/최대/최소는 정수 타입으로 나옴
+        pd.testing.assert_frame_equal(result[period], expected[period],
+                                      check_dtype=False)
+
+
+def test_compact_parses_raw_strings(transactions):
+    compact = compact_dtypes(transactions.head(100))
+    expected = transactions.head(100)['거래금액'].str.replace(',', '').astype(int)
+    np.testing.assert_array_equal(compact['거래금액'].to_numpy(), expected)
+
+
+def test_day_index():
+    df = pd.DataFrame({'거래일': ['1970-01-02', '2020-01-01', None]})
+    compact = compact_dtypes(df, day_index=True)
+    assert compact['거래일'].dtype == np.int32
+    assert compact['거래일'].tolist() == [1, 18262, DAY_INDEX_NAT]
+
+
+def test_loader_compact_values(regional_dir):
+    plain = DataLoader(AnalysisConfig(data_dir=regional_dir,
+                                      use_disk_cache=False))
+    compact = DataLoader(AnalysisConfig(data_dir=regional_dir,
+                                        use_disk_cache=False, compact=True))
+    for load in ('load_volume_data', 'load_area_data'):
+        expected = getattr(plain, load)()
+        result = getattr(compact, load)()
+        categories = result.select_dtypes('category').columns
+        assert '시도' in categories
+        pd.testing.assert_frame_equal(
+            result.astype({col: object for col in categories}),
+            expected, check_dtype=False
+        )
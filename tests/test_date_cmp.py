@@ -0,0 +1,250 @@
+"""date_cmp 기간별 통계 테스트"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from dateutil import parser
+
+from py import date_cmp as dc
+
+
+def _baseline_stats(df):
+    """기간별 *_stat 함수 결과 (rollup_stats / stream_stats와 같은 형태)"""
+    return {
+        '일간': dc.day_stat(df, '거래일', '거래금액'),
+        '주간': dc.week_stat(df, '거래일', '거래금액'),
+        '월간': dc.month_stat(df, '거래일', '거래금액'),
+        '년간': dc.year_stat(df, '거래일', '거래금액'),
+    }
+
+
+def _assert_stats_equal(result, expected):
+    assert list(result) == list(expected)
+    for period in expected:
+        # year_stat의 '년도'는 dt.year 타입(int32, 결측 날짜가 있으면 float64)을
+        # 따르므로 년간은 값만 비교
+        pd.testing.assert_frame_equal(
+            result[period], expected[period], check_dtype=period != '년간'
+        )
+
+
+# ============================================
+# rollup_stats
+# ============================================
+def test_rollup_stats_matches_stat_functions(clean_transactions):
+    before = clean_transactions.copy()
+    result = dc.rollup_stats(clean_transactions, '거래일', '거래금액')
+    _assert_stats_equal(result, _baseline_stats(clean_transactions))
+    # 원본은 수정하지 않음
+    pd.testing.assert_frame_equal(clean_transactions, before)
+
+
+def test_rollup_stats_with_missing_dates(clean_transactions):
+    df = clean_transactions
+    df.loc[df.index[::50], '거래일'] = pd.NaT
+    _assert_stats_equal(dc.rollup_stats(df, '거래일', '거래금액'),
+                        _baseline_stats(df))
+
+
+def test_rollup_stats_parses_raw_columns(transactions, clean_transactions):
+    # 쉼표 금액 / 날짜 문자열을 그대로 받아도 정리된 입력과 같은 결과
+    raw = transactions.copy()
+    raw['거래일'] = clean_transactions['거래일'].dt.strftime('%Y-%m-%d')
+    _assert_stats_equal(dc.rollup_stats(raw, '거래일', '거래금액'),
+                        dc.rollup_stats(clean_transactions, '거래일', '거래금액'))
+
+
+def test_rollup_stats_periods_and_stats(clean_transactions):
+    stats = ['평균', '최대']
+    result = dc.rollup_stats(clean_transactions, '거래일', '거래금액',
+                             periods=['주간', '일간'], stats=stats)
+    assert list(result) == ['주간', '일간']
+    pd.testing.assert_frame_equal(
+        result['주간'],
+        dc.week_stat(clean_transactions, '거래일', '거래금액', stats=stats)
+    )
+    pd.testing.assert_frame_equal(
+        result['일간'],
+        dc.day_stat(clean_transactions, '거래일', '거래금액', stats=stats)
+    )
+
+
+def test_rollup_stats_rejects_unknown_period(clean_transactions):
+    with pytest.raises(ValueError):
+        dc.rollup_stats(clean_transactions, '거래일', '거래금액', periods=['분기'])
+
+# ============================================
+# stream_stats
+# ============================================
+@pytest.mark.parametrize('chunksize', [97, 1_000, 100_000])
+def test_stream_stats_matches_stat_functions(transactions_csv,
+                                             clean_transactions, chunksize):
+    result = dc.stream_stats(transactions_csv, '거래일', '거래금액',
+                             chunksize=chunksize)
+    _assert_stats_equal(result, _baseline_stats(clean_transactions))
+
+
+def test_stream_stats_periods_and_stats(transactions_csv, clean_transactions):
+    result = dc.stream_stats(transactions_csv, '거래일', '거래금액',
+                             periods=['월간'], stats=['합계', '거래건수'],
+                             chunksize=500)
+    expected = dc.month_stat(clean_transactions, '거래일', '거래금액',
+                             stats=['합계', '거래건수'])
+    assert list(result) == ['월간']
+    pd.testing.assert_frame_equal(result['월간'], expected)
+
+
+def test_stream_stats_empty_file(tmp_path):
+    path = tmp_path / 'empty.csv'
+    path.write_text('거래일,거래금액\n', encoding='utf-8')
+    result = dc.stream_stats(path, '거래일', '거래금액')
+    assert list(result) == list(dc.PERIODS)
+    for period, df in result.items():
+        assert df.empty
+        assert '합계' in df.columns
+
+
+# ============================================
+# clean_date_column
+# ============================================
+def _reference_clean_dates(values):
+    """이전 구현: 행마다 dateutil(fuzzy)로 변환"""
+    text = (
+        pd.Series(values, dtype=object)
+        .astype(str)
+        .str.strip()
+        .str.replace(r'[\u00A0\u202F\u3000]', '', regex=True)
+        .str.replace(r'[^\x00-\x7F]', '', regex=True)
+    )
+
+    def parse_date_safe(x):
+        if not x or x.lower() in ['nan', 'none', 'nat']:
+            return pd.NaT
+        try:
+            return parser.parse(x, yearfirst=True, fuzzy=True)
+        except Exception:
+            return pd.NaT
+
+    return pd.to_datetime(text.apply(parse_date_safe), errors='coerce')
+
+
+MESSY_DATES = [
+    '2020-01-05', ' 2020-01-05 ', '\u00a02020.02.03', '\ufeff2020-05-06',
+    '2020-03-04 13:45', '2020-03-04 0:00', '2020-03-04\u202f0:00',
+    '2020-03-04 23:59:58', '20200607', '2020/03/04', 'Mar 5, 2020',
+    '2020년 4월 1일', '2020.7.8', '2020-02-30', '2020-13-01',
+    '', 'nan', 'NaT', 'None', 'garbage', None, float('nan'),
+]
+
+
+def test_clean_date_column_matches_dateutil(transactions):
+    raw = pd.concat(
+        [transactions['거래일'], pd.Series(MESSY_DATES, dtype=object)],
+        ignore_index=True
+    )
+    expected = _reference_clean_dates(raw)
+
+    df = dc.clean_date_column(pd.DataFrame({'거래일': raw}), '거래일')
+    pd.testing.assert_series_equal(df['거래일'], expected, check_names=False)
+
+
+def test_clean_date_column_report(transactions):
+    raw = pd.concat(
+        [transactions['거래일'], pd.Series(MESSY_DATES, dtype=object)],
+        ignore_index=True
+    )
+    df = dc.clean_date_column(pd.DataFrame({'거래일': raw}), '거래일')
+    report = df.attrs['date_parse_report']
+
+    counted = (sum(report['bulk'].values()) + report['fuzzy']
+               + report['failed'] + report['empty'])
+    assert counted == len(raw)
+    assert report['bulk']['%Y-%m-%d'] > report['fuzzy']
+    assert report['failed'] == int(df['거래일'].isna().sum()) - report['empty']
+
+
+def test_clean_date_column_keeps_datetime():
+    dates = pd.to_datetime(pd.Series(['2020-01-01', None]))
+    df = pd.DataFrame({'거래일': dates})
+    assert dc.clean_date_column(df, '거래일') is df
+    pd.testing.assert_series_equal(df['거래일'], dates, check_names=False)
+
+
+# ============================================
+# DailyStats (증분 집계)
+# ============================================
+def test_daily_stats_matches_rollup(clean_transactions):
+    state = dc.DailyStats.from_frame(clean_transactions, '거래일', '거래금액')
+    assert len(state) == clean_transactions['거래일'].dt.normalize().nunique()
+    result = state.stats()
+    _assert_stats_equal(result, dc.rollup_stats(clean_transactions, '거래일',
+                                                 '거래금액'))
+    _assert_stats_equal(result, _baseline_stats(clean_transactions))
+
+
+@pytest.mark.parametrize('chunks', [2, 7])
+def test_daily_stats_incremental_updates(clean_transactions, chunks):
+    df = clean_transactions
+    df.loc[df.index[::40], '거래일'] = pd.NaT
+    shuffled = df.sample(frac=1, random_state=chunks)
+
+    state = dc.DailyStats()
+    size = -(-len(shuffled) // chunks)
+    for i in range(chunks):
+        state.update(shuffled.iloc[i * size:(i + 1) * size], '거래일', '거래금액')
+        state.stats()  # 만들어 둔 주/월/년 부분 집계가 부분 갱신되는 경로
+    _assert_stats_equal(state.stats(), dc.rollup_stats(df, '거래일', '거래금액'))
+
+
+def test_daily_stats_update_reports_changed_periods(clean_transactions):
+    state = dc.DailyStats.from_frame(clean_transactions, '거래일', '거래금액')
+    before = state.stats()
+    new = pd.DataFrame({'거래일': ['2020-03-04', '2020-03-04'],
+                        '거래금액': ['1,000', '3,000']})
+    changed = state.update(new)
+    assert changed['일간'].tolist() == [pd.Timestamp('2020-03-04')]
+    assert changed['주간'].tolist() == [pd.Timestamp('2020-03-02')]
+    assert changed['월간'].tolist() == [pd.Timestamp('2020-03-01')]
+    assert changed['년간'].tolist() == [2020]
+
+    after = state.stats()
+    expected = dc.rollup_stats(
+        pd.concat([clean_transactions, dc.safe_numeric(
+            dc.safe_datetime(new, '거래일'), '거래금액')]),
+        '거래일', '거래금액'
+    )
+    _assert_stats_equal(after, expected)
+    assert len(after['일간']) == len(before['일간'])
+
+    empty = state.update(pd.DataFrame({'거래일': [None], '거래금액': [1]}))
+    assert all(len(keys) == 0 for keys in empty.values())
+
+
+def test_daily_stats_save_load(clean_transactions, tmp_path):
+    path = tmp_path / 'daily_state.npz'
+    half = len(clean_transactions) // 2
+    state = dc.DailyStats.from_frame(clean_transactions.iloc[:half], '거래일',
+                                     '거래금액')
+    state.save(path)
+
+    loaded = dc.DailyStats.load(path)
+    pd.testing.assert_frame_equal(loaded.daily, state.daily, check_freq=False,
+                                  check_names=False)
+    loaded.update(clean_transactions.iloc[half:], '거래일', '거래금액')
+    _assert_stats_equal(loaded.stats(), dc.rollup_stats(
+        clean_transactions, '거래일', '거래금액'
+    ))
+
+    dc.DailyStats().save(path)
+    assert len(dc.DailyStats.load(path)) == 0
+
+
+def test_daily_stats_rejects_other_version(tmp_path):
+    path = tmp_path / 'daily_state.npz'
+    dc.DailyStats().save(path)
+    with np.load(path) as data:
+        arrays = dict(data)
+    arrays['version'] = np.array(dc.DAILY_STATE_VERSION + 1)
+    np.savez_compressed(path, **arrays)
+    with pytest.raises(ValueError):
+        dc.DailyStats.load(path)
@@ -0,0 +1,130 @@
+"""LTTB 다운샘플링 (py/downsample.py, 일간/주간 API ?points=N) 테스트"""
+
+import math
+
+import numpy as np
+import pytest
+
+from py.downsample import lttb_indices, lttb_union
+
+
+def _reference_lttb(x, y, n_out):
+    """원 논문(Steinarsson, 2013) 방식 그대로의 점 단위 LTTB"""
+    n = len(x)
+    every = (n - 2) / (n_out - 2)
+    selected = [0]
+    a = 0
+    for i in range(n_out - 2):
+        avg_start = math.floor((i + 1) * every) + 1
+        avg_end = min(math.floor((i + 2) * every) + 1, n)
+        avg_x = sum(x[avg_start:avg_end]) / (avg_end - avg_start)
+        avg_y = sum(y[avg_start:avg_end]) / (avg_end - avg_start)
+
+        lo = math.floor(i * every) + 1
+        hi = math.floor((i + 1) * every) + 1
+        best, best_area = lo, -1.0
+        for j in range(lo, hi):
+            area = abs((x[a] - avg_x) * (y[j] - y[a])
+                       - (x[a] - x[j]) * (avg_y - y[a]))
+            if area > best_area:
+                best, best_area = j, area
+        selected.append(best)
+        a = best
+    selected.append(n - 1)
+    return selected
+
+
+@pytest.mark.parametrize('n, n_out', [
+    (10, 3), (100, 7), (1_000, 50), (1_001, 999), (365, 120),
+])
+def test_lttb_matches_reference(n, n_out):
+    rng = np.random.default_rng(n)
+    x = np.cumsum(rng.integers(1, 4, size=n)).astype('float64')
+    y = np.cumsum(rng.normal(size=n))
+    indices = lttb_indices(x, y, n_out)
+    assert indices.tolist() == _reference_lttb(x.tolist(), y.tolist(), n_out)
+
+
+def test_lttb_keeps_ends_and_sizes():
+    x = np.arange(500)
+    y = np.sin(x / 10)
+    indices = lttb_indices(x, y, 40)
+    assert len(indices) == 40
+    assert indices[0] == 0 and indices[-1] == 499
+    assert (np.diff(indices) > 0).all()
+
+    assert lttb_indices(x[:10], y[:10], 10).tolist() == list(range(10))
+    assert lttb_indices(x[:10], y[:10], 50).tolist() == list(range(10))
+    # 결측은 0으로 취급
+    y_nan = y.copy()
+    y_nan[5] = np.nan
+    assert len(lttb_indices(x, y_nan, 40)) == 40
+
+    with pytest.raises(ValueError):
+        lttb_indices(x, y, 2)
+
+
+def test_lttb_union():
+    x = np.arange(1_000)
+    ys = [np.sin(x / 30), np.cos(x / 7)]
+    indices = lttb_union(x, ys, 100)
+    assert len(indices) <= 100
+    assert set(lttb_indices(x, ys[0], 50)) <= set(indices)
+    assert set(lttb_indices(x, ys[1], 50)) <= set(indices)
+    assert len(lttb_union(x, ys, 3)) <= 6  # 열마다 최소 3개
+
+    with pytest.raises(ValueError):
+        lttb_union(x, [], 10)
+
+
+# ============================================
+# ?points=N
+# ============================================
+def _get(client, url, **params):
+    return client.get(url, query_string=params,
+                      headers={'Accept-Encoding': 'identity'})
+
+
+@pytest.mark.parametrize('url, key, label', [
+    ('/py/일간.json', '일간', '거래일'), ('/py/주간.json', '주간', '주차'),
+])
+def test_points_downsamples_full_series(client, url, key, label):
+    full = _get(client, url).get_json()[key]
+    body = _get(client, url, points=20).get_json()
+    rows = body[key]
+    assert body['next_cursor'] is None
+    assert len(rows) <= 20
+    assert rows[0] == full[0] and rows[-1] == full[-1]
+    # 고른 행은 전체 응답의 행 그대로 (순서 유지)
+    positions = [full.index(row) for row in rows]
+    assert positions == sorted(positions)
+
+    everything = _get(client, url, points=len(full) + 5).get_json()[key]
+    assert everything == full
+
+
+def test_points_response_is_cached(client, data, monkeypatch):
+    first = _get(client, '/py/일간.json', points=30)
+    assert 'D:points=30:records' in data._responses
+
+    def fail(*args, **kwargs):
+        raise AssertionError('캐시된 다운샘플링 응답은 다시 계산하지 않아야 함')
+
+    monkeypatch.setattr(type(data), 'downsample', staticmethod(fail))
+    second = _get(client, '/py/일간.json', points=30)
+    assert second.data == first.data
+    assert second.headers['ETag'] == first.headers['ETag']
+
+
+def test_points_within_range(client):
+    params = {'from': '2020-02-01', 'to': '2020-11-30'}
+    ranged = _get(client, '/py/일간.json', **params).get_json()['일간']
+    rows = _get(client, '/py/일간.json', points=15, **params).get_json()['일간']
+    assert len(rows) <= 15
+    assert rows[0] == ranged[0] and rows[-1] == ranged[-1]
+
+
+@pytest.mark.parametrize('points', ['2', '0', 'many', '-5'])
+def test_bad_points_return_400(client, points):
+    assert _get(client, '/py/일간.json', points=points).status_code == 400
+    assert _get(client, '/py/주간.json', points=points).status_code == 400
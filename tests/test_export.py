@@ -0,0 +1,260 @@
+"""증분 JSON 내보내기 파이프라인 (py/export) 테스트"""
+
+import dataclasses
+import json
+import os
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from py import date_cmp as dc
+from py import floor as flo
+from py import serialize as sz
+from py.bench.generator import generate_regional, generate_transactions
+from py.export import pipeline
+from py.export.pipeline import INPUTS, MANIFEST_NAME, TARGETS, build, main
+
+REPO_DATA_DIR = Path(__file__).resolve().parent.parent / 'data'
+ROLLUP_TARGETS = ['일간', '주간', '월간', '년간']
+
+
+def _touch_later(path, seconds=1):
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + seconds * 10**9))
+
+
+@pytest.fixture
+def export_dirs(tmp_path, transactions_csv):
+    """입력 CSV 4종이 있는 data 폴더와 빈 출력 폴더"""
+    data_dir = tmp_path / 'data'
+    data_dir.mkdir()
+    shutil.copy(transactions_csv, data_dir / INPUTS['transactions'])
+    shutil.copy(REPO_DATA_DIR / INPUTS['deal'], data_dir / INPUTS['deal'])
+    generate_regional(data_dir, years=[2020], seed=4)
+    return data_dir, tmp_path / 'out'
+
+
+def _build(export_dirs, **kwargs):
+    data_dir, out_dir = export_dirs
+    kwargs.setdefault('workers', 1)
+    return build(data_dir=data_dir, out_dir=out_dir, **kwargs)
+
+
+def _outputs(out_dir):
+    """출력 JSON 파일명 → 수정 시각 (매니페스트 제외)"""
+    return {p.name: p.stat().st_mtime_ns for p in out_dir.glob('[!.]*.json')}
+
+
+def _statuses(report):
+    return {name: entry['status'] for name, entry in report.items()}
+
+
+def _expected_frames(data_dir):
+    """tojson.ipynb와 같은 순서로 직접 만든 출력"""
+    df = pd.read_csv(data_dir / INPUTS['transactions'])
+    df = dc.safe_numeric(dc.clean_date_column(df, '거래일'), '거래금액')
+    frames = dict(dc.rollup_stats(df, '거래일', '거래금액'))
+    frames['층별'] = flo.floor_home(df['층'])
+    frames['면적'] = flo.mu_home(pd.read_csv(data_dir / INPUTS['deal']))
+    return frames
+
+
+def test_build_matches_direct_output(export_dirs):
+    data_dir, out_dir = export_dirs
+    report = _build(export_dirs)
+    assert _statuses(report) == {name: 'built' for name in TARGETS}
+    assert {entry['reason'] for entry in report.values()} == {'기록 없음'}
+
+    for name, df in _expected_frames(data_dir).items():
+        body = (out_dir / f"{name}.json").read_bytes()
+        assert body == sz.dumps({name: df}, indent=True), name
+
+    manifest = json.loads((out_dir / MANIFEST_NAME).read_text(encoding='utf-8'))
+    assert set(manifest['outputs']) == {f"{name}.json" for name in TARGETS}
+    assert set(manifest['inputs']) == set(INPUTS.values())
+
+
+def test_second_run_skips_then_rebuilds_on_change(export_dirs):
+    data_dir, out_dir = export_dirs
+    _build(export_dirs)
+    mtimes = _outputs(out_dir)
+
+    assert _statuses(_build(export_dirs)) == {name: 'fresh' for name in TARGETS}
+    assert _outputs(out_dir) == mtimes
+
+    # 수정 시각만 바뀐 파일은 해시가 같으므로 최신
+    _touch_later(data_dir / INPUTS['deal'])
+    assert _statuses(_build(export_dirs)) == {name: 'fresh' for name in TARGETS}
+
+    # 거래 데이터가 바뀌면 그 데이터를 쓰는 출력만 다시 생성
+    generate_transactions(data_dir / INPUTS['transactions'], 1_500,
+                          start='2020-01-01', end='2020-12-31', seed=9)
+    _touch_later(data_dir / INPUTS['transactions'])
+    report = _build(export_dirs)
+    rebuilt = ROLLUP_TARGETS + ['층별']
+    assert _statuses(report) == {
+        name: 'built' if name in rebuilt else 'fresh' for name in TARGETS
+    }
+    for name in rebuilt:
+        assert report[name]['reason'] == f"입력 변경: {INPUTS['transactions']}"
+    expected = _expected_frames(data_dir)
+    for name in rebuilt:
+        assert (out_dir / f"{name}.json").read_bytes() == sz.dumps(
+            {name: expected[name]}, indent=True
+        )
+    assert _statuses(_build(export_dirs)) == {name: 'fresh' for name in TARGETS}
+
+
+def test_rebuild_reasons(export_dirs, monkeypatch):
+    _, out_dir = export_dirs
+    _build(export_dirs)
+
+    (out_dir / '일간.json').unlink()
+    (out_dir / '층별.json').write_text('{}', encoding='utf-8')
+    report = _build(export_dirs, targets=['일간', '층별', '년간'])
+    assert report['일간'] == {'status': 'built', 'reason': '출력 파일 없음',
+                            'seconds': report['일간']['seconds']}
+    assert report['층별']['reason'] == '출력 파일이 수정됨'
+    assert report['년간']['status'] == 'fresh'
+
+    report = _build(export_dirs, targets=['년간'], fmt='columns')
+    assert report['년간']['reason'] == '형식 변경 (records → columns)'
+
+    code_hash = pipeline.code_hash
+    monkeypatch.setattr(pipeline, 'code_hash',
+                        lambda target: code_hash(target) + '-changed')
+    assert _build(export_dirs, targets=['면적'])['면적']['reason'] == '코드 변경'
+
+    assert _build(export_dirs, targets=['면적'],
+                  force=True)['면적']['reason'] == '강제 재생성'
+
+
+def test_pipeline_code_change_rebuilds(export_dirs, tmp_path, monkeypatch):
+    """파이프라인 모듈 자체(본문 구성 등)가 바뀌어도 모든 출력을 다시 생성"""
+    _build(export_dirs)
+    changed = tmp_path / 'pipeline.py'
+    changed.write_bytes(Path(pipeline.__file__).read_bytes() + b'\n# changed\n')
+    monkeypatch.setattr(pipeline, '__file__', str(changed))
+    report = _build(export_dirs)
+    assert {entry['reason'] for entry in report.values()} == {'코드 변경'}
+    assert _statuses(_build(export_dirs)) == {name: 'fresh' for name in TARGETS}
+
+
+def test_columns_format_output(export_dirs):
+    _, out_dir = export_dirs
+    _build(export_dirs, targets=['층별'])
+    rows = json.loads((out_dir / '층별.json').read_text(encoding='utf-8'))['층별']
+
+    _build(export_dirs, targets=['층별'], fmt='columns')
+    body = json.loads((out_dir / '층별.json').read_text(encoding='utf-8'))
+    assert body['columns'] == ['구분', '거래건수']
+    assert [dict(zip(body['columns'], row))
+            for row in zip(*body['data'].values())] == rows
+
+
+def test_dry_run_writes_nothing(export_dirs):
+    _, out_dir = export_dirs
+    report = _build(export_dirs, dry_run=True)
+    assert _statuses(report) == {name: 'planned' for name in TARGETS}
+    assert not out_dir.exists()
+
+
+def test_missing_input_is_skipped(export_dirs):
+    data_dir, _ = export_dirs
+    (data_dir / INPUTS['deal']).unlink()
+    report = _build(export_dirs)
+    assert report['면적'] == {
+        'status': 'skipped', 'reason': f"입력 파일 없음: {INPUTS['deal']}"
+    }
+    assert all(entry['status'] == 'built'
+               for name, entry in report.items() if name != '면적')
+
+
+def test_main(export_dirs, capsys):
+    data_dir, out_dir = export_dirs
+    args = ['--data-dir', str(data_dir), '--out-dir', str(out_dir),
+            '--only', '일간,층별', '--workers', '1']
+    assert main(args) == 0
+    assert sorted(_outputs(out_dir)) == ['일간.json', '층별.json']
+    assert '[export] 일간.json: 생성' in capsys.readouterr().err
+
+    assert main(args) == 0
+    assert '[export] 층별.json: 최신' in capsys.readouterr().err
+
+    (data_dir / INPUTS['transactions']).unlink()
+    assert main(args) == 1
+    assert '건너뜀' in capsys.readouterr().err
+
+    with pytest.raises(SystemExit):
+        main(['--only', '없는출력'])
+
+
+# ============================================
+# 병렬 생성 / memory-map 중간 결과
+# ============================================
+def _contents(out_dir):
+    return {p.name: p.read_bytes() for p in out_dir.iterdir()
+            if p.name != MANIFEST_NAME}
+
+
+@pytest.mark.parametrize('compact', [False, True])
+def test_parallel_matches_sequential(export_dirs, tmp_path, compact):
+    data_dir, out_dir = export_dirs
+    sequential = build(data_dir=data_dir, out_dir=tmp_path / 'seq', workers=1,
+                       compact=compact)
+    parallel = build(data_dir=data_dir, out_dir=out_dir, workers=3,
+                     compact=compact)
+    assert _statuses(parallel) == _statuses(sequential)
+    assert _contents(out_dir) == _contents(tmp_path / 'seq')
+
+    manifests = [
+        json.loads((d / MANIFEST_NAME).read_text(encoding='utf-8'))['outputs']
+        for d in (out_dir, tmp_path / 'seq')
+    ]
+    for entry in manifests:
+        for value in entry.values():
+            value.pop('built_at')
+    assert manifests[0] == manifests[1]
+
+
+def test_failed_task_does_not_stop_others(export_dirs, monkeypatch):
+    def broken(run):
+        raise RuntimeError('생성 실패')
+
+    monkeypatch.setitem(TARGETS, '면적',
+                        dataclasses.replace(TARGETS['면적'], build=broken))
+    report = _build(export_dirs, workers=2)
+    assert report['면적']['status'] == 'error'
+    assert report['면적']['error'] == 'RuntimeError: 생성 실패'
+    assert all(entry['status'] == 'built'
+               for name, entry in report.items() if name != '면적')
+
+    # 실패한 출력은 매니페스트에 남지 않아 다음 실행에서 다시 시도
+    monkeypatch.undo()
+    report = _build(export_dirs, workers=2)
+    assert report['면적'] == {'status': 'built', 'reason': '기록 없음',
+                            'seconds': report['면적']['seconds']}
+
+
+def test_staged_columns_are_memory_mapped(export_dirs, tmp_path, monkeypatch):
+    data_dir, _ = export_dirs
+    paths = {name: data_dir / file_name for name, file_name in INPUTS.items()}
+    df = pipeline.Run(paths).get('transactions')
+
+    stage_dir = tmp_path / 'stage'
+    pipeline._run_stage('transactions', paths, stage_dir)
+    monkeypatch.setitem(pipeline.LOADERS, 'transactions',
+                        lambda run: pytest.fail('저장된 중간 결과를 다시 계산함'))
+    staged = pipeline.Run(paths, stage_dir).get('transactions')
+
+    assert list(staged.columns) == list(pipeline.STAGED['transactions'])
+    for col in staged.columns:
+        values = staged[col].to_numpy()
+        assert isinstance(values, np.memmap) or isinstance(values.base, np.memmap)
+        np.testing.assert_array_equal(np.asarray(values), df[col].to_numpy())
+
+    with pytest.raises(TypeError):
+        pipeline.save_columns(df, ('법정동',), tmp_path / 'object')
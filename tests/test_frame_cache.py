@@ -0,0 +1,115 @@
+"""DataLoader 디스크 캐시(FrameCache) 테스트"""
+
+import os
+
+import pandas as pd
+import pytest
+
+from py.config.settings import AnalysisConfig
+from py.core import cache as cache_module
+from py.core.cache import FrameCache
+from py.core.loader import LOADER_VERSION, DataLoader
+
+pytestmark = pytest.mark.skipif(
+    not cache_module.HAS_ARROW, reason='pyarrow 필요'
+)
+
+
+def _loader(data_dir, cache_dir, **kwargs):
+    config = AnalysisConfig(data_dir=data_dir, cache_dir=cache_dir, **kwargs)
+    return DataLoader(config)
+
+
+def test_cached_frame_equals_parsed(regional_dir, tmp_path):
+    cache_dir = tmp_path / 'cache'
+    first = _loader(regional_dir, cache_dir, use_disk_cache=False)
+    expected_v = first.load_volume_data()
+    expected_a = first.load_area_data()
+
+    cold = _loader(regional_dir, cache_dir)
+    pd.testing.assert_frame_equal(cold.load_volume_data(), expected_v)
+    pd.testing.assert_frame_equal(cold.load_area_data(), expected_a)
+    assert len(list(cache_dir.glob('*.feather'))) == 2
+
+    warm = _loader(regional_dir, cache_dir)
+    pd.testing.assert_frame_equal(warm.load_volume_data(), expected_v)
+    pd.testing.assert_frame_equal(warm.load_area_data(), expected_a)
+
+
+def test_cache_hit_skips_parsing(regional_dir, tmp_path, monkeypatch):
+    cache_dir = tmp_path / 'cache'
+    _loader(regional_dir, cache_dir).load_volume_data()
+
+    def fail(*args):
+        raise AssertionError('캐시가 있으면 CSV를 다시 파싱하지 않아야 함')
+
+    monkeypatch.setattr('py.core.loader._read_volume_csv', fail)
+    df = _loader(regional_dir, cache_dir).load_volume_data()
+    assert not df.empty
+
+
+def test_source_change_invalidates(regional_dir, tmp_path):
+    cache_dir = tmp_path / 'cache'
+    config = AnalysisConfig(data_dir=regional_dir, cache_dir=cache_dir)
+    cache = FrameCache(cache_dir, LOADER_VERSION)
+    source = config.volume_path
+
+    DataLoader(config).load_volume_data()
+    old_path = cache.path_for(source)
+    assert old_path.exists()
+
+    df = pd.read_csv(source, encoding='utf-8-sig')
+    df.loc[df.index[-1], '1월'] = 123_456
+    df.to_csv(source, index=False, encoding='utf-8-sig')
+    st = os.stat(source)
+    os.utime(source, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+    assert cache.get(source) is None
+    reloaded = DataLoader(config).load_volume_data()
+    assert reloaded['1월'].iloc[-1] == 123_456
+    # 같은 원본의 이전 캐시 파일은 정리됨
+    assert not old_path.exists()
+    assert cache.path_for(source).exists()
+
+
+def test_version_change_invalidates(regional_dir, tmp_path):
+    source = AnalysisConfig(data_dir=regional_dir).volume_path
+    df = pd.DataFrame({'시도': ['서울특별시'], '1월': [1]})
+    FrameCache(tmp_path, '1').put(source, df)
+
+    pd.testing.assert_frame_equal(FrameCache(tmp_path, '1').get(source), df)
+    assert FrameCache(tmp_path, '2').get(source) is None
+
+
+def test_corrupt_cache_is_rebuilt(regional_dir, tmp_path):
+    cache_dir = tmp_path / 'cache'
+    config = AnalysisConfig(data_dir=regional_dir, cache_dir=cache_dir)
+    expected = DataLoader(config).load_volume_data()
+
+    path = FrameCache(cache_dir, LOADER_VERSION).path_for(config.volume_path)
+    path.write_bytes(b'broken')
+    pd.testing.assert_frame_equal(DataLoader(config).load_volume_data(), expected)
+
+
+def test_same_stem_sources_keep_their_caches(tmp_path):
+    """다른 폴더 / 다른 확장자의 같은 이름 원본은 서로의 캐시를 지우지 않음"""
+    sources = [tmp_path / 'a' / 'data.csv', tmp_path / 'b' / 'data.csv',
+               tmp_path / 'a' / 'data.txt']
+    cache = FrameCache(tmp_path / 'cache', LOADER_VERSION)
+    frames = []
+    for i, source in enumerate(sources):
+        source.parent.mkdir(exist_ok=True)
+        source.write_text(str(i))
+        frames.append(pd.DataFrame({'값': [i]}))
+        cache.put(source, frames[-1])
+
+    for source, df in zip(sources, frames):
+        pd.testing.assert_frame_equal(cache.get(source), df)
+    assert len(list(cache.cache_dir.glob('*.feather'))) == 3
+
+    # 원본이 바뀌면 그 원본의 이전 캐시만 정리됨
+    old_path = cache.path_for(sources[0])
+    sources[0].write_text('changed')
+    cache.put(sources[0], frames[0])
+    assert not old_path.exists()
+    assert len(list(cache.cache_dir.glob('*.feather'))) == 3
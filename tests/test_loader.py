@@ -0,0 +1,244 @@
+"""DataLoader 메모리 캐시 / 재로드 / 다중 파일 테스트"""
+
+import os
+import threading
+import time
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from py.bench.generator import generate_regional
+from py.config.settings import AnalysisConfig
+from py.core import loader as loader_module
+from py.core.analyzer import RealEstateAnalyzer
+from py.core.loader import DataLoader
+
+REPO_DATA_DIR = Path(__file__).resolve().parent.parent / 'data'
+
+
+def _loader(data_dir, **kwargs):
+    kwargs.setdefault('use_disk_cache', False)
+    return DataLoader(AnalysisConfig(data_dir=data_dir, **kwargs))
+
+
+def _touch_later(path, seconds=1):
+    """내용을 바꾼 것처럼 mtime을 뒤로 옮깁니다."""
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + seconds * 10**9))
+
+
+def _rewrite_volume(path, value):
+    df = pd.read_csv(path, encoding='utf-8-sig')
+    df.loc[df.index[-1], '1월'] = value
+    df.to_csv(path, index=False, encoding='utf-8-sig')
+    _touch_later(path)
+
+
+@pytest.fixture
+def counting_reader(monkeypatch):
+    """거래량 CSV 파싱 횟수를 세는 (느린) 읽기 함수로 바꿉니다."""
+    calls = []
+    read = loader_module._read_volume_csv
+
+    def reader(path, encoding):
+        calls.append(path)
+        time.sleep(0.05)
+        return read(path, encoding)
+
+    monkeypatch.setattr(loader_module, '_read_volume_csv', reader)
+    return calls
+
+
+# ============================================
+# 메모리 캐시 / 재로드
+# ============================================
+def test_concurrent_loads_parse_once(regional_dir, counting_reader):
+    loader = _loader(regional_dir)
+    results = []
+    barrier = threading.Barrier(8)
+
+    def load():
+        barrier.wait()
+        results.append(loader.load_volume_data())
+
+    threads = [threading.Thread(target=load) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(counting_reader) == 1
+    assert all(df is results[0] for df in results)
+    stats = loader.cache_stats()
+    assert stats['misses'] == 1 and stats['hits'] == 7
+    assert stats['generation'] == 1
+
+
+def test_source_change_reloads(regional_dir, counting_reader):
+    loader = _loader(regional_dir, reload_check_interval=0)
+    first = loader.load_volume_data()
+    assert loader.load_volume_data() is first
+    assert len(counting_reader) == 1
+
+    _rewrite_volume(loader.config.volume_path, 4321)
+    reloaded = loader.load_volume_data()
+    assert reloaded is not first
+    assert reloaded['1월'].iloc[-1] == 4321
+    assert loader.generation == 2
+    assert loader.cache_stats()['reloads'] == 1
+
+
+def test_check_interval_limits_stat_calls(regional_dir, counting_reader):
+    loader = _loader(regional_dir, reload_check_interval=3600)
+    first = loader.load_volume_data()
+    _rewrite_volume(loader.config.volume_path, 4321)
+    # 확인 주기 전에는 기존 데이터, force_reload / refresh 없이 재로드하지 않음
+    assert loader.load_volume_data() is first
+    assert loader.load_volume_data(force_reload=True)['1월'].iloc[-1] == 4321
+
+
+def test_reload_disabled(regional_dir, counting_reader):
+    loader = _loader(regional_dir, reload_check_interval=None)
+    first = loader.load_volume_data()
+    _rewrite_volume(loader.config.volume_path, 4321)
+    assert loader.load_volume_data() is first
+    assert loader.refresh() == 1
+
+
+def test_missing_file_keeps_cache(regional_dir):
+    loader = _loader(regional_dir, reload_check_interval=0)
+    first = loader.load_volume_data()
+    path = loader.config.volume_path
+    moved = path.with_name(path.name + '.bak')
+    os.replace(path, moved)
+    try:
+        assert loader.load_volume_data() is first
+    finally:
+        os.replace(moved, path)
+
+
+def test_refresh_and_clear_cache(regional_dir):
+    loader = _loader(regional_dir, reload_check_interval=0)
+    loader.load_volume_data()
+    loader.load_area_data()
+    assert loader.refresh() == 2
+
+    _rewrite_volume(loader.config.volume_path, 1)
+    assert loader.refresh() == 3
+
+    loader.clear_cache()
+    assert loader.generation == 4
+    assert loader.refresh() == 4  # 로드된 데이터가 없으면 아무것도 읽지 않음
+
+
+# ============================================
+# 다중 연도 파일
+# ============================================
+VOLUME_GLOB = '*년 광역 지자체별 아파트 거래량.csv'
+AREA_GLOB = '*년 지자체 거래 호수 및 면적 통계자료.csv'
+
+
+def test_single_file_matches_plain_read(regional_dir):
+    loader = _loader(regional_dir)
+    df = loader.load_volume_data()
+
+    expected = pd.read_csv(loader.config.volume_path, encoding='utf-8-sig')
+    expected = expected.rename(columns={'광역지방자치단체': '시도'})
+    expected = expected[expected['시도'] != '전국'].reset_index(drop=True)
+    pd.testing.assert_frame_equal(df, expected)
+    assert '연도' not in loader.load_area_data().columns
+
+
+def test_glob_adds_year_column(regional_dir):
+    loader = _loader(regional_dir, volume_filename=VOLUME_GLOB,
+                     area_filename=AREA_GLOB)
+    single = _loader(regional_dir)
+
+    for load in ('load_volume_data', 'load_area_data'):
+        df = getattr(loader, load)()
+        assert list(df.columns[:2]) == ['시도', '연도']
+        assert sorted(df['연도'].unique()) == [2019, 2020]
+        only_2020 = df[df['연도'] == 2020].drop(columns='연도')
+        pd.testing.assert_frame_equal(only_2020.reset_index(drop=True),
+                                      getattr(single, load)())
+
+
+def test_parallel_load_matches_sequential(regional_dir):
+    kwargs = dict(volume_filename=VOLUME_GLOB, area_filename=AREA_GLOB)
+    sequential = _loader(regional_dir, max_workers=1, **kwargs)
+    parallel = _loader(regional_dir, max_workers=2, **kwargs)
+    for load in ('load_volume_data', 'load_area_data'):
+        pd.testing.assert_frame_equal(getattr(parallel, load)(),
+                                      getattr(sequential, load)())
+
+
+def test_file_list_adds_year_column(regional_dir):
+    names = [f"{year}년 광역 지자체별 아파트 거래량.csv"
+             for year in (2020, 2019)]
+    df = _loader(regional_dir, volume_filename=names).load_volume_data()
+    assert df['연도'].tolist() == [2020] * 17 + [2019] * 17
+
+
+def test_glob_picks_up_new_year(regional_dir):
+    loader = _loader(regional_dir, volume_filename=VOLUME_GLOB,
+                     reload_check_interval=0)
+    assert sorted(loader.load_volume_data()['연도'].unique()) == [2019, 2020]
+
+    generate_regional(regional_dir, years=[2021], seed=5)
+    df = loader.load_volume_data()
+    assert sorted(df['연도'].unique()) == [2019, 2020, 2021]
+    assert loader.generation == 2
+
+
+def test_analyzer_year_filter(regional_dir):
+    multi = RealEstateAnalyzer(_loader(
+        regional_dir, volume_filename=VOLUME_GLOB, area_filename=AREA_GLOB
+    ))
+    records = multi.get_sido_monthly_volume(start_y=2020, end_y=2020)
+    assert len(records) == 17
+    assert {r['연도'] for r in records} == {2020}
+    long = multi.get_monthly_volume_and_area(sidos=['서울특별시'], start_y=2019,
+                                             end_y=2019)
+    assert len(long) == 12
+    assert {r['연도'] for r in long} == {2019}
+
+    # 단일 파일 설정은 '연도' 열 없이 파일명의 연도(2020)로 연도 조건을 적용
+    single = RealEstateAnalyzer(_loader(regional_dir))
+    assert len(single.get_sido_monthly_volume(start_y=2020)) == 17
+    assert single.get_sido_monthly_volume(start_y=2021) == []
+    assert len(single.get_sido_monthly_volume()) == 17
+    assert '연도' not in single.get_sido_monthly_volume(end_y=2020)[0]
+
+
+@pytest.mark.parametrize('compact', [False, True])
+def test_default_config_year_range(compact):
+    """저장소의 2020년 파일(기본 설정)에 2020년을 조회하면 전체 데이터"""
+    analyzer = RealEstateAnalyzer(_loader(REPO_DATA_DIR, compact=compact))
+    for method in ('get_sido_monthly_volume', 'get_sido_monthly_area',
+                   'get_monthly_volume_and_area'):
+        everything = getattr(analyzer, method)()
+        assert everything
+        assert getattr(analyzer, method)(start_y=2020) == everything
+        assert getattr(analyzer, method)(start_y=2020, end_y=2020) == everything
+        assert getattr(analyzer, method)(end_y=2019) == []
+        assert getattr(analyzer, method)(start_y=2021) == []
+    assert analyzer.get_monthly_volume_and_area(
+        sidos=['서울특별시'], start_m='3월', end_m='5월', start_y=2020
+    ) == analyzer.get_monthly_volume_and_area(
+        sidos=['서울특별시'], start_m='3월', end_m='5월'
+    )
+
+
+def test_year_unknown_file_name(regional_dir):
+    """파일명에 연도가 없으면 연도 조건에 맞는 행이 없음"""
+    for name in ('2020년 광역 지자체별 아파트 거래량.csv',
+                 '2020년 지자체 거래 호수 및 면적 통계자료.csv'):
+        (regional_dir / name).rename(regional_dir / name.replace('2020년 ', ''))
+    analyzer = RealEstateAnalyzer(_loader(
+        regional_dir, volume_filename='광역 지자체별 아파트 거래량.csv',
+        area_filename='지자체 거래 호수 및 면적 통계자료.csv'
+    ))
+    assert len(analyzer.get_sido_monthly_volume()) == 17
+    assert analyzer.get_sido_monthly_volume(start_y=2020) == []
+    assert analyzer.get_monthly_volume_and_area(start_y=2020) == []
@@ -0,0 +1,169 @@
+"""엔드포인트별 성능 지표 (statistical data/metrics.py, /metrics) 테스트"""
+
+import gc
+import os
+import shutil
+
+import pytest
+from flask import Flask
+
+import serve
+from metrics import Histogram, Metrics, mark_cache, phase
+
+
+@pytest.fixture
+def metrics_app():
+    app = Flask(__name__)
+    metrics = Metrics(app)
+    cached = set()
+
+    @app.route('/a')
+    def a():
+        mark_cache('a' in cached)
+        cached.add('a')
+        with phase('compute'):
+            body = 'x' * 2_000
+        with phase('serialize'):
+            pass
+        return body
+
+    @app.route('/b/<int:n>')
+    def b(n):
+        return 'b', 200 if n else 500
+
+    return app, metrics
+
+
+def test_counts_per_endpoint(metrics_app):
+    app, metrics = metrics_app
+    client = app.test_client()
+    for _ in range(3):
+        client.get('/a')
+    client.get('/b/1')
+    client.get('/b/0')
+    client.get('/missing')
+    client.get('/metrics')
+
+    endpoints = metrics.snapshot()['endpoints']
+    assert set(endpoints) == {'/a', '/b/<int:n>', '<unmatched>'}
+    a = endpoints['/a']
+    assert a['requests'] == {'200': 3}
+    assert a['cache'] == {'hit': 2, 'miss': 1}
+    assert a['latency_seconds']['count'] == 3
+    assert a['compute_seconds']['count'] == 3
+    assert a['serialize_seconds']['count'] == 3
+    assert a['response_bytes']['buckets']['10000'] == 3
+    assert a['encodings'] == {'identity': 3}
+    assert endpoints['/b/<int:n>']['requests'] == {'200': 1, '500': 1}
+    assert endpoints['/b/<int:n>']['cache'] == {'hit': 0, 'miss': 0}
+    assert endpoints['<unmatched>']['requests'] == {'404': 1}
+
+
+def test_metrics_views(metrics_app):
+    app, metrics = metrics_app
+    client = app.test_client()
+    client.get('/a')
+    client.get('/a')
+
+    text = client.get('/metrics').get_data(as_text=True)
+    assert 'app_requests_total{endpoint="/a",status="200"} 2' in text
+    assert 'app_response_cache_total{endpoint="/a",result="hit"} 1' in text
+    assert ('app_request_duration_seconds_bucket{endpoint="/a",le="+Inf"} 2'
+            in text)
+    assert 'app_response_bytes_count{endpoint="/a"} 2' in text
+
+    body = client.get('/metrics?format=json').get_json()
+    assert body['workers'] == [os.getpid()]
+    assert body['endpoints']['/a']['requests'] == {'200': 2}
+
+    metrics.reset()
+    assert metrics.snapshot()['endpoints'] == {}
+
+
+def test_phase_outside_request():
+    with phase('compute'):
+        pass
+    mark_cache(True)  # 요청 밖에서는 아무것도 기록하지 않음
+
+
+def test_histogram():
+    hist = Histogram((1, 10, 100))
+    for value in (0.5, 1, 5, 50, 500):
+        hist.observe(value)
+    assert hist.cumulative() == [(1, 2), (10, 3), (100, 4), ('+Inf', 5)]
+    assert hist.quantile(0.5) == 10
+    assert hist.quantile(1.0) == '+Inf'
+    assert Histogram((1,)).quantile(0.5) is None
+
+    other = Histogram((1, 10, 100))
+    other.merge(hist.state())
+    other.merge(hist.state())
+    assert other.count == 10 and other.sum == hist.sum * 2
+    other.merge(Histogram((1,)).state())  # 구간이 다르면 무시
+    assert other.count == 10
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason='fork 필요')
+def test_shared_metrics_across_processes(metrics_app, tmp_path):
+    app, metrics = metrics_app
+    metrics.share(tmp_path / 'metrics', flush_interval=3600)
+    client = app.test_client()
+    client.get('/a')
+
+    pid = os.fork()
+    if pid == 0:  # 워커: 요청 2개를 처리하고 기록
+        code = 1
+        try:
+            metrics.reset()
+            client.get('/a')
+            client.get('/b/1')
+            metrics.flush()
+            code = 0
+        finally:
+            os._exit(code)
+    _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
+
+    body = metrics.snapshot()
+    assert body['workers'] == sorted([os.getpid(), pid])
+    assert body['endpoints']['/a']['requests'] == {'200': 2}
+    assert body['endpoints']['/b/<int:n>']['requests'] == {'200': 1}
+
+    # 종료된 워커의 기록도 남아 카운터가 줄지 않음
+    client.get('/a')
+    assert metrics.snapshot()['endpoints']['/a']['requests'] == {'200': 3}
+
+
+# ============================================
+# app.py 연동
+# ============================================
+def test_app_metrics(app_module, client):
+    app_module.metrics.reset()
+    client.get('/py/층별.json')
+    client.get('/py/층별.json', headers={'Accept-Encoding': 'gzip'})
+    client.get('/py/일간.json', query_string={'limit': 'x'})
+
+    endpoints = client.get('/metrics?format=json').get_json()['endpoints']
+    floor = endpoints['/py/층별.json']
+    assert floor['requests'] == {'200': 2}
+    assert floor['cache'] == {'hit': 1, 'miss': 1}
+    assert floor['compute_seconds']['count'] == 1
+    assert endpoints['/py/일간.json']['requests'] == {'400': 1}
+
+
+def test_prepare_drops_warmup_requests(app_module, data, monkeypatch):
+    metrics = app_module.metrics
+    monkeypatch.setattr(metrics, 'shared_dir', None)
+    monkeypatch.setattr(metrics, 'flush_interval', metrics.flush_interval)
+    try:
+        app, store, prepared = serve.prepare()
+    finally:
+        gc.unfreeze()
+    try:
+        assert prepared is metrics and store is app_module.store
+        assert data.shared
+        assert metrics.snapshot()['endpoints'] == {}
+        assert os.path.isdir(metrics.shared_dir)
+        assert set(app_module.CACHED_METHODS) <= set(data._responses)
+    finally:
+        shutil.rmtree(metrics.shared_dir, ignore_errors=True)
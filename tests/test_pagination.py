@@ -0,0 +1,121 @@
+"""일간/주간 API 범위 조회 / 커서 페이지네이션 테스트"""
+
+import gzip
+
+import pytest
+
+PERIODS = [('/py/일간.json', '일간', '거래일'), ('/py/주간.json', '주간', '주차')]
+
+
+def _get(client, url, **params):
+    return client.get(url, query_string=params,
+                      headers={'Accept-Encoding': 'identity'})
+
+
+@pytest.mark.parametrize('url, key, label', PERIODS)
+@pytest.mark.parametrize('limit', [1, 7, 50, 10_000])
+def test_pages_join_to_full_result(client, url, key, label, limit):
+    full = _get(client, url).get_json()[key]
+
+    rows, cursor, pages = [], None, 0
+    while True:
+        params = {'limit': limit}
+        if cursor:
+            params['cursor'] = cursor
+        response = _get(client, url, **params)
+        assert response.status_code == 200
+        body = response.get_json()
+        assert len(body[key]) <= limit
+        rows += body[key]
+        cursor = body['next_cursor']
+        pages += 1
+        if cursor is None:
+            break
+
+    assert rows == full
+    assert pages == -(-len(full) // limit)
+
+
+def test_daily_range(client):
+    full = _get(client, '/py/일간.json').get_json()['일간']
+    body = _get(client, '/py/일간.json', **{'from': '2020-03-01',
+                                             'to': '2020-03-31'}).get_json()
+    assert body['next_cursor'] is None
+    assert body['일간'] == [
+        row for row in full if '2020-03-01' <= row['거래일'] <= '2020-03-31'
+    ]
+
+    # 범위 + limit: 커서가 범위 끝(to)을 기억함
+    first = _get(client, '/py/일간.json', **{'from': '2020-03-01',
+                                              'to': '2020-03-31',
+                                              'limit': 10}).get_json()
+    rest = _get(client, '/py/일간.json', cursor=first['next_cursor']).get_json()
+    assert rest['next_cursor'] is None
+    assert first['일간'] + rest['일간'] == body['일간']
+
+
+def test_weekly_range_starts_at_week_of_from(client):
+    full = _get(client, '/py/주간.json').get_json()['주간']
+    # 2020-03-04(수)가 속한 주(2020-03-02 월요일)부터, to 이전에 시작하는 주까지
+    body = _get(client, '/py/주간.json', **{'from': '2020-03-04',
+                                             'to': '2020-03-29'}).get_json()
+    weeks = [row['주차'] for row in body['주간']]
+    assert weeks[0].startswith('2020-03-02/')
+    assert weeks[-1].startswith('2020-03-23/')
+    assert body['주간'] == [
+        row for row in full if '2020-03-02' <= row['주차'][:10] <= '2020-03-29'
+    ]
+
+
+def test_range_outside_data_is_empty(client):
+    body = _get(client, '/py/일간.json', **{'from': '1990-01-01',
+                                             'to': '1990-12-31'}).get_json()
+    assert body == {'일간': [], 'next_cursor': None}
+
+
+@pytest.mark.parametrize('url, params', [
+    ('/py/일간.json', {'limit': '0'}),
+    ('/py/일간.json', {'limit': 'ten'}),
+    ('/py/일간.json', {'limit': '-3'}),
+    ('/py/일간.json', {'from': '2020-13-01'}),
+    ('/py/일간.json', {'to': 'yesterday'}),
+    ('/py/일간.json', {'cursor': 'not-a-cursor'}),
+    ('/py/일간.json', {'format': 'xml', 'limit': '5'}),
+    ('/py/일간.json', {'points': '10', 'limit': '5'}),
+])
+def test_bad_parameters_return_400(client, url, params):
+    response = _get(client, url, **params)
+    assert response.status_code == 400
+    assert '잘못된 요청 파라미터' in response.get_data(as_text=True)
+
+
+def test_cursor_of_other_endpoint_returns_400(client):
+    weekly = _get(client, '/py/주간.json', limit=2).get_json()
+    cursor = weekly['next_cursor']
+    assert _get(client, '/py/주간.json', cursor=cursor).status_code == 200
+    # 주간 커서를 일간 API에 쓰면 (기간 코드가 다르므로) 거부
+    assert _get(client, '/py/일간.json', cursor=cursor).status_code == 400
+    # 잘린 커서
+    assert _get(client, '/py/주간.json', cursor=cursor[:-4]).status_code == 400
+
+
+def test_other_params_use_cached_full_response(client, data):
+    full = _get(client, '/py/일간.json')
+    busted = _get(client, '/py/일간.json', _='123')
+    assert busted.data == full.data
+    assert busted.headers['ETag'] == full.headers['ETag']
+    assert list(data._responses) == ['get_data_daily']
+
+
+def test_page_responses_are_compressed(client):
+    params = {'from': '2020-01-01', 'to': '2020-12-31'}
+    plain = _get(client, '/py/일간.json', **params)
+    response = client.get('/py/일간.json', query_string=params,
+                          headers={'Accept-Encoding': 'gzip'})
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert gzip.decompress(response.data) == plain.data
+
+    again = client.get('/py/일간.json', query_string=params, headers={
+        'Accept-Encoding': 'gzip', 'If-None-Match': response.headers['ETag']
+    })
+    assert again.status_code == 304
@@ -0,0 +1,290 @@
+"""응답 압축본(gzip / brotli) 테스트"""
+
+import gzip
+import json
+import os
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+from flask import Flask
+from werkzeug.exceptions import NotFound
+
+import precompress
+from precompress import (
+    MIN_COMPRESS_SIZE, StaticPrecompressor, compress_variants, content_etag,
+    send_static
+)
+from py import serialize as sz
+from py.export import INPUTS, build
+
+brotli = pytest.importorskip('brotli')
+
+
+def test_compress_variants():
+    body = b'{"a": 1}' * 200
+    variants = compress_variants(body)
+    assert set(variants) == {'identity', 'gzip', 'br'}
+    assert gzip.decompress(variants['gzip']) == body
+    assert brotli.decompress(variants['br']) == body
+    # mtime=0: 같은 본문이면 같은 압축본 (재시작해도 바이트가 같음)
+    assert compress_variants(body)['gzip'] == variants['gzip']
+
+    small = b'x' * (MIN_COMPRESS_SIZE - 1)
+    assert compress_variants(small) == {'identity': small}
+    assert set(compress_variants(body, ('gzip',))) == {'identity', 'gzip'}
+
+
+def test_compress_without_brotli(monkeypatch):
+    monkeypatch.setattr(precompress, 'brotli', None)
+    assert set(compress_variants(b'x' * 1_000)) == {'identity', 'gzip'}
+
+
+@pytest.mark.parametrize('accept, encoding', [
+    ('br, gzip', 'br'),
+    ('gzip, deflate', 'gzip'),
+    ('br;q=0, gzip', 'gzip'),
+    ('identity', None),
+    (None, None),
+])
+def test_api_encoding(client, accept, encoding):
+    url = '/py/일간.json'
+    plain = client.get(url, headers={'Accept-Encoding': 'identity'}).data
+    headers = {'Accept-Encoding': accept} if accept else {}
+    response = client.get(url, headers=headers)
+
+    assert response.headers.get('Content-Encoding') == encoding
+    assert 'Accept-Encoding' in response.headers['Vary']
+    decode = {'br': brotli.decompress, 'gzip': gzip.decompress}
+    body = decode[encoding](response.data) if encoding else response.data
+    assert body == plain
+
+    suffix = {'br': '-br', 'gzip': '-gz', None: ''}[encoding]
+    assert response.headers['ETag'] == f'"{content_etag(plain)}{suffix}"'
+    again = client.get(url, headers=dict(
+        headers, **{'If-None-Match': response.headers['ETag']}
+    ))
+    assert again.status_code == 304
+
+
+def test_small_response_is_not_compressed(client):
+    response = client.get('/py/년간.json', headers={'Accept-Encoding': 'br'})
+    assert len(response.data) < MIN_COMPRESS_SIZE
+    assert 'Content-Encoding' not in response.headers
+    assert 'Accept-Encoding' not in response.headers.get('Vary', '')
+
+
+# ============================================
+# 정적 JS 압축본
+# ============================================
+@pytest.fixture
+def js_dir(tmp_path):
+    directory = tmp_path / 'js'
+    (directory / 'lib').mkdir(parents=True)
+    (directory / 'chart.js').write_text('var x = 1;\n' * 300)
+    (directory / 'lib' / 'util.js').write_text('var y = 2;\n' * 300)
+    (directory / 'style.css').write_text('body {}\n' * 300)
+    (tmp_path / 'secret.js').write_text('secret')
+    return directory
+
+
+def test_static_precompressor(js_dir):
+    files = StaticPrecompressor(js_dir)
+    assert files.warm() == 2
+
+    variants, etag, mtime = files.get('chart.js')
+    body = (js_dir / 'chart.js').read_bytes()
+    assert gzip.decompress(variants['gzip']) == body
+    assert etag == content_etag(body)
+    assert files.get('lib/util.js') is not None
+
+    assert files.get('style.css') is None
+    assert files.get('missing.js') is None
+    assert files.get('../secret.js') is None
+
+
+def test_static_precompressor_refreshes(js_dir):
+    files = StaticPrecompressor(js_dir)
+    first = files.get('chart.js')
+    assert files.get('chart.js') is first
+
+    path = js_dir / 'chart.js'
+    path.write_text('var x = 2;\n' * 300)
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    second = files.get('chart.js')
+    assert second[1] != first[1]
+    assert gzip.decompress(second[0]['gzip']) == path.read_bytes()
+
+
+def test_js_route(app_module, client, js_dir, monkeypatch):
+    monkeypatch.setattr(app_module, 'js_files', StaticPrecompressor(js_dir))
+    response = client.get('/js/chart.js', headers={'Accept-Encoding': 'gzip'})
+    assert response.status_code == 200
+    assert response.mimetype == 'text/javascript'
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert gzip.decompress(response.data) == (js_dir / 'chart.js').read_bytes()
+    assert response.last_modified is not None
+
+    again = client.get('/js/chart.js', headers={
+        'Accept-Encoding': 'gzip', 'If-None-Match': response.headers['ETag']
+    })
+    assert again.status_code == 304
+
+
+def test_js_dir_follows_app_root(app_module):
+    expected = os.path.join(app_module.app.root_path, 'js')
+    assert app_module.js_files.directory == os.path.abspath(expected)
+
+
+# ============================================
+# 디스크 압축본 (python -m py.export --compact)
+# ============================================
+@pytest.fixture
+def static_app(tmp_path):
+    directory = tmp_path / 'data'
+    directory.mkdir()
+    app = Flask(__name__)
+
+    @app.route('/data/<path:filename>')
+    def data(filename):
+        return send_static(str(directory), filename)
+
+    return app, directory
+
+
+def test_dump_writes_compressed_siblings(tmp_path):
+    path = tmp_path / '일간.json'
+    payload = {'일간': [{'거래일': f"2020-01-{d:02d}", '거래량': d}
+                      for d in range(1, 29)]}
+    body = sz.dump(payload, path, indent=False, compress=True)
+    assert path.read_bytes() == body
+    assert gzip.decompress((tmp_path / '일간.json.gz').read_bytes()) == body
+    assert brotli.decompress((tmp_path / '일간.json.br').read_bytes()) == body
+
+    # 압축하지 않고 다시 쓰면 오래된 압축본을 지움
+    sz.dump(payload, path)
+    assert not (tmp_path / '일간.json.gz').exists()
+    assert not (tmp_path / '일간.json.br').exists()
+
+    # 작은 본문은 압축본을 만들지 않음
+    assert sz.write_compressed(path, b'{}') == []
+
+
+@pytest.mark.parametrize('orjson_installed', [True, False])
+def test_dump_keeps_four_space_indent(tmp_path, monkeypatch, orjson_installed):
+    """정수 indent는 json.dump(indent=4)와 같은 본문 (orjson은 표준 json으로 대체)"""
+    if not orjson_installed:
+        monkeypatch.setattr(sz, 'orjson', None)
+    df = pd.DataFrame({'거래일': ['2020-01-01', None], '평균': [1.5, np.nan]})
+    body = sz.dump({'일간': df, 'n': 2}, tmp_path / 'result.json', indent=4)
+    assert body == json.dumps(
+        {'일간': sz.to_records(df), 'n': 2}, ensure_ascii=False, indent=4
+    ).encode('utf-8')
+    assert sz.dumps(df, indent=4) == json.dumps(
+        sz.to_records(df), ensure_ascii=False, indent=4
+    ).encode('utf-8')
+
+
+def test_tojson_output(tmp_path, monkeypatch):
+    """TOJSON은 이전처럼 4칸 들여쓰기, compact=True이면 공백 없는 JSON과 압축본"""
+    monkeypatch.syspath_prepend(str(Path(__file__).resolve().parent.parent / 'py'))
+    tojson = pytest.importorskip('TOJSON')
+    monkeypatch.chdir(tmp_path)
+    source = tmp_path / 'apttest.csv'
+    pd.DataFrame({
+        '거래일': pd.date_range('2020-01-01', periods=60, freq='D').astype(str),
+        '거래금액': np.arange(60) * 1_000 + 30_000,
+    }).to_csv(source, index=False)
+
+    tojson.csv_to_json(source)
+    text = (tmp_path / 'result.json').read_text(encoding='utf-8')
+    assert list(json.loads(text)) == ['일간', '주간', '월간', '년간']
+    assert text == json.dumps(json.loads(text), ensure_ascii=False, indent=4)
+    assert not (tmp_path / 'result.json.gz').exists()
+
+    tojson.csv_to_json(source, compact=True)
+    body = (tmp_path / 'result.json').read_bytes()
+    assert json.loads(body) == json.loads(text)
+    assert b'\n' not in body
+    assert gzip.decompress((tmp_path / 'result.json.gz').read_bytes()) == body
+
+
+def test_write_compressed_without_brotli(tmp_path, monkeypatch):
+    path = tmp_path / 'a.json'
+    body = b'[' + b'1,' * 500 + b'1]'
+    assert sz.write_compressed(path, body) == ['.gz', '.br']
+    monkeypatch.setattr(sz, 'brotli', None)
+    assert sz.write_compressed(path, body) == ['.gz']
+    assert not (tmp_path / 'a.json.br').exists()
+
+
+@pytest.mark.parametrize('accept, encoding', [
+    ('gzip, br', 'br'), ('gzip', 'gzip'), ('br;q=0, gzip', 'gzip'),
+    ('identity', None),
+])
+def test_send_static_uses_sibling(static_app, accept, encoding):
+    app, directory = static_app
+    body = sz.dump({'x': list(range(300))}, directory / 'x.json',
+                   indent=False, compress=True)
+
+    response = app.test_client().get('/data/x.json',
+                                     headers={'Accept-Encoding': accept})
+    assert response.status_code == 200
+    assert response.mimetype == 'application/json'
+    assert response.headers.get('Content-Encoding') == encoding
+    assert 'Accept-Encoding' in response.headers['Vary']
+    decode = {'br': brotli.decompress, 'gzip': gzip.decompress,
+              None: lambda data: data}
+    assert decode[encoding](response.data) == body
+
+
+def test_send_static_ignores_stale_sibling(static_app):
+    app, directory = static_app
+    path = directory / 'x.json'
+    sz.dump({'x': list(range(300))}, path, indent=False, compress=True)
+    # 원본만 새로 쓴 경우 (압축본이 원본보다 오래됨)
+    path.write_bytes(b'{"x":[]}')
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+    response = app.test_client().get('/data/x.json',
+                                     headers={'Accept-Encoding': 'br, gzip'})
+    assert 'Content-Encoding' not in response.headers
+    assert response.data == b'{"x":[]}'
+
+
+def test_send_static_rejects_traversal(static_app, tmp_path):
+    app, directory = static_app
+    (tmp_path / 'secret.json').write_text('{}')
+    (tmp_path / 'secret.json.gz').write_bytes(gzip.compress(b'{}'))
+    with app.test_request_context(headers={'Accept-Encoding': 'gzip'}):
+        with pytest.raises(NotFound):
+            send_static(str(directory), '../secret.json')
+    assert app.test_client().get('/data/missing.json').status_code == 404
+
+
+def test_export_compact(tmp_path, transactions_csv):
+    data_dir, out_dir = tmp_path / 'data', tmp_path / 'out'
+    data_dir.mkdir()
+    shutil.copy(transactions_csv, data_dir / INPUTS['transactions'])
+    kwargs = dict(targets=['일간', '년간'], data_dir=data_dir, out_dir=out_dir,
+                  workers=1)
+
+    build(compact=True, **kwargs)
+    body = (out_dir / '일간.json').read_bytes()
+    assert b'\n' not in body  # 공백 없는 JSON
+    assert gzip.decompress((out_dir / '일간.json.gz').read_bytes()) == body
+    assert brotli.decompress((out_dir / '일간.json.br').read_bytes()) == body
+    assert not (out_dir / '년간.json.gz').exists()  # 작은 출력은 원본만
+    assert build(compact=True, **kwargs)['일간']['status'] == 'fresh'
+
+    (out_dir / '일간.json.br').unlink()
+    assert build(compact=True, **kwargs)['일간']['reason'] == '압축본 없음'
+
+    report = build(**kwargs)
+    assert report['일간']['reason'] == '압축 모드 변경'
+    assert not (out_dir / '일간.json.gz').exists()
+    assert b'\n' in (out_dir / '일간.json').read_bytes()
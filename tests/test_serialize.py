@@ -0,0 +1,159 @@
+"""DataFrame → JSON 직렬화 (py/serialize.py) 테스트"""
+
+import datetime
+import json
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from py import serialize as sz
+
+
+@pytest.fixture(params=['orjson', 'json'])
+def backend(request, monkeypatch):
+    """orjson 경로와 표준 json 경로를 모두 확인"""
+    if request.param == 'orjson':
+        pytest.importorskip('orjson')
+    else:
+        monkeypatch.setattr(sz, 'orjson', None)
+    return request.param
+
+
+@pytest.fixture
+def mixed():
+    """정수 / 실수(NaN, inf) / 문자열(None) / 날짜(NaT) / 범주형 / 불리언 열"""
+    return pd.DataFrame({
+        '시도': ['서울특별시', None, '경기도', '부산광역시'],
+        '거래금액': np.array([52_000, 31_500, 7, -1], dtype='int64'),
+        '층': np.array([3, 12, 1, 25], dtype='int32'),
+        '전용면적': [84.97, np.nan, 59.5 / 3, np.inf],
+        '면적32': np.array([84.97, 1.5, np.nan, 0.1], dtype='float32'),
+        '거래일': pd.to_datetime(['2020-01-01', None, '2020-12-31 13:45:00',
+                               '2021-02-28'], format='ISO8601'),
+        '구분': pd.Categorical(['a', 'b', None, 'a']),
+        '신규': [True, False, True, False],
+        7: ['x', 'y', 'z', 'w'],
+    })
+
+
+def _expected_records(df):
+    """이전 방식: to_dict('records') 후 NaN → None, Timestamp → str"""
+    def clean(value):
+        if value is None or value is pd.NaT:
+            return None
+        if isinstance(value, float) and not math.isfinite(value):
+            return None
+        if isinstance(value, (pd.Timestamp, datetime.date)):
+            return str(value)
+        if isinstance(value, np.generic):
+            return clean(value.item())
+        return value
+
+    return [
+        {str(key): clean(value) for key, value in row.items()}
+        for row in df.to_dict(orient='records')
+    ]
+
+
+def test_records_match_to_dict(backend, mixed):
+    expected = _expected_records(mixed)
+    assert sz.to_records(mixed) == expected
+    assert json.loads(sz.dumps(mixed)) == expected
+    assert json.loads(sz.dumps({'rows': mixed, 'n': 4})) == {
+        'rows': expected, 'n': 4
+    }
+
+
+def test_backends_write_same_bytes(mixed, monkeypatch):
+    pytest.importorskip('orjson')
+    payload = {'b': mixed, 'a': [1.5, None], 'nan': float('nan')}
+    fast = [sz.dumps(payload), sz.dumps(payload, indent=True, sort_keys=True),
+            sz.dumps(payload, orient='columns')]
+    monkeypatch.setattr(sz, 'orjson', None)
+    slow = [sz.dumps(payload), sz.dumps(payload, indent=True, sort_keys=True),
+            sz.dumps(payload, orient='columns')]
+    assert fast == slow
+
+
+def test_dumps_matches_json_text(backend):
+    df = pd.DataFrame({'구분': ['1층', '2층'], '거래금액': [10, 20]})
+    records = df.to_dict(orient='records')
+    kwargs = dict(ensure_ascii=False, separators=(',', ':'))
+    assert sz.dumps(df) == json.dumps(records, **kwargs).encode('utf-8')
+    assert sz.dumps({'층별': df}, sort_keys=True) == json.dumps(
+        {'층별': records}, sort_keys=True, **kwargs
+    ).encode('utf-8')
+
+
+def test_datetime_strings(backend):
+    df = pd.DataFrame({
+        's': pd.to_datetime(['2020-01-01', '2020-01-02 03:04:05'],
+                            format='ISO8601'),
+        'us': pd.to_datetime(['2020-01-01 00:00:00.5', None],
+                             format='ISO8601'),
+        'date': [datetime.date(2020, 1, 1), None],
+    })
+    assert json.loads(sz.dumps(df)) == [
+        {'s': '2020-01-01 00:00:00', 'us': '2020-01-01 00:00:00.500000',
+         'date': '2020-01-01'},
+        {'s': '2020-01-02 03:04:05', 'us': None, 'date': None},
+    ]
+    assert json.loads(sz.dumps({'t': pd.Timestamp('2020-05-01'),
+                                'd': np.datetime64('NaT')})) == {
+        't': '2020-05-01 00:00:00', 'd': None
+    }
+
+
+def test_scalars_and_arrays(backend):
+    payload = {
+        'i': np.int64(3), 'f': np.float32(0.5), 'nan': np.float64('nan'),
+        'b': np.bool_(True), 'arr': np.array([1.0, np.nan]),
+        'grid': np.arange(4).reshape(2, 2), 's': pd.Series([1, None]),
+    }
+    assert json.loads(sz.dumps(payload)) == {
+        'i': 3, 'f': 0.5, 'nan': None, 'b': True, 'arr': [1.0, None],
+        'grid': [[0, 1], [2, 3]], 's': [1.0, None],
+    }
+
+
+def test_empty_frame(backend):
+    assert sz.dumps(pd.DataFrame()) == b'[]'
+    assert json.loads(sz.dumps(pd.DataFrame(columns=['a']),
+                               orient='columns')) == {
+        'columns': ['a'], 'data': {'a': []}
+    }
+
+
+def test_columns_orient(backend, mixed):
+    body = json.loads(sz.dumps({'rows': mixed}, orient='columns'))
+    columns = [str(col) for col in mixed.columns]
+    assert body['rows']['columns'] == columns
+    assert [dict(zip(columns, row)) for row in zip(
+        *(body['rows']['data'][col] for col in columns)
+    )] == _expected_records(mixed)
+    assert sz.to_columns(mixed)['data']['거래금액'] == [52_000, 31_500, 7, -1]
+
+
+@pytest.mark.parametrize('indent', [False, True])
+@pytest.mark.parametrize('sort_keys', [False, True])
+def test_records_written_from_columns(backend, mixed, indent, sort_keys,
+                                      monkeypatch):
+    """행 딕셔너리 없이 쓴 JSON이 to_records 목록을 직렬화한 것과 같음"""
+    odd = pd.DataFrame([[1, 'a', 2.5, True], [3, None, np.nan, 1]],
+                       columns=['b', '100%', 'b', '혼합'])  # 중복 / % 열 이름
+    payload = {'z': mixed, 'odd': odd, 'empty': pd.DataFrame(),
+               'no_cols': pd.DataFrame(index=range(2)), 'n': 1}
+    expected = {key: sz.to_records(value) if isinstance(value, pd.DataFrame)
+                else value for key, value in payload.items()}
+    kwargs = dict(indent=indent, sort_keys=sort_keys)
+    body, frame = sz.dumps(payload, **kwargs), sz.dumps(odd, **kwargs)
+
+    monkeypatch.setattr(sz, 'to_records',
+                        lambda df: pytest.fail('행 딕셔너리를 만듦'))
+    assert sz.dumps(payload, **kwargs) == body
+    assert body == sz.dumps(expected, **kwargs)
+    assert frame == sz.dumps(expected['odd'], **kwargs)
+    assert json.loads(frame) == [{'b': 2.5, '100%': 'a', '혼합': True},
+                                 {'b': None, '100%': None, '혼합': 1}]
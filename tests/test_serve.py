@@ -0,0 +1,55 @@
+"""프리포크 실행(statistical data/serve.py) 준비 단계 테스트"""
+
+import os
+
+import pytest
+
+import serve
+
+from test_app import ENDPOINTS
+
+
+def _bodies(client):
+    return {
+        url: client.get(url, headers={'Accept-Encoding': 'identity'}).data
+        for url in ENDPOINTS
+    }
+
+
+def test_share_layout_keeps_responses(app_module, client, data):
+    expected = _bodies(client)
+
+    shared = app_module.Data(app_module.DATA_FILE, exit_on_error=False)
+    report = shared.share_layout()
+    assert shared.shared
+    assert report['after'] < report['before']
+    assert not any(dtype == object for dtype in shared.df_origin.dtypes)
+    assert shared.df_origin['시도'].dtype == 'category'
+
+    app_module.store.current = shared
+    assert _bodies(client) == expected
+
+
+def test_warm_responses_fills_cache(app_module, data):
+    assert serve.warm_responses(app_module.app) == len(ENDPOINTS)
+    for name in app_module.CACHED_METHODS:
+        assert name in data._responses
+        assert f"{name}:columns" in data._responses
+
+
+def test_reload_keeps_shared_layout(app_module, data):
+    data.share_layout()
+    snapshot = app_module.build_snapshot()
+    assert snapshot.shared
+    assert snapshot.df_origin['시도'].dtype == 'category'
+    # 새 스냅샷은 응답 캐시를 미리 채운 상태로 교체됨
+    assert set(app_module.CACHED_METHODS) <= set(snapshot._responses)
+
+
+@pytest.mark.skipif(not os.path.exists('/proc/self/smaps_rollup'),
+                    reason='/proc/<pid>/smaps_rollup 필요 (Linux)')
+def test_read_memory():
+    memory = serve.read_memory(os.getpid())
+    assert set(memory) == {'rss', 'pss', 'shared', 'private'}
+    assert memory['rss'] > 0
+    assert serve.read_memory(2**22 + 1) is None
@@ -0,0 +1,188 @@
+"""데이터 스냅샷 무중단 교체 (statistical data/snapshot.py) 테스트"""
+
+import os
+import threading
+import time
+
+import pytest
+
+from conftest import write_app_csv
+from snapshot import SnapshotStore
+
+
+def _write(path, text, seconds=0):
+    path.write_text(text)
+    if seconds:
+        st = os.stat(path)
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + seconds * 10**9))
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / 'source.txt'
+    _write(path, '1')
+    return path
+
+
+def _parse_store(source, **kwargs):
+    def factory():
+        text = source.read_text()
+        if not text.isdigit():
+            raise ValueError(f"숫자가 아님: {text}")
+        return {'value': int(text)}
+
+    return SnapshotStore(factory, [source], **kwargs)
+
+
+def test_reload_swaps_on_change(source):
+    store = _parse_store(source)
+    first = store.load()
+    assert store.current is first and store.generation == 1
+    assert store.reload() is False  # 변경 없음
+
+    _write(source, '2', seconds=1)
+    assert store.reload() is True
+    assert store.current == {'value': 2} and store.generation == 2
+    assert first == {'value': 1}  # 이전 스냅샷을 쥔 요청은 그대로 사용
+
+    assert store.reload(force=True) is True
+    assert store.generation == 3
+
+
+def test_failed_reload_keeps_snapshot(source):
+    store = _parse_store(source)
+    first = store.load()
+
+    _write(source, 'broken', seconds=1)
+    assert store.reload() is False
+    assert store.current is first
+    assert store.last_error == 'ValueError: 숫자가 아님: broken'
+    assert store.status()['last_error'] == store.last_error
+
+    # 실패한 파일 상태는 바뀔 때까지 다시 시도하지 않음
+    calls = []
+    factory = store.factory
+    store.factory = lambda: calls.append(1) or factory()
+    assert store.reload() is False
+    assert calls == []
+
+    _write(source, '3', seconds=2)
+    assert store.reload() is True
+    assert store.current == {'value': 3}
+    assert store.last_error is None
+
+
+def test_missing_file_waits(source):
+    store = _parse_store(source)
+    first = store.load()
+    os.remove(source)
+    assert store.reload() is False
+    assert store.current is first and store.last_error is None
+
+
+def test_base_exception_propagates(source):
+    def interrupted():
+        raise KeyboardInterrupt
+
+    store = SnapshotStore(interrupted, [source])
+    with pytest.raises(KeyboardInterrupt):
+        store.reload()
+    assert store.current is None and store.last_error is None
+
+
+def test_watch_thread(source):
+    store = _parse_store(source, interval=0.02)
+    store.load()
+    store.start()
+    try:
+        assert store.status()['watching']
+        _write(source, '5', seconds=1)
+        deadline = time.monotonic() + 5
+        while store.generation < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert store.current == {'value': 5}
+    finally:
+        store.stop()
+    assert not store.status()['watching']
+
+    # 주기가 없으면 감시 스레드를 만들지 않음
+    disabled = _parse_store(source, interval=0)
+    disabled.start()
+    assert not disabled.status()['watching']
+
+
+def test_loads_are_serialized(source):
+    started, release = threading.Event(), threading.Event()
+    building, peak = [], []
+
+    def slow_factory():
+        building.append(1)
+        peak.append(len(building))
+        started.set()
+        release.wait(5)
+        building.pop()
+        return {}
+
+    store = SnapshotStore(slow_factory, [source])
+    thread = threading.Thread(target=store.reload, kwargs={'force': True})
+    thread.start()
+    started.wait(5)
+    other = threading.Thread(target=store.reload, kwargs={'force': True})
+    other.start()
+    time.sleep(0.05)
+    release.set()
+    thread.join()
+    other.join()
+    assert peak == [1, 1]  # 스냅샷은 한 번에 하나만 생성
+    assert store.generation == 2
+
+
+# ============================================
+# app.py 재로드
+# ============================================
+@pytest.fixture
+def app_store(app_module, tmp_path, monkeypatch):
+    """임시 폴더의 데이터 파일을 감시하는 저장소로 app.store를 교체합니다."""
+    monkeypatch.chdir(tmp_path)
+    write_app_csv(tmp_path / app_module.DATA_FILE, rows=500, seed=1)
+    store = SnapshotStore(app_module.build_snapshot, [app_module.DATA_FILE],
+                          interval=0)
+    store.load()
+    monkeypatch.setattr(app_module, 'store', store)
+    return store
+
+
+def test_app_reload(app_module, app_store, tmp_path):
+    client = app_module.app.test_client()
+    before = client.get('/py/층별.json')
+    old = app_store.current
+
+    path = tmp_path / app_module.DATA_FILE
+    write_app_csv(path, rows=600, seed=2)
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    assert app_store.reload() is True
+    # 새 스냅샷은 응답 캐시를 채운 상태로 교체됨
+    assert set(app_module.CACHED_METHODS) <= set(app_store.current._responses)
+
+    after = client.get('/py/층별.json')
+    assert after.headers['ETag'] != before.headers['ETag']
+    expected = app_module.Data(app_module.DATA_FILE, exit_on_error=False)
+    with app_module.app.test_request_context():
+        assert after.data == expected.get_data_floor().data
+    # 이전 스냅샷은 그대로 (진행 중인 요청은 같은 데이터로 끝남)
+    with app_module.app.test_request_context():
+        assert old.get_data_floor().data == before.data
+
+
+def test_app_reload_rejects_bad_file(app_module, app_store, tmp_path):
+    client = app_module.app.test_client()
+    before = client.get('/py/층별.json').data
+
+    path = tmp_path / app_module.DATA_FILE
+    path.write_text('거래일,거래금액\n', encoding='utf-8')
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    assert app_store.reload() is False
+    assert app_store.last_error is not None
+    assert client.get('/py/층별.json').data == before